@@ -1,23 +1,97 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.formparsers import MultiPartParser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from .routers import generate
 
+# Keep typical uploads in memory while parsing; the router copies them to its own
+# scratch dir anyway, so spilling to a temp file first would cost an extra write+read.
+MultiPartParser.max_file_size = 16 * 1024 * 1024
+
 # 👇 Add your allowed frontend origins here
 ALLOWED_ORIGINS = [
     "http://localhost:3000",                 # local testing
     "https://lextriatech.netlify.app",       # your Netlify frontend
 ]
 
+_CORS_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+_CORS_METHOD_SET = frozenset(m.encode("latin-1") for m in _CORS_METHODS)
+_PREFLIGHT_HEADERS = (
+    (b"vary", b"Origin"),
+    (b"access-control-allow-methods", ", ".join(_CORS_METHODS).encode("latin-1")),
+    (b"access-control-max-age", b"600"),
+)
+
+
+class StaticCORSMiddleware:
+    """CORS for a fixed origin allow-list: any method/header, no credentials.
+
+    Behaves like Starlette's CORSMiddleware configured with allow_methods/headers=["*"]
+    and allow_credentials=False, but origins are checked against a frozenset and the
+    preflight headers are built once.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: list) -> None:
+        self.app = app
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = req_method = req_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                req_method = value
+            elif key == b"access-control-request-headers":
+                req_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = origin in self.allow_origins
+
+        if scope["method"] == "OPTIONS" and req_method is not None:
+            headers = list(_PREFLIGHT_HEADERS)
+            failures = []
+            if allowed:
+                headers.append((b"access-control-allow-origin", origin))
+            else:
+                failures.append("origin")
+            if req_method not in _CORS_METHOD_SET:
+                failures.append("method")
+            if req_headers is not None:
+                headers.append((b"access-control-allow-headers", req_headers))
+            body = ("Disallowed CORS " + ", ".join(failures) if failures else "OK").encode("utf-8")
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+            headers.append((b"content-type", b"text/plain; charset=utf-8"))
+            await send({"type": "http.response.start", "status": 400 if failures else 200, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_origin(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"access-control-allow-origin", origin),
+                    (b"vary", b"Origin"),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_origin)
+
+
 app = FastAPI(title="WS Auto-Generator", version="0.1.1")
 
-# 👇 Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=False,   # IMPORTANT (do not set True)
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# 👇 Add CORS middleware (credentials stay disabled)
+app.add_middleware(StaticCORSMiddleware, allow_origins=ALLOWED_ORIGINS)
 
 app.include_router(generate.router)
 
@@ -1,16 +1,109 @@
-import json
+import asyncio
+import functools
 import os
 import re
+import shutil
+import stat
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
-from ..services.pipeline import generate_written_submission
+from ..services.extract import clear_pdf_cache
+from ..services.pipeline import PriorArtEntry, generate_written_submission
 
 router = APIRouter()
+
+_SPOOL_CHUNK_SIZE = 1 << 20
+_D_LABEL_RE = re.compile(r"D\d+")
+_DOCUMENT_EXTS = frozenset({".pdf", ".docx"})
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg"})
+_MAX_DOCUMENT_BYTES = 50 * 1024 * 1024
+_MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+_SCRATCH_ROOT = os.path.join(tempfile.gettempdir(), "ws_scratch")
+
+_BLOB_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _upload_ext(upload: UploadFile, default_name: str) -> str:
+    return Path(upload.filename or default_name).suffix.lower()
+
+
+def _new_scratch_dir() -> str:
+    """Private (0o700) per-request dir; the root is re-created if a tmp cleaner removed it."""
+    try:
+        os.makedirs(_SCRATCH_ROOT, mode=0o700, exist_ok=True)
+        st = os.lstat(_SCRATCH_ROOT)
+    except OSError:
+        return tempfile.mkdtemp()
+    if not stat.S_ISDIR(st.st_mode) or (hasattr(os, "getuid") and st.st_uid != os.getuid()):
+        # The root was pre-created by someone else (or is a symlink): don't nest under it.
+        return tempfile.mkdtemp()
+    if st.st_mode & 0o077:
+        os.chmod(_SCRATCH_ROOT, 0o700)
+    return tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+
+
+def _write_blob(path: str, data: bytes) -> None:
+    """Write a small payload with raw fd calls, skipping the buffered file-object layer."""
+    fd = os.open(path, _BLOB_FLAGS, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _spool_blob(upload: UploadFile, path: str) -> None:
+    """Copy a small upload (images) to disk in one read; blocking, run in an executor."""
+    upload.file.seek(0)
+    _write_blob(path, upload.file.read())
+
+
+def _cleanup(td: str) -> None:
+    """Remove a request's scratch dir and drop the document reads cached from it."""
+    shutil.rmtree(td, ignore_errors=True)
+    clear_pdf_cache()
+
+
+def _check_sizes(documents: List[Optional[UploadFile]], images: List[UploadFile]) -> None:
+    """Reject oversized uploads (413) before anything is copied to the scratch dir."""
+    for uploads, limit, kind in ((documents, _MAX_DOCUMENT_BYTES, "Document"), (images, _MAX_IMAGE_BYTES, "Image")):
+        for up in uploads:
+            if up is not None and up.size and up.size > limit:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"{kind} '{up.filename or 'upload'}' exceeds the {limit // (1024 * 1024)} MB limit.",
+                )
+
+
+def _validate_all(
+    specification: UploadFile,
+    prior_art_pdfs: Optional[List[UploadFile]],
+) -> Tuple[str, List[str]]:
+    """Check document extensions up front; returns (spec_ext, prior_art_exts)."""
+    spec_ext = _upload_ext(specification, "spec.pdf")
+    if spec_ext not in _DOCUMENT_EXTS:
+        raise HTTPException(status_code=422, detail="Specification must be a PDF or DOCX file.")
+    pa_exts = [_upload_ext(f, f"d{idx}.pdf") for idx, f in enumerate(prior_art_pdfs or [], start=1)]
+    for idx, ext in enumerate(pa_exts, start=1):
+        if ext not in _DOCUMENT_EXTS:
+            raise HTTPException(status_code=422, detail=f"Prior-art file #{idx} must be a PDF or DOCX.")
+    return spec_ext, pa_exts
+
+
+def _spool(upload: UploadFile, path: str, chunk_size: int = _SPOOL_CHUNK_SIZE) -> None:
+    """Copy an upload's spooled file to disk in fixed-size chunks (blocking; run in an executor)."""
+    upload.file.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload.file, f, chunk_size)
+
 
 @router.post(
     "/api/generate",
@@ -40,6 +133,11 @@ async def generate(
     amended_claims: Optional[UploadFile] = File(None, description="Amended claims (PDF/DOCX/TXT) (optional)"),
     tech_solution_images: Optional[List[UploadFile]] = File(None, description="Technical solution diagram screenshots (PNG/JPG)"),
 ):
+    _check_sizes(
+        [hn, specification, drawings, amended_claims, *(prior_art_pdfs or ())],
+        [*(tech_solution_images or ()), *(prior_art_diagrams or ())],
+    )
+
     filed_on_value = (filed_on or "").strip()
 
     mode_raw = (prior_art_input_mode or "").strip().lower()
@@ -60,27 +158,27 @@ async def generate(
         if not prior_arts_json:
             raise HTTPException(status_code=422, detail="prior_arts_json is required for text mode.")
         try:
-            parsed = json.loads(prior_arts_json)
-        except json.JSONDecodeError as exc:
+            parsed = orjson.loads(prior_arts_json)
+        except orjson.JSONDecodeError as exc:
             raise HTTPException(status_code=422, detail=f"Invalid prior_arts_json: {exc.msg}") from exc
         if not isinstance(parsed, list) or not parsed:
             raise HTTPException(status_code=422, detail="prior_arts_json must be a non-empty JSON array.")
-        raw_prior_arts = [x for x in parsed if isinstance(x, dict)]
-        if len(raw_prior_arts) != len(parsed):
+        if not all(isinstance(x, dict) for x in parsed):
             raise HTTPException(status_code=422, detail="Each prior-art entry in prior_arts_json must be an object.")
+        raw_prior_arts = parsed
     else:
         if not prior_art_pdfs:
             raise HTTPException(status_code=422, detail="At least one prior-art document (D1-Dn) is required in pdf mode.")
         if prior_arts_meta_json:
             try:
-                parsed_meta = json.loads(prior_arts_meta_json)
-            except json.JSONDecodeError as exc:
+                parsed_meta = orjson.loads(prior_arts_meta_json)
+            except orjson.JSONDecodeError as exc:
                 raise HTTPException(status_code=422, detail=f"Invalid prior_arts_meta_json: {exc.msg}") from exc
             if not isinstance(parsed_meta, list):
                 raise HTTPException(status_code=422, detail="prior_arts_meta_json must be a JSON array.")
-            raw_prior_arts_meta = [x for x in parsed_meta if isinstance(x, dict)]
-            if len(raw_prior_arts_meta) != len(parsed_meta):
+            if not all(isinstance(x, dict) for x in parsed_meta):
                 raise HTTPException(status_code=422, detail="Each prior-art meta entry must be an object.")
+            raw_prior_arts_meta = parsed_meta
             if raw_prior_arts_meta and len(raw_prior_arts_meta) != len(prior_art_pdfs):
                 # Backward compatibility: normalize meta length to number of uploaded files.
                 if len(raw_prior_arts_meta) < len(prior_art_pdfs):
@@ -88,103 +186,70 @@ async def generate(
                 else:
                     raw_prior_arts_meta = raw_prior_arts_meta[: len(prior_art_pdfs)]
 
-    prior_arts_entries: List[Dict[str, Any]] = []
+    spec_ext, pa_exts = _validate_all(specification, prior_art_pdfs if mode == "pdf" else None)
+
+    prior_arts_entries: List[PriorArtEntry] = []
+    if mode == "text":
+        for idx, item in enumerate(raw_prior_arts, start=1):
+            abstract = str(item.get("abstract", "")).strip()
+            if not abstract:
+                # Backward compatibility: older payloads used summary field.
+                abstract = str(item.get("summary", "")).strip()
+            if not abstract:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Prior-art entry #{idx} must include non-empty abstract in text mode.",
+                )
+            label_raw = str(item.get("label", "")).strip().upper()
+            label = label_raw if _D_LABEL_RE.fullmatch(label_raw) else f"D{idx}"
+            prior_arts_entries.append(
+                PriorArtEntry(label=label, abstract=abstract, has_diagram=bool(item.get("has_diagram", False)))
+            )
+
+    td = _new_scratch_dir()
 
-    with tempfile.TemporaryDirectory() as td:
+    try:
         hn_path = os.path.join(td, "hn.pdf")
-        spec_filename = specification.filename or "spec.pdf"
-        spec_ext = Path(spec_filename).suffix.lower()
-        if spec_ext not in {".pdf", ".docx"}:
-            raise HTTPException(status_code=422, detail="Specification must be a PDF or DOCX file.")
         spec_path = os.path.join(td, f"spec{spec_ext}")
 
-        with open(hn_path, "wb") as f:
-            f.write(await hn.read())
-        with open(spec_path, "wb") as f:
-            f.write(await specification.read())
-
-        if mode == "text":
-            for idx, item in enumerate(raw_prior_arts, start=1):
-                abstract = str(item.get("abstract", "")).strip()
-                if not abstract:
-                    # Backward compatibility: older payloads used summary field.
-                    abstract = str(item.get("summary", "")).strip()
-                if not abstract:
-                    raise HTTPException(
-                        status_code=422,
-                        detail=f"Prior-art entry #{idx} must include non-empty abstract in text mode.",
-                    )
-                label_raw = str(item.get("label", "")).strip().upper()
-                label = label_raw if re.fullmatch(r"D\d+", label_raw or "") else f"D{idx}"
-                prior_arts_entries.append(
-                    {
-                        "label": label,
-                        "abstract": abstract,
-                        "has_diagram": bool(item.get("has_diagram", False)),
-                        "diagram_image_path": "",
-                    }
-                )
-        else:
-            for idx, pa_pdf in enumerate(prior_art_pdfs or [], start=1):
-                filename = pa_pdf.filename or f"d{idx}.pdf"
-                ext = Path(filename).suffix.lower()
-                if ext not in {".pdf", ".docx"}:
-                    raise HTTPException(status_code=422, detail=f"Prior-art file #{idx} must be a PDF or DOCX.")
-                out_pdf = os.path.join(td, f"prior_art_{idx}{ext}")
-                with open(out_pdf, "wb") as f:
-                    f.write(await pa_pdf.read())
-
-                label = f"D{idx}"
-                has_diagram = False
-                if raw_prior_arts_meta:
-                    label_raw = str(raw_prior_arts_meta[idx - 1].get("label", "")).strip().upper()
-                    if re.fullmatch(r"D\d+", label_raw or ""):
-                        label = label_raw
-                    has_diagram = bool(raw_prior_arts_meta[idx - 1].get("has_diagram", False))
-
-                prior_arts_entries.append(
-                    {
-                        "label": label,
-                        "prior_art_pdf_path": out_pdf,
-                        "has_diagram": has_diagram,
-                        "diagram_image_path": "",
-                    }
-                )
+        # Uploads are collected here and written concurrently once every check has passed.
+        spools: List[Tuple[UploadFile, str]] = [(hn, hn_path), (specification, spec_path)]
+
+        if mode == "pdf":
+            pa_files = prior_art_pdfs or []
+            pa_meta = raw_prior_arts_meta or [{}] * len(pa_files)
+            pa_paths = [os.path.join(td, f"prior_art_{idx}{ext}") for idx, ext in enumerate(pa_exts, start=1)]
+            pa_labels = [str(m.get("label", "")).strip().upper() for m in pa_meta]
+            pa_labels = [lab if _D_LABEL_RE.fullmatch(lab) else f"D{idx}" for idx, lab in enumerate(pa_labels, start=1)]
+            pa_flags = [bool(m.get("has_diagram", False)) for m in pa_meta]
+            spools.extend(zip(pa_files, pa_paths))
+
+            prior_arts_entries = [
+                PriorArtEntry(label=label, prior_art_pdf_path=path, has_diagram=has_diagram)
+                for label, path, has_diagram in zip(pa_labels, pa_paths, pa_flags)
+            ]
 
         drawings_path = None
         if drawings is not None:
             drawings_path = os.path.join(td, "drawings.pdf")
-            with open(drawings_path, "wb") as f:
-                f.write(await drawings.read())
+            spools.append((drawings, drawings_path))
 
         amended_path = None
 
-        tech_solution_image_paths = []
-        if tech_solution_images:
-            for img in tech_solution_images:
-                filename = img.filename or ""
-                ext = os.path.splitext(filename)[1].lower()
-                if ext not in [".png", ".jpg", ".jpeg"]:
-                    continue
-                out_img = os.path.join(td, f"tech_solution_{len(tech_solution_image_paths)+1}{ext}")
-                with open(out_img, "wb") as f:
-                    f.write(await img.read())
-                tech_solution_image_paths.append(out_img)
+        # Unsupported image types are skipped; kept images are numbered consecutively.
+        tech_images = [(img, ext) for img in tech_solution_images or [] if (ext := _upload_ext(img, "")) in _IMAGE_EXTS]
+        tech_solution_image_paths = [
+            os.path.join(td, f"tech_solution_{idx}{ext}") for idx, (_, ext) in enumerate(tech_images, start=1)
+        ]
+        blobs: List[Tuple[UploadFile, str]] = list(zip((img for img, _ in tech_images), tech_solution_image_paths))
 
-        prior_art_diagram_paths: List[str] = []
-        if prior_art_diagrams:
-            for img in prior_art_diagrams:
-                filename = img.filename or ""
-                ext = os.path.splitext(filename)[1].lower()
-                if ext not in [".png", ".jpg", ".jpeg"]:
-                    continue
-                out_img = os.path.join(td, f"prior_art_diagram_{len(prior_art_diagram_paths)+1}{ext}")
-                with open(out_img, "wb") as f:
-                    f.write(await img.read())
-                prior_art_diagram_paths.append(out_img)
-
-        required_flags = [bool(e.get("has_diagram", False)) for e in prior_arts_entries]
-        required_count = sum(1 for x in required_flags if x)
+        diagram_images = [(img, ext) for img in prior_art_diagrams or [] if (ext := _upload_ext(img, "")) in _IMAGE_EXTS]
+        prior_art_diagram_paths = [
+            os.path.join(td, f"prior_art_diagram_{idx}{ext}") for idx, (_, ext) in enumerate(diagram_images, start=1)
+        ]
+        blobs.extend(zip((img for img, _ in diagram_images), prior_art_diagram_paths))
+
+        required_count = sum(e.has_diagram for e in prior_arts_entries)
 
         if required_count > 0:
             if len(prior_art_diagram_paths) < required_count:
@@ -192,11 +257,10 @@ async def generate(
                     status_code=422,
                     detail="Some prior arts were marked with diagram required, but fewer diagram images were uploaded.",
                 )
-            cursor = 0
+            diagram_iter = iter(prior_art_diagram_paths)
             for entry in prior_arts_entries:
-                if bool(entry.get("has_diagram", False)):
-                    entry["diagram_image_path"] = prior_art_diagram_paths[cursor]
-                    cursor += 1
+                if entry.has_diagram:
+                    entry.diagram_image_path = next(diagram_iter)
         else:
             # If none explicitly marked, map diagrams in D-order up to available count.
             if len(prior_art_diagram_paths) > len(prior_arts_entries):
@@ -204,34 +268,51 @@ async def generate(
                     status_code=422,
                     detail="More prior-art diagram images were uploaded than prior-art entries.",
                 )
-            for idx, entry in enumerate(prior_arts_entries):
-                if idx < len(prior_art_diagram_paths):
-                    entry["diagram_image_path"] = prior_art_diagram_paths[idx]
+            for entry, path in zip(prior_arts_entries, prior_art_diagram_paths):
+                entry.diagram_image_path = path
 
         if amended_claims is not None:
             # Keep the original extension if possible to help parsers
-            filename = amended_claims.filename or "amended.bin"
-            ext = os.path.splitext(filename)[1].lower() or ".bin"
-            amended_path = os.path.join(td, f"amended{ext}")
-            with open(amended_path, "wb") as f:
-                f.write(await amended_claims.read())
+            amended_path = os.path.join(td, f"amended{_upload_ext(amended_claims, 'amended.bin') or '.bin'}")
+            spools.append((amended_claims, amended_path))
 
+        loop = asyncio.get_running_loop()
+        # Let every write settle before surfacing a failure, so cleanup never races an in-flight copy.
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, _spool, up, path) for up, path in spools),
+            *(loop.run_in_executor(None, _spool_blob, up, path) for up, path in blobs),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Generation is CPU/IO bound and synchronous; keep it off the event loop.
         try:
-            out_path, out_name = generate_written_submission(
-                hn_path=hn_path,
-                specification_path=spec_path,
-                prior_arts_entries=prior_arts_entries,
-                drawings_path=drawings_path,
-                amended_claims_path=amended_path,
-                tech_solution_images_paths=tech_solution_image_paths,
-                city=city,
-                filed_on_input=filed_on_value,
+            out_path, out_name = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    generate_written_submission,
+                    hn_path=hn_path,
+                    specification_path=spec_path,
+                    prior_arts_entries=prior_arts_entries,
+                    drawings_path=drawings_path,
+                    amended_claims_path=amended_path,
+                    tech_solution_images_paths=tech_solution_image_paths,
+                    city=city,
+                    filed_on_input=filed_on_value,
+                    out_dir=td,
+                ),
             )
         except ValueError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except BaseException:
+        _cleanup(td)
+        raise
 
-        return FileResponse(
-            out_path,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=out_name,
-        )
+    return FileResponse(
+        out_path,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        filename=out_name,
+        background=BackgroundTask(_cleanup, td),
+    )
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice, repeat
+import io
 import json
+import multiprocessing
 import os
 import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Set, Tuple, Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
 from urllib.request import urlopen
@@ -18,6 +25,21 @@ try:
 except Exception:  # pragma: no cover
     Document = None
 
+try:
+    import pypdfium2 as pdfium  # type: ignore
+except Exception:  # pragma: no cover
+    pdfium = None
+
+# Plain-text PDF backend: "plumber" (default) or "pdfium" (much faster, no layout engine).
+PDF_BACKEND = os.getenv("PDF_BACKEND", "plumber").strip().lower()
+
+# pdfplumber extraction is CPU-bound; long PDFs are split across worker processes.
+_PDF_WORKERS = max(1, int(os.getenv("PDF_WORKERS", "0") or 0) or min(os.cpu_count() or 1, 8))
+_PARALLEL_PAGE_THRESHOLD = 4
+_PAGES_PER_TASK = 4
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
 
 @dataclass
 class PriorArt:
@@ -46,38 +68,64 @@ class CaseMeta:
     d2_disclosure: str = ""
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+def _any_of(*patterns: re.Pattern, flags: int = 0) -> re.Pattern:
+    """Fuse several patterns into one alternation so a line is scanned once."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), flags)
+
+
+_PAGE_MARKER_RE = _any_of(
+    re.compile(r"[-\u2013\u2014]?\s*\d{1,4}\s*[-\u2013\u2014]?"),
+    re.compile(r"\d+\s*/\s*\d+"),
+    re.compile(r"(?:p|pg|page)\.?\s*\d+\s*/\s*\d+"),
+    re.compile(r"page\s*\d+(?:\s*of\s*\d+)?"),
+)
+
+
+# Pure per-line helpers; IPO boilerplate repeats on every page, so memoize them.
+_LINE_CACHE_SIZE = 16384
+# Whole-document reads, keyed by path and mtime; the same PDF is read several times per request.
+# Every request gets a fresh scratch dir, so entries never hit across requests: the router
+# calls clear_pdf_cache() once a request finishes rather than keeping client text around.
+_PDF_CACHE_SIZE = 64
+# Spec parsers are pure in the spec text, which previews and retries hand over again.
+_SPEC_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
 def _normalize_pdf_line(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip().lower()
+    return _clean(s).lower()
 
 
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
 def _line_is_page_marker(s: str) -> bool:
     x = _normalize_pdf_line(s)
     if not x:
         return True
-    if re.fullmatch(r"[-\u2013\u2014]?\s*\d{1,4}\s*[-\u2013\u2014]?", x):
-        return True
-    if re.fullmatch(r"\d+\s*/\s*\d+", x):
-        return True
-    if re.fullmatch(r"(?:p|pg|page)\.?\s*\d+\s*/\s*\d+", x):
-        return True
-    if re.fullmatch(r"page\s*\d+(\s*of\s*\d+)?", x):
-        return True
-    return False
+    return _PAGE_MARKER_RE.fullmatch(x) is not None
 
 
 def _non_ascii_ratio(s: str) -> float:
-    if not s:
+    if not s or s.isascii():
         return 0.0
-    non_ascii = sum(1 for ch in s if ord(ch) > 127)
+    non_ascii = len(s) - len(s.encode("ascii", "ignore"))
     return non_ascii / max(1, len(s))
 
 
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2}:\d{2})\s*(?:HRS|IST|AM|PM)?\s*(?:to|\-|–|—)\s*(\d{1,2}:\d{2})",
+    re.I,
+)
+_DURATION_FOR_RE = re.compile(r"\bfor\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", re.I)
+_DURATION_OF_RE = re.compile(
+    r"\bduration\s*(?:of)?\s*[:\-]?\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", re.I
+)
+
+
 def _duration_from_time_range(text: str) -> str:
-    m = re.search(
-        r"(\d{1,2}:\d{2})\s*(?:HRS|IST|AM|PM)?\s*(?:to|\-|–|—)\s*(\d{1,2}:\d{2})",
-        text or "",
-        re.I,
-    )
+    m = _TIME_RANGE_RE.search(text or "")
     if not m:
         return ""
     try:
@@ -100,103 +148,136 @@ def _duration_from_time_range(text: str) -> str:
 
 def _duration_from_phrase(text: str) -> str:
     txt = text or ""
-    m = re.search(r"\bfor\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", txt, re.I)
+    m = _DURATION_FOR_RE.search(txt)
     if m:
         return _clean(m.group(1))
-    m = re.search(r"\bduration\s*(?:of)?\s*[:\-]?\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", txt, re.I)
+    m = _DURATION_OF_RE.search(txt)
     if m:
         return _clean(m.group(1))
     return ""
 
 
+_ANY_DATE_RE = re.compile(r"\d{1,2}[./-]\d{1,2}[./-]\d{2,4}")
+_DATE_ONLY_LINE_RE = re.compile(r"(?:date\s*[:\-]?\s*)?\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", re.I)
+_DATE_CONTEXT_RE = re.compile(r"\b(date|dated|dispatch|hearing|email)\b", re.I)
+_EDGE_NOISE_RE = re.compile(
+    r"\bpatent\s+agent\b"
+    r"|\boffice\s+of\s+the\s+controller\s+general\b"
+    r"|\bintellectual\s+property\s+india\b",
+    re.I,
+)
+
+
 def _keep_even_if_repeated(norm_line: str) -> bool:
     if not norm_line:
         return False
-    has_date = bool(re.search(r"\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", norm_line))
+    has_date = bool(_ANY_DATE_RE.search(norm_line))
     if not has_date:
         return False
-    if re.fullmatch(r"(?:date\s*[:\-]?\s*)?\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", norm_line, re.I):
+    if _DATE_ONLY_LINE_RE.fullmatch(norm_line):
         return True
-    return bool(re.search(r"\b(date|dated|dispatch|hearing|email)\b", norm_line, re.I))
+    return bool(_DATE_CONTEXT_RE.search(norm_line))
 
 
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
 def _line_is_edge_header_footer_noise(s: str) -> bool:
     x = _normalize_pdf_line(s)
     if not x or len(x) > 140:
         return False
-    return bool(
-        re.search(r"\bpatent\s+agent\b", x, re.I)
-        or re.search(r"\boffice\s+of\s+the\s+controller\s+general\b", x, re.I)
-        or re.search(r"\bintellectual\s+property\s+india\b", x, re.I)
-    )
+    return _EDGE_NOISE_RE.search(x) is not None
 
 
-def read_pdf_text(path: str) -> str:
-    pages_lines: List[List[str]] = []
+def _clear_line_caches() -> None:
+    _normalize_pdf_line.cache_clear()
+    _line_is_page_marker.cache_clear()
+    _line_is_edge_header_footer_noise.cache_clear()
+    _is_prior_art_metadata_line.cache_clear()
+    _looks_like_prior_art_heading.cache_clear()
+
+
+def _plumber_page_text(page, layout: bool) -> str:
+    if layout:
+        return page.extract_text(layout=True) or page.extract_text() or ""
+    return page.extract_text() or ""
+
+
+def _extract_page_range(path: str, start: int, stop: int, layout: bool) -> List[str]:
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            t = page.extract_text() or ""
-            lines = [ln.strip() for ln in t.splitlines() if ln and ln.strip()]
-            pages_lines.append(lines)
+        return [_plumber_page_text(page, layout) for page in pdf.pages[start:stop]]
 
-    if not pages_lines:
-        return ""
 
-    # Remove repeated header/footer lines appearing on most pages.
-    norm_page_counts: Counter[str] = Counter()
-    for lines in pages_lines:
-        seen = { _normalize_pdf_line(ln) for ln in lines if _normalize_pdf_line(ln) }
-        for n in seen:
-            norm_page_counts[n] += 1
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # spawn, not fork: the API calls this from worker threads.
+            _page_pool = ProcessPoolExecutor(
+                max_workers=_PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _page_pool
 
-    repeated_threshold = max(2, int(len(pages_lines) * 0.6))
-    repeated_lines = {
-        n
-        for n, cnt in norm_page_counts.items()
-        if cnt >= repeated_threshold and len(n) <= 180
-    }
 
-    cleaned_pages: List[str] = []
-    for lines in pages_lines:
-        cleaned: List[str] = []
-        total = len(lines)
-        for idx, ln in enumerate(lines):
-            n = _normalize_pdf_line(ln)
-            if not n:
-                continue
-            if n in repeated_lines and not _keep_even_if_repeated(n):
-                continue
-            if (idx <= 2 or idx >= total - 3) and _line_is_edge_header_footer_noise(ln):
-                continue
-            if _line_is_page_marker(ln):
-                continue
-            if "(cid:" in ln.lower():
-                continue
-            if _non_ascii_ratio(ln) > 0.45 and len(ln) > 8:
-                continue
-            cleaned.append(ln)
-        cleaned_pages.append("\n".join(cleaned))
+def _discard_page_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next long read spawns a fresh one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
 
-    return "\n".join([p for p in cleaned_pages if p.strip()])
 
+def _extract_page_texts(path: str, layout: bool = False) -> Iterator[str]:
+    """Text of every page, in order; plain reads honour PDF_BACKEND.
 
-def read_pdf_text_preserve_layout(path: str) -> str:
-    """Read PDF text while preserving in-line spacing/indentation for claim blocks."""
-    pages_lines: List[List[str]] = []
+    Pages are yielded one at a time so a long document's raw text is never
+    held in full alongside the cleaned lines.
+    """
+    if not layout and PDF_BACKEND == "pdfium" and pdfium is not None:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            for i in range(len(pdf)):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range() or ""
+                textpage.close()
+                page.close()
+                yield text
+        finally:
+            pdf.close()
+        return
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            t = page.extract_text(layout=True) or page.extract_text() or ""
-            lines = [ln.rstrip("\r") for ln in t.splitlines() if ln and ln.strip()]
-            pages_lines.append(lines)
+        n_pages = len(pdf.pages)
+        if n_pages <= _PARALLEL_PAGE_THRESHOLD or _PDF_WORKERS < 2:
+            for page in pdf.pages:
+                text = _plumber_page_text(page, layout)
+                page.close()  # drop the page's cached layout objects
+                yield text
+            return
+
+    starts = range(0, n_pages, _PAGES_PER_TASK)
+    stops = [min(s + _PAGES_PER_TASK, n_pages) for s in starts]
+    done = 0
+    pool = _get_page_pool()
+    try:
+        for chunk in pool.map(_extract_page_range, repeat(path), starts, stops, repeat(layout)):
+            yield from chunk
+            done += len(chunk)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed): replace the pool and read the remaining pages serially.
+        _discard_page_pool(pool)
+        yield from _extract_page_range(path, done, n_pages, layout)
 
+
+def _clean_pages(pages_lines: List[List[Tuple[str, str]]]) -> List[str]:
+    """Drop running headers/footers, page markers and glyph noise from (raw, normalized) page lines."""
     if not pages_lines:
-        return ""
+        return []
 
+    # Remove repeated header/footer lines appearing on most pages.
     norm_page_counts: Counter[str] = Counter()
     for lines in pages_lines:
-        seen = {_normalize_pdf_line(ln) for ln in lines if _normalize_pdf_line(ln)}
-        for n in seen:
-            norm_page_counts[n] += 1
+        norm_page_counts.update({n for _, n in lines})
 
     repeated_threshold = max(2, int(len(pages_lines) * 0.6))
     repeated_lines = {
@@ -205,14 +286,10 @@ def read_pdf_text_preserve_layout(path: str) -> str:
         if cnt >= repeated_threshold and len(n) <= 180
     }
 
-    cleaned_pages: List[str] = []
+    cleaned: List[str] = []
     for lines in pages_lines:
-        cleaned: List[str] = []
         total = len(lines)
-        for idx, ln in enumerate(lines):
-            n = _normalize_pdf_line(ln)
-            if not n:
-                continue
+        for idx, (ln, n) in enumerate(lines):
             if n in repeated_lines and not _keep_even_if_repeated(n):
                 continue
             if (idx <= 2 or idx >= total - 3) and _line_is_edge_header_footer_noise(ln):
@@ -224,27 +301,66 @@ def read_pdf_text_preserve_layout(path: str) -> str:
             if _non_ascii_ratio(ln) > 0.45 and len(ln) > 8:
                 continue
             cleaned.append(ln.rstrip())
-        cleaned_pages.append("\n".join(cleaned))
 
-    return "\n".join([p for p in cleaned_pages if p.strip()])
+    return cleaned
+
+
+def _read_pdf_lines(path: str, layout: bool = False) -> List[str]:
+    _clear_line_caches()
+    # Each line is carried as (raw, normalized) so normalization runs once per line.
+    pages_lines: List[List[Tuple[str, str]]] = []
+    for t in _extract_page_texts(path, layout=layout):
+        if layout:
+            raw = (ln.rstrip("\r") for ln in t.splitlines() if ln and ln.strip())
+        else:
+            raw = (s for s in (ln.strip() for ln in t.splitlines()) if s)
+        pages_lines.append([(s, _normalize_pdf_line(s)) for s in raw])
+    return _clean_pages(pages_lines)
+
+
+@lru_cache(maxsize=_PDF_CACHE_SIZE)
+def _read_pdf_cached(path: str, mtime_ns: int, size: int, layout: bool) -> Tuple[str, ...]:
+    # mtime_ns/size are only part of the key: rewriting the file invalidates its entry,
+    # even when the rewrite lands within the filesystem's timestamp granularity.
+    return tuple(_read_pdf_lines(path, layout))
+
 
+def _read_pdf(path: str, layout: bool = False) -> Tuple[str, ...]:
+    st = os.stat(path)
+    return _read_pdf_cached(path, st.st_mtime_ns, st.st_size, layout)
 
-def _iter_docx_table_paragraphs(table) -> List[object]:
-    out: List[object] = []
+
+def clear_pdf_cache() -> None:
+    """Forget every cached document read (call once a request's files are gone)."""
+    _read_pdf_cached.cache_clear()
+
+
+def read_pdf_text_lines(path: str) -> List[str]:
+    """Cleaned, stripped, non-empty lines of the PDF, in reading order."""
+    return list(_read_pdf(path))
+
+
+def read_pdf_text(path: str) -> str:
+    return "\n".join(_read_pdf(path))
+
+
+def read_pdf_text_preserve_layout(path: str) -> str:
+    """Read PDF text while preserving in-line spacing/indentation for claim blocks."""
+    return "\n".join(_read_pdf(path, layout=True))
+
+
+def _iter_docx_table_paragraphs(table) -> Iterator[object]:
     for row in table.rows:
         for cell in row.cells:
-            for p in cell.paragraphs:
-                out.append(p)
+            yield from cell.paragraphs
             for nested in cell.tables:
-                out.extend(_iter_docx_table_paragraphs(nested))
-    return out
+                yield from _iter_docx_table_paragraphs(nested)
 
 
-def _iter_docx_paragraphs(doc) -> List[object]:
-    out: List[object] = list(doc.paragraphs)
+def _iter_docx_paragraphs(doc) -> Iterator[object]:
+    yield from doc.paragraphs
     for table in doc.tables:
-        out.extend(_iter_docx_table_paragraphs(table))
-    return out
+        yield from _iter_docx_table_paragraphs(table)
 
 
 def _is_numbered_list_paragraph(paragraph) -> bool:
@@ -268,35 +384,41 @@ def _is_numbered_list_paragraph(paragraph) -> bool:
     return False
 
 
+_EXPLICIT_NUMBER_RE = re.compile(r"^\s*(\d+)[\.\):]\s*")
+
+
 def read_docx_text(path: str) -> str:
     if Document is None:
         return ""
     doc = Document(path)
-    parts: List[str] = []
+    buf = io.StringIO()
+    write = buf.write
+    sep = ""
     auto_num = 1
 
     for p in _iter_docx_paragraphs(doc):
         txt = (p.text or "").strip()
         if not txt:
             continue
+        write(sep)
+        sep = "\n"
 
         # Preserve explicit numbering if already present.
-        if re.match(r"^\s*\d+[\.\):]\s*", txt):
-            parts.append(txt)
-            m_no = re.match(r"^\s*(\d+)[\.\):]\s*", txt)
-            if m_no:
-                auto_num = max(auto_num, int(m_no.group(1)) + 1)
+        m_no = _EXPLICIT_NUMBER_RE.match(txt)
+        if m_no:
+            write(txt)
+            auto_num = max(auto_num, int(m_no.group(1)) + 1)
             continue
 
         # Recover invisible Word auto-numbering metadata into plain text.
         if _is_numbered_list_paragraph(p):
-            parts.append(f"{auto_num}. {txt}")
+            write(f"{auto_num}. {txt}")
             auto_num += 1
             continue
 
-        parts.append(txt)
+        write(txt)
 
-    return "\n".join(parts)
+    return buf.getvalue()
 
 
 def read_text_any(path: str) -> str:
@@ -312,7 +434,7 @@ def read_text_any(path: str) -> str:
 
 
 def _clean(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return " ".join((s or "").split())
 
 
 _PRIOR_ART_ABSTRACT_HEADINGS = [
@@ -362,18 +484,134 @@ _PRIOR_ART_STOP_HEADINGS = [
 
 _TRANSLATE_TIMEOUT_S = 8
 _TRANSLATE_MAX_CHARS = 2800
+_TRANSLATE_WORKERS = 8
 _PRIOR_ART_MAX_ABSTRACT_WORDS = 900
 
+_ABSTRACT_MARKER_RE = re.compile(r"\babstract\b|^\s*\[?\s*57\s*\]?\s*abstract\b", re.I)
+_NUMERIC_JUNK_RE = re.compile(r"[0-9\W_]+")
+_DOCNO_TOKEN_RE = re.compile(r"[a-z]?\d{2,}[a-z0-9/\-]*")
+_BIBLIO_FIELD_RE = re.compile(
+    r"\b(publication|applicant|inventor|priority|filing|date|int\s*\.?\s*cl|u\s*\.?\s*s\s*\.?\s*c[il]|ipc|cpc|attorney|agent|pat\s*\.?\s*no)\b"
+)
+_RELATED_APPLICATION_RE = re.compile(
+    r"\b(?:related\s+u\.?\s*s\.?\s+application\s+data|continuation\s+of\s+application|application\s+no)\b"
+)
+_US_PUBLICATION_NO_RE = re.compile(r"\bus\s+\d{4}\s*/\s*\d{4,}\s*[ab]\d?\b")
+_LATIN_LETTER_RE = re.compile(r"[A-Za-z\u00C0-\u024F]")
+_LATIN_WORD_RE = re.compile(r"[A-Za-z0-9\u00C0-\u024F]+")
+_PARA_BREAK_RE = re.compile(r"\n{2,}")
+_HYPHEN_WRAP_RE = re.compile(r"-\s*\n\s*")
+_LINE_WRAP_RE = re.compile(r"\s*\n\s*")
+_LONE_NUMBER_LINE_RE = re.compile(r"(?m)^\s*\d{1,3}\s*$")
+_LEADING_LINE_NUMBER_RE = re.compile(r"(?m)^\s*\d{1,3}\s+(?=[A-Za-z\[\(])")
+_INLINE_LINE_NUMBER_RE = re.compile(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:])")
+_SPACE_AFTER_OPEN_PAREN_RE = re.compile(r"\(\s+")
+_SPACE_BEFORE_CLOSE_PAREN_RE = re.compile(r"\s+\)")
+_URL_RE = re.compile(r"\b(?:https?://|www\.)\S+")
+_PATENT_SITE_RE = re.compile(r"\b(?:google\s+patents|patentscope|espacenet|patent\s+images|lens\.org|wipo)\b")
+_COPYRIGHT_RE = re.compile(r"\b(?:copyright|all rights reserved)\b")
+_DATED_LINE_RE = re.compile(r"(?:date\s*[:\-]\s*)?\d{1,2}[./-]\d{1,2}[./-]\d{2,4}")
+_PAGE_OF_RE = re.compile(r"(?:page|pg)\s*\d+\s*(?:of|/)\s*\d+")
+_CLASSIFICATION_HEAD_RE = re.compile(
+    r"\b(?:u\s*\.?\s*s\s*\.?\s*c[il]\s*\.?|int\s*\.?\s*cl\s*\.?|cpc|ipc|field\s+of\s+classification\s+search)\b"
+)
+_RELATED_US_DATA_RE = re.compile(r"\brelated\s+u\.?\s*s\.?\s+application\s+data\b")
+_PAT_NO_RE = re.compile(r"\bpat\s*\.?\s*no\s*\.?")
+_CLASSIFICATION_VERSION_RE = re.compile(r"\(?\s*\d{2,4}\s*[./]\s*\d{2,4}\s*\)?")
+_CLASSIFICATION_INDEX_RE = re.compile(r"\(?\s*\d+\s+\d{2,4}\.\d+\s*\)?")
+_IPC_SYMBOL_RE = re.compile(r"[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?")
+_IPC_SYMBOL_PAREN_RE = re.compile(r"\(?\s*[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?\s*\)?")
+_IPC_SYMBOL_WORD_RE = re.compile(r"\b[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?\b")
+_SHEET_OF_RE = re.compile(r"\bsheet\s+\d+\s+of\s+\d+\b")
+_CONTINUED_RE = re.compile(r"\(?\s*continued\s*\)?")
+# Combined scans for the prior-art noise filters: one fullmatch + one search per line.
+_PRIOR_ART_NOISE_FULL_RE = _any_of(
+    _PAGE_MARKER_RE,
+    _DATED_LINE_RE,
+    _PAGE_OF_RE,
+    _CLASSIFICATION_VERSION_RE,
+    _CLASSIFICATION_INDEX_RE,
+    _IPC_SYMBOL_RE,
+    _IPC_SYMBOL_PAREN_RE,
+)
+_PRIOR_ART_NOISE_SEARCH_RE = _any_of(
+    _URL_RE,
+    _PATENT_SITE_RE,
+    _COPYRIGHT_RE,
+    _CLASSIFICATION_HEAD_RE,
+    _RELATED_US_DATA_RE,
+    _US_PUBLICATION_NO_RE,
+    _PAT_NO_RE,
+    _SHEET_OF_RE,
+    _CONTINUED_RE,
+)
+_CLASSIFICATION_NOISE_FULL_RE = _any_of(
+    _CLASSIFICATION_VERSION_RE,
+    _CLASSIFICATION_INDEX_RE,
+    _IPC_SYMBOL_PAREN_RE,
+)
+_CLASSIFICATION_NOISE_SEARCH_RE = _any_of(
+    _CLASSIFICATION_HEAD_RE,
+    _RELATED_US_DATA_RE,
+    _US_PUBLICATION_NO_RE,
+    _PAT_NO_RE,
+    _CONTINUED_RE,
+    _IPC_SYMBOL_WORD_RE,
+)
+_ENGLISH_HINT_RE = re.compile(r"\b(the|and|of|to|for|with|method|system|apparatus|device|invention)\b", re.I)
+_CJK_CHAR_RE = re.compile(r"[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]")
+# Letters whose lower() falls in a-z: ASCII plus U+0130 (İ) and U+212A (Kelvin sign).
+_LATIN_ALPHA_RE = re.compile(r"[A-Za-z\u0130\u212a]")
+_ABSTRACT_57_RE = re.compile(r"^\[?\s*57\s*\]?\s*abstract\b")
+_ABSTRACT_57_INLINE_RE = re.compile(r"^\[?\s*57\s*\]?\s*abstract\b\s*[:\-]?\s*(.*)$", re.I)
+_ABSTRACT_57_ONLY_RE = re.compile(r"^\[?\s*57\s*\]?\s*abstract\b\s*:?\s*$")
+_ABSTRACT_HEADING_RES = [
+    re.compile(rf"^\s*{re.escape(h.lower())}\b\s*[:\-]?\s*(.*)$", re.I) for h in _PRIOR_ART_ABSTRACT_HEADINGS
+]
+_ABSTRACT_CUE_RE = re.compile(
+    r"\b(the present invention|discloses|relates to|provides|method|apparatus|system|device|implemented)\b", re.I
+)
+_CLAIM_WORD_RE = re.compile(r"\bclaim[s]?\b", re.I)
+_DIGIT_DROP = str.maketrans("", "", "0123456789")
+
+
+def _drop_margin_line_number(m: re.Match) -> str:
+    try:
+        n = int(m.group(1))
+    except Exception:
+        return m.group(0)
+    # Typical PDF margin line numbers are low range and often step-wise.
+    if 1 <= n <= 400 and n % 5 == 0:
+        return " "
+    return m.group(0)
+
+
+_ANY_DIGIT_RE = re.compile(r"\d")
+
+
+def _strip_margin_line_numbers(s: str) -> str:
+    # All three patterns need a digit, and most prose paragraphs have none.
+    if not _ANY_DIGIT_RE.search(s):
+        return s
+    s = _LONE_NUMBER_LINE_RE.sub("", s)
+    s = _LEADING_LINE_NUMBER_RE.sub("", s)
+    return _INLINE_LINE_NUMBER_RE.sub(_drop_margin_line_number, s)
+
 
 def _read_prior_art_pdf_lines(path: str, max_pages: int = 5) -> List[str]:
     pages_lines: List[List[str]] = []
     try:
         with pdfplumber.open(path) as pdf:
+            # Scanned (image-only) documents have no text layer to find; skip
+            # parsing the remaining pages and let the caller fall back.
+            if pdf.pages and not pdf.pages[0].chars and pdf.pages[0].images:
+                return []
             for page in pdf.pages[: max(1, max_pages)]:
                 t = page.extract_text(layout=True) or page.extract_text() or ""
                 page_lines: List[str] = []
                 for raw in t.splitlines():
-                    line = re.sub(r"\s+", " ", (raw or "").strip())
+                    line = _clean(raw)
                     if not line:
                         page_lines.append("")
                         continue
@@ -413,7 +651,7 @@ def _read_prior_art_pdf_lines(path: str, max_pages: int = 5) -> List[str]:
                 prev_blank = True
                 continue
             n = _normalize_pdf_line(ln)
-            if n in repeated_lines and not re.search(r"\babstract\b|^\s*\[?\s*57\s*\]?\s*abstract\b", n, re.I):
+            if n in repeated_lines and not _ABSTRACT_MARKER_RE.search(n):
                 continue
             if _is_prior_art_header_footer_noise(ln):
                 continue
@@ -422,41 +660,40 @@ def _read_prior_art_pdf_lines(path: str, max_pages: int = 5) -> List[str]:
     return out
 
 
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
 def _is_prior_art_metadata_line(line: str) -> bool:
     x = _clean(line)
     if not x:
         return True
     low = x.lower()
-    if re.fullmatch(r"[0-9\W_]+", x):
+    if _NUMERIC_JUNK_RE.fullmatch(x):
         return True
-    if re.fullmatch(r"[a-z]?\d{2,}[a-z0-9/\-]*", low):
+    if _DOCNO_TOKEN_RE.fullmatch(low):
         return True
-    if re.search(
-        r"\b(publication|applicant|inventor|priority|filing|date|int\s*\.?\s*cl|u\s*\.?\s*s\s*\.?\s*c[il]|ipc|cpc|attorney|agent|pat\s*\.?\s*no)\b",
-        low,
-    ):
+    if _BIBLIO_FIELD_RE.search(low):
         return True
-    if re.search(r"\b(?:related\s+u\.?\s*s\.?\s+application\s+data|continuation\s+of\s+application|application\s+no)\b", low):
+    if _RELATED_APPLICATION_RE.search(low):
         return True
-    if re.search(r"\bus\s+\d{4}\s*/\s*\d{4,}\s*[ab]\d?\b", low):
+    if _US_PUBLICATION_NO_RE.search(low):
         return True
     return False
 
 
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
 def _looks_like_prior_art_heading(line: str) -> bool:
     x = _clean(line)
     if not x:
         return False
     if len(x) > 140:
         return False
-    if not re.search(r"[A-Za-z\u00C0-\u024F]", x):
+    if not _LATIN_LETTER_RE.search(x):
         return False
     low = x.lower().rstrip(":")
     if any(h in low for h in _PRIOR_ART_STOP_HEADINGS):
         return True
     if x.endswith(":"):
         return True
-    words = re.findall(r"[A-Za-z0-9\u00C0-\u024F]+", x)
+    words = _LATIN_WORD_RE.findall(x)
     if not words:
         return False
     upper_words = sum(1 for w in words if w.upper() == w and len(w) > 1)
@@ -479,28 +716,15 @@ def _clean_prior_art_abstract_text(s: str) -> str:
         prev_blank = False
 
     txt = "\n".join(out).strip()
-    paras = [p for p in re.split(r"\n{2,}", txt) if p and p.strip()]
+    paras = [p for p in _PARA_BREAK_RE.split(txt) if p and p.strip()]
     cleaned_paras: List[str] = []
     for p in paras:
-        q = re.sub(r"-\s*\n\s*", "", p)
-        q = re.sub(r"\s*\n\s*", " ", q)
-        q = re.sub(r"(?m)^\s*\d{1,3}\s*$", "", q)
-        q = re.sub(r"(?m)^\s*\d{1,3}\s+(?=[A-Za-z\[\(])", "", q)
-
-        def _inline_num_repl(m: re.Match) -> str:
-            try:
-                n = int(m.group(1))
-            except Exception:
-                return m.group(0)
-            # Typical PDF margin line numbers are low range and often step-wise.
-            if 1 <= n <= 400 and n % 5 == 0:
-                return " "
-            return m.group(0)
-
-        q = re.sub(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])", _inline_num_repl, q)
-        q = re.sub(r"\s+([,.;:])", r"\1", q)
-        q = re.sub(r"\(\s+", "(", q)
-        q = re.sub(r"\s+\)", ")", q)
+        q = _HYPHEN_WRAP_RE.sub("", p)
+        q = _LINE_WRAP_RE.sub(" ", q)
+        q = _strip_margin_line_numbers(q)
+        q = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", q)
+        q = _SPACE_AFTER_OPEN_PAREN_RE.sub("(", q)
+        q = _SPACE_BEFORE_CLOSE_PAREN_RE.sub(")", q)
         q = _clean(q)
         if q:
             cleaned_paras.append(q)
@@ -514,66 +738,21 @@ def _is_prior_art_header_footer_noise(line: str) -> bool:
     low = _normalize_pdf_line(x)
     if not low:
         return True
-    if _line_is_page_marker(x):
-        return True
     if _line_is_edge_header_footer_noise(x):
         return True
-    if re.search(r"\b(?:https?://|www\.)\S+", low):
-        return True
-    if re.search(r"\b(?:google\s+patents|patentscope|espacenet|patent\s+images|lens\.org|wipo)\b", low):
-        return True
-    if re.search(r"\b(?:copyright|all rights reserved)\b", low):
-        return True
-    if re.fullmatch(r"(?:date\s*[:\-]\s*)?\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-        return True
-    if re.fullmatch(r"(?:page|pg)\s*\d+\s*(?:of|/)\s*\d+", low):
+    # Page markers are matched on the same normalized text via the combined pattern.
+    if _PRIOR_ART_NOISE_FULL_RE.fullmatch(low):
         return True
-    if re.search(r"\b(?:u\s*\.?\s*s\s*\.?\s*c[il]\s*\.?|int\s*\.?\s*cl\s*\.?|cpc|ipc|field\s+of\s+classification\s+search)\b", low):
-        return True
-    if re.search(r"\brelated\s+u\.?\s*s\.?\s+application\s+data\b", low):
-        return True
-    if re.search(r"\bus\s+\d{4}\s*/\s*\d{4,}\s*[ab]\d?\b", low):
-        return True
-    if re.search(r"\bpat\s*\.?\s*no\s*\.?", low):
-        return True
-    if re.fullmatch(r"\(?\s*\d{2,4}\s*[./]\s*\d{2,4}\s*\)?", low):
-        return True
-    if re.fullmatch(r"\(?\s*\d+\s+\d{2,4}\.\d+\s*\)?", low):
-        return True
-    if re.fullmatch(r"[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?", low):
-        return True
-    if re.fullmatch(r"\(?\s*[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?\s*\)?", low):
-        return True
-    if re.search(r"\bsheet\s+\d+\s+of\s+\d+\b", low):
-        return True
-    if re.search(r"\(?\s*continued\s*\)?", low):
-        return True
-    return False
+    return _PRIOR_ART_NOISE_SEARCH_RE.search(low) is not None
 
 
 def _is_prior_art_classification_noise(line: str) -> bool:
     low = _normalize_pdf_line(line or "")
     if not low:
         return False
-    if re.search(r"\b(?:u\s*\.?\s*s\s*\.?\s*c[il]\s*\.?|int\s*\.?\s*cl\s*\.?|cpc|ipc|field\s+of\s+classification\s+search)\b", low):
-        return True
-    if re.search(r"\brelated\s+u\.?\s*s\.?\s+application\s+data\b", low):
-        return True
-    if re.search(r"\bus\s+\d{4}\s*/\s*\d{4,}\s*[ab]\d?\b", low):
-        return True
-    if re.search(r"\bpat\s*\.?\s*no\s*\.?", low):
-        return True
-    if re.search(r"\(?\s*continued\s*\)?", low):
-        return True
-    if re.fullmatch(r"\(?\s*\d{2,4}\s*[./]\s*\d{2,4}\s*\)?", low):
-        return True
-    if re.fullmatch(r"\(?\s*\d+\s+\d{2,4}\.\d+\s*\)?", low):
+    if _CLASSIFICATION_NOISE_FULL_RE.fullmatch(low):
         return True
-    if re.fullmatch(r"\(?\s*[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?\s*\)?", low):
-        return True
-    if re.search(r"\b[a-hy]\d{2}[a-z]\s*\d+(?:/\d+)?\b", low):
-        return True
-    return False
+    return _CLASSIFICATION_NOISE_SEARCH_RE.search(low) is not None
 
 
 def _trim_abstract_without_mid_sentence_cut(text: str, max_words: int = _PRIOR_ART_MAX_ABSTRACT_WORDS) -> str:
@@ -592,30 +771,26 @@ def _trim_abstract_without_mid_sentence_cut(text: str, max_words: int = _PRIOR_A
 
 def _looks_non_english(text: str) -> bool:
     txt = _clean(text)
-    if not txt:
+    if not txt or txt.isascii():
         return False
 
-    cjk_chars = sum(
-        1
-        for ch in txt
-        if ("\u4e00" <= ch <= "\u9fff") or ("\u3040" <= ch <= "\u30ff") or ("\uac00" <= ch <= "\ud7af")
-    )
+    cjk_chars = len(_CJK_CHAR_RE.findall(txt))
     if cjk_chars >= 8:
         return True
 
-    alpha_chars = [ch for ch in txt if ch.isalpha()]
-    if not alpha_chars:
+    alpha_count = sum(map(str.isalpha, txt))
+    if not alpha_count:
         return False
 
-    ascii_alpha = sum(1 for ch in alpha_chars if ("a" <= ch.lower() <= "z"))
-    ascii_ratio = ascii_alpha / max(1, len(alpha_chars))
+    ascii_alpha = len(_LATIN_ALPHA_RE.findall(txt))
+    ascii_ratio = ascii_alpha / max(1, alpha_count)
     if ascii_ratio < 0.45:
         return True
 
     if _non_ascii_ratio(txt) <= 0.25:
         return False
 
-    if re.search(r"\b(the|and|of|to|for|with|method|system|apparatus|device|invention)\b", txt, re.I):
+    if _ENGLISH_HINT_RE.search(txt):
         return False
     return True
 
@@ -661,20 +836,19 @@ def _translate_text_to_english(text: str) -> str:
     if enabled in {"0", "false", "no", "off"}:
         return src
 
-    paras = [p.strip() for p in re.split(r"\n{2,}", src) if p and p.strip()]
+    paras = [p.strip() for p in _PARA_BREAK_RE.split(src) if p and p.strip()]
     if not paras:
         paras = [src]
 
-    out: List[str] = []
+    chunks: List[str] = []
     for para in paras:
         if len(para) <= _TRANSLATE_MAX_CHARS:
-            out.append(_translate_chunk_to_english(para))
+            chunks.append(para)
             continue
 
         words = para.split()
         if not words:
             continue
-        chunks: List[str] = []
         current: List[str] = []
         current_len = 0
         for w in words:
@@ -689,8 +863,13 @@ def _translate_text_to_english(text: str) -> str:
         if current:
             chunks.append(" ".join(current))
 
-        for chunk in chunks:
-            out.append(_translate_chunk_to_english(chunk))
+    # Each chunk is a blocking HTTP round trip; issue them concurrently.
+    # map() keeps the results in chunk order.
+    if len(chunks) <= 1:
+        out = [_translate_chunk_to_english(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_TRANSLATE_WORKERS, len(chunks))) as pool:
+            out = list(pool.map(_translate_chunk_to_english, chunks))
 
     translated = _clean_prior_art_abstract_text("\n\n".join(out))
     return translated or src
@@ -700,25 +879,26 @@ def _extract_prior_art_abstract_by_heading(lines: List[str]) -> str:
     if not lines:
         return ""
     headings = [h.lower() for h in _PRIOR_ART_ABSTRACT_HEADINGS]
+    colon_headings = [f"{h}:" for h in headings]
+    cleaned_lines = [_clean(line) for line in lines]
 
-    for i, line in enumerate(lines):
-        x = _clean(line)
+    for i, x in enumerate(cleaned_lines):
         if not x:
             continue
         low = x.lower()
 
         inline = ""
-        if re.match(r"^\[?\s*57\s*\]?\s*abstract\b", low):
-            m = re.match(r"^\[?\s*57\s*\]?\s*abstract\b\s*[:\-]?\s*(.*)$", x, re.I)
+        if _ABSTRACT_57_RE.match(low):
+            m = _ABSTRACT_57_INLINE_RE.match(x)
             inline = _clean(m.group(1) if m else "")
         else:
-            for h in headings:
-                m = re.match(rf"^\s*{re.escape(h)}\b\s*[:\-]?\s*(.*)$", x, re.I)
+            for rx in _ABSTRACT_HEADING_RES:
+                m = rx.match(x)
                 if m:
                     inline = _clean(m.group(1))
                     break
 
-        is_heading = bool(inline or low in headings or low in [f"{h}:" for h in headings] or re.match(r"^\[?\s*57\s*\]?\s*abstract\b\s*:?\s*$", low))
+        is_heading = bool(inline or low in headings or low in colon_headings or _ABSTRACT_57_ONLY_RE.match(low))
         if not is_heading:
             continue
 
@@ -730,8 +910,8 @@ def _extract_prior_art_abstract_by_heading(lines: List[str]) -> str:
 
         j = i + 1
         blank_streak = 0
-        while j < len(lines):
-            ln = _clean(lines[j])
+        while j < len(cleaned_lines):
+            ln = cleaned_lines[j]
             if not ln:
                 blank_streak += 1
                 # Layout extraction often introduces blank lines. Stop only after enough content.
@@ -796,11 +976,15 @@ def _extract_prior_art_abstract_fallback(lines: List[str]) -> str:
         s = 0.0
         if 45 <= wc <= 280:
             s += 5.0
-        if re.search(r"\b(the present invention|discloses|relates to|provides|method|apparatus|system|device|implemented)\b", t, re.I):
+        if _ABSTRACT_CUE_RE.search(t):
             s += 2.0
-        if re.search(r"\bclaim[s]?\b", t, re.I):
+        if _CLAIM_WORD_RE.search(t):
             s -= 2.5
-        digit_ratio = sum(ch.isdigit() for ch in t) / max(1, len(t))
+        if t.isascii():
+            digits = len(t) - len(t.translate(_DIGIT_DROP))
+        else:
+            digits = sum(ch.isdigit() for ch in t)
+        digit_ratio = digits / max(1, len(t))
         if digit_ratio > 0.12:
             s -= 1.5
         return s
@@ -809,28 +993,27 @@ def _extract_prior_art_abstract_fallback(lines: List[str]) -> str:
     return _clean_prior_art_abstract_text(best)
 
 
+def _finish_prior_art_abstract(abstract: str) -> str:
+    abstract = _clean_prior_art_abstract_text(abstract)
+    if abstract and _looks_non_english(abstract):
+        abstract = _clean_prior_art_abstract_text(_translate_text_to_english(abstract))
+    return _trim_abstract_without_mid_sentence_cut(abstract)
+
+
 def extract_prior_art_abstract_from_pdf(pdf_path: str) -> str:
     """Extract the most likely abstract text from a prior-art PDF."""
     lines = _read_prior_art_pdf_lines(pdf_path, max_pages=5)
     abstract = _extract_prior_art_abstract_by_heading(lines)
+    if abstract:
+        return _finish_prior_art_abstract(abstract)
 
-    full_text = ""
-    if not abstract:
-        full_text = read_pdf_text(pdf_path)
-        abstract = _extract_prior_art_abstract_by_heading(full_text.splitlines())
-
+    full_text = read_pdf_text(pdf_path)
+    abstract = _extract_prior_art_abstract_by_heading(full_text.splitlines())
     if not abstract:
         abstract = _extract_prior_art_abstract_fallback(lines)
-
     if not abstract:
-        if not full_text:
-            full_text = read_pdf_text(pdf_path)
         abstract = _extract_prior_art_abstract_fallback(full_text.splitlines())
-
-    abstract = _clean_prior_art_abstract_text(abstract)
-    if abstract and _looks_non_english(abstract):
-        abstract = _clean_prior_art_abstract_text(_translate_text_to_english(abstract))
-    return _trim_abstract_without_mid_sentence_cut(abstract)
+    return _finish_prior_art_abstract(abstract)
 
 
 def _extract_prior_art_abstract_from_text(full_text: str) -> str:
@@ -840,7 +1023,7 @@ def _extract_prior_art_abstract_from_text(full_text: str) -> str:
     lines: List[str] = []
     prev_blank = False
     for raw in raw_lines:
-        ln = re.sub(r"\s+", " ", (raw or "").strip())
+        ln = _clean(raw)
         if not ln:
             if lines and not prev_blank:
                 lines.append("")
@@ -863,10 +1046,7 @@ def _extract_prior_art_abstract_from_text(full_text: str) -> str:
     if not abstract:
         abstract = _extract_prior_art_abstract_fallback(text.splitlines())
 
-    abstract = _clean_prior_art_abstract_text(abstract)
-    if abstract and _looks_non_english(abstract):
-        abstract = _clean_prior_art_abstract_text(_translate_text_to_english(abstract))
-    return _trim_abstract_without_mid_sentence_cut(abstract)
+    return _finish_prior_art_abstract(abstract)
 
 
 def extract_prior_art_abstract(path: str) -> str:
@@ -877,9 +1057,9 @@ def extract_prior_art_abstract(path: str) -> str:
     return _extract_prior_art_abstract_from_text(read_text_any(path))
 
 
-def _find_date(patterns: List[str], text: str) -> str:
-    for pat in patterns:
-        m = re.search(pat, text, re.I)
+def _find_date(patterns: Tuple[re.Pattern, ...], text: str, header_end: Optional[int] = None) -> str:
+    for rx in patterns:
+        m = rx.search(text) if header_end is None else _search_header_first(rx, text, header_end)
         if m:
             return _clean(m.group(1))
     return ""
@@ -890,12 +1070,9 @@ NUMERIC_DATE_RE = r"[0-9]{1,2}[./-][0-9]{1,2}[./-][0-9]{2,4}"
 
 
 def _normalize_date(s: str) -> str:
-    s = _clean(s)
-    if not s:
-        return ""
-    s = s.replace(".", "/")
-    s = s.replace("-", "/")
-    m = DATE_RE.search(s)
+    # DATE_RE accepts any of . / - as separators and contains no whitespace,
+    # so the raw string can be searched as-is.
+    m = DATE_RE.search(s or "")
     if not m:
         return ""
     d, mo, y = m.group(1), m.group(2), m.group(3)
@@ -904,24 +1081,32 @@ def _normalize_date(s: str) -> str:
     return f"{int(d):02d}/{int(mo):02d}/{y}"
 
 
+_DOCNO_PUNCT_RE = re.compile(r"[()\-;:,]")
+_NUMERIC_DATE_SEARCH_RE = re.compile(NUMERIC_DATE_RE)
+_HN_DISPATCH_RES = (
+    re.compile(rf"date\s+of\s+dispatch(?:\s*/\s*email)?\s*[:\-]?\s*({NUMERIC_DATE_RE})", re.I),
+    re.compile(rf"dispatch\s+date\s*[:\-]?\s*({NUMERIC_DATE_RE})", re.I),
+    re.compile(rf"\bdispatch(?:ed)?\s+on\s*[:\-]?\s*({NUMERIC_DATE_RE})", re.I),
+)
+_DATE_LABEL_RE = re.compile(r"^date\s*[:\-]")
+_HN_DATED_RE = re.compile(rf"hearing\s+notice\s+(?:is\s+)?(?:dated|date)\s*[:\-]?\s*({NUMERIC_DATE_RE})", re.I)
+_NOTICE_DATED_RE = re.compile(rf"\bnotice\s+dated\s*[:\-]?\s*({NUMERIC_DATE_RE})", re.I)
+
+
 def _canonical_docno(s: str) -> str:
     s = (s or "").upper()
-    s = re.sub(r"\s+", "", s)
-    s = re.sub(r"[()\-;:,]", "", s)
+    s = _WS_RE.sub("", s)
+    s = _DOCNO_PUNCT_RE.sub("", s)
     return s
 
 
-def _extract_hn_dispatch_date(text: str) -> str:
+def _extract_hn_dispatch_date(text: str, lines: Optional[List[str]] = None) -> str:
     txt = text or ""
-    lines = [ln.strip() for ln in txt.splitlines() if ln and ln.strip()]
-
-    patterns = [
-        rf"date\s+of\s+dispatch(?:\s*/\s*email)?\s*[:\-]?\s*({NUMERIC_DATE_RE})",
-        rf"dispatch\s+date\s*[:\-]?\s*({NUMERIC_DATE_RE})",
-        rf"\bdispatch(?:ed)?\s+on\s*[:\-]?\s*({NUMERIC_DATE_RE})",
-    ]
-    for pat in patterns:
-        m = re.search(pat, txt, re.I)
+    if lines is None:
+        lines = [ln.strip() for ln in txt.splitlines() if ln and ln.strip()]
+
+    for rx in _HN_DISPATCH_RES:
+        m = rx.search(txt)
         if m:
             return _clean(m.group(1))
 
@@ -930,44 +1115,57 @@ def _extract_hn_dispatch_date(text: str) -> str:
         low = ln.lower()
         if "hearing date" in low or "date & time" in low or "time" in low:
             continue
-        if re.match(r"^date\s*[:\-]", low):
-            m = re.search(NUMERIC_DATE_RE, ln)
+        if _DATE_LABEL_RE.match(low):
+            m = _NUMERIC_DATE_SEARCH_RE.search(ln)
             if m:
                 return _clean(m.group(0))
-        if re.fullmatch(NUMERIC_DATE_RE, ln):
+        if _NUMERIC_DATE_SEARCH_RE.fullmatch(ln):
             return _clean(ln)
 
-    m = re.search(rf"hearing\s+notice\s+(?:is\s+)?(?:dated|date)\s*[:\-]?\s*({NUMERIC_DATE_RE})", txt, re.I)
+    m = _HN_DATED_RE.search(txt)
     if m:
         return _clean(m.group(1))
-    m = re.search(rf"\bnotice\s+dated\s*[:\-]?\s*({NUMERIC_DATE_RE})", txt, re.I)
+    m = _NOTICE_DATED_RE.search(txt)
     if m:
         return _clean(m.group(1))
 
     for ln in lines[:120]:
         low = ln.lower()
         if "dispatch" in low:
-            m = re.search(NUMERIC_DATE_RE, ln)
+            m = _NUMERIC_DATE_SEARCH_RE.search(ln)
             if m:
                 return _clean(m.group(0))
 
     return ""
 
 
-def _parse_prior_arts_from_text(text: str) -> List[PriorArt]:
+_DX_HEAD_RE = re.compile(r"^\s*(D\d+)\s*[:\-]?\s*(.*)$", re.I)
+_DX_STOP_RE = re.compile(
+    r"^\s*(FORMAL\s+REQUIREMENT|REPLY\s+TO\s+OBJECTION|NOVELTY|INVENTIVE|NON[-\s]*PATENT|CLAIM|HEARING|NAME\s+OF\s+THE\s+CONTROLLER)\b",
+    re.I,
+)
+_PUBLICATION_DATE_RE = re.compile(r"Publication\s*Date\s*[:\-]*\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})", re.I)
+_PAREN_DATE_RE = re.compile(r"\(([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})\)")
+_SLASH_DASH_DATE_RE = re.compile(r"[0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}")
+_TRAILING_PUBLICATION_DATE_RE = re.compile(r"Publication\s*Date\s*[:\-]*\s*$", re.I)
+_WHOLE_DOCUMENT_RE = re.compile(r"\bwhole\s+doc(?:ument)?\b.*$", re.I)
+_NON_DIGIT_RE = re.compile(r"\D")
+_DISCLOSURE_VERB_RE = re.compile(r"\b(discloses|describes|teaches|is\s+related\s+to)\b", re.I)
+
+
+def _parse_prior_arts_from_text(text: str, lines: Optional[List[str]] = None) -> List[PriorArt]:
     """Parse D1..Dn prior-arts from FER/HN text across IPO formats and de-duplicate."""
-    lines = (text or "").splitlines()
-    arts: List[PriorArt] = []
+    if lines is None:
+        lines = (text or "").splitlines()
+    # De-duplicated while scanning; labels usually arrive in order, so only sort when they don't.
+    dedup: Dict[Tuple[str, str], PriorArt] = {}
+    last_num = -1
+    needs_sort = False
     i = 0
-    dx_head = re.compile(r"^\s*(D\d+)\s*[:\-]?\s*(.*)$", re.I)
-    stop_re = re.compile(
-        r"^\s*(FORMAL\s+REQUIREMENT|REPLY\s+TO\s+OBJECTION|NOVELTY|INVENTIVE|NON[-\s]*PATENT|CLAIM|HEARING|NAME\s+OF\s+THE\s+CONTROLLER)\b",
-        re.I,
-    )
 
     while i < len(lines):
         raw = lines[i]
-        m = dx_head.match(raw)
+        m = _DX_HEAD_RE.match(raw)
         if not m:
             i += 1
             continue
@@ -979,26 +1177,24 @@ def _parse_prior_arts_from_text(text: str) -> List[PriorArt]:
         j = i + 1
         while j < len(lines) and len(block_parts) < 6:
             nxt = lines[j]
-            if dx_head.match(nxt):
+            if _DX_HEAD_RE.match(nxt):
                 break
-            if stop_re.match(nxt):
+            if _DX_STOP_RE.match(nxt):
                 break
-            if _clean(nxt):
-                block_parts.append(_clean(nxt))
+            c = _clean(nxt)
+            if c:
+                block_parts.append(c)
             j += 1
 
-        block = re.sub(r"\s+", " ", " ".join(block_parts)).strip()
+        block = _clean(" ".join(block_parts))
 
         date = ""
-        md = re.search(
-            r"Publication\s*Date\s*[:\-]*\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})",
-            block,
-            re.I,
-        )
-        if md:
-            date = _normalize_date(md.group(1))
-        if not date:
-            md = re.search(r"\(([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})\)", block)
+        # Publication-date and parenthesised dates are both slash/dash dates, so
+        # one scan decides whether they are worth looking for; its span also
+        # marks where the docno ends.
+        mdt = _SLASH_DASH_DATE_RE.search(block)
+        if mdt:
+            md = _PUBLICATION_DATE_RE.search(block) or _PAREN_DATE_RE.search(block)
             if md:
                 date = _normalize_date(md.group(1))
         if not date:
@@ -1006,40 +1202,49 @@ def _parse_prior_arts_from_text(text: str) -> List[PriorArt]:
 
         docno = block
         if date:
-            mdt = re.search(r"[0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}", docno)
             if mdt:
                 docno = docno[: mdt.start()].strip()
-            docno = re.sub(r"Publication\s*Date\s*[:\-]*\s*$", "", docno, flags=re.I).strip()
+            docno = _TRAILING_PUBLICATION_DATE_RE.sub("", docno).strip()
 
-        docno = re.sub(r"\bwhole\s+doc(?:ument)?\b.*$", "", docno, flags=re.I).strip()
+        docno = _WHOLE_DOCUMENT_RE.sub("", docno).strip()
         docno = docno.strip(" ;,")
 
         if docno:
-            arts.append(PriorArt(label=label, docno=docno, date=date))
-
-        i = j
-
-    dedup: Dict[Tuple[str, str], PriorArt] = {}
-    for pa in arts:
-        key = (pa.label.upper(), _canonical_docno(pa.docno))
-        prev = dedup.get(key)
-        if prev is None:
-            dedup[key] = pa
-        else:
-            if (not prev.date) and pa.date:
+            pa = PriorArt(label=label, docno=docno, date=date)
+            key = (label, _canonical_docno(docno))
+            prev = dedup.get(key)
+            if prev is None:
+                dedup[key] = pa
+                num = _prior_art_label_num(pa)
+                needs_sort = needs_sort or num < last_num
+                last_num = max(last_num, num)
+            elif (not prev.date) and pa.date:
                 dedup[key] = pa
             elif prev.date == pa.date and len(pa.docno) > len(prev.docno):
                 dedup[key] = pa
 
+        i = j
+
     vals = list(dedup.values())
-    vals.sort(key=lambda p: int(re.sub(r"\D", "", p.label) or "9999"))
+    if needs_sort:
+        vals.sort(key=_prior_art_label_num)
     return vals
 
 
+_DISCLOSURE_SLOTS = {1: "d1_disclosure", 2: "d2_disclosure"}
+
+
+def _prior_art_label_num(pa: PriorArt) -> int:
+    return int(_NON_DIGIT_RE.sub("", pa.label) or "9999")
+
+
 def _extract_disclosures(text: str, prior_arts: List[PriorArt]) -> Dict[str, str]:
     """Extract short disclosure strings for each Dx, robust to IPO phrasing."""
     t = text or ""
     out: Dict[str, str] = {}
+    # Every pattern below needs one of these verbs; without any, skip the per-label scans.
+    if not _DISCLOSURE_VERB_RE.search(t):
+        return out
 
     def clip(s: str) -> str:
         s = _clean(s)
@@ -1080,172 +1285,256 @@ def _extract_disclosures(text: str, prior_arts: List[PriorArt]) -> Dict[str, str
     return out
 
 
-def parse_case_meta_from_fer_or_hn(pdf_path: str) -> CaseMeta:
-    text = read_pdf_text(pdf_path)
-    meta = CaseMeta(prior_arts=[])
-
-    # Application number
-    for pat in [
+_APP_NO_RES = tuple(
+    re.compile(p, re.I)
+    for p in (
         r"Indian\s+Patent\s+Application\s+No\s*[:\-]?\s*([0-9][0-9A-Z/\-]*)",
         r"Indian\s+Patent\s+Application\s+No\.?\s*[:\-]?\s*([0-9][0-9A-Z/\-]*)",
         r"Application\s+Number\s*[:\-]?\s*([0-9][0-9A-Z/\-]*)",
         r"Application\s*No\.?\s*[/:-]?\s*([0-9][0-9A-Z/\-]*)",
         r"POD/Application\s*No\s*/\s*([0-9][0-9A-Z/\-]*)",
-    ]:
-        m = re.search(pat, text, re.I)
+    )
+)
+_FILED_ON_RES = (
+    re.compile(r"Date\s+of\s+Filing\s*[:\-]?\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})", re.I),
+    re.compile(r"Filed\s*on\s*[:\-]?\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})", re.I),
+)
+_APPLICANT_NAME_RE = re.compile(r"Name\s+of\s+the\s+Applicant\s*[:\-]?\s*(.+)", re.I)
+_APPLICANT_RE = re.compile(r"\bApplicant\s*[:\-]?\s*(.+)", re.I)
+_APPLICANT_CONT_RE = re.compile(r"\s*\n\s*([^\n:]{4,})\n")
+_APPLICANT_CONT_STOP_RE = re.compile(r"\b(controller|address|date|application|hearing|ref)\b", re.I)
+_CONTROLLER_BLOCK_RE = re.compile(
+    r"\n\s*([A-Za-z][A-Za-z .]{2,})\s*\n\s*"
+    r"((?:Assistant|Deputy|Joint|Senior\s+Joint|Controller)\s+Controller\s+of\s+"
+    r"(?:Patents?(?:\s*&\s*Designs)?|Patents?\s+and\s+Designs))\b",
+    re.I,
+)
+_CONTROLLER_NAME_RE = re.compile(r"Controller\s+Name\s*[:\-]?\s*(.+)", re.I)
+_AGENT_TO_RE = re.compile(r"To\s*\n\s*([A-Z][A-Z ]+NARASANI)", re.I)
+_AGENT_ADDRESS_RE = re.compile(r"Registerd\s+Address\s+For\s+Service\s*:?\s*([A-Z][^,\n]+NARASANI)", re.I)
+# "Dispatch.*?:" already covers the "Dispatch/Email ...:" form, so one scan suffices.
+_FER_DISPATCH_RES = (
+    re.compile(r"Date\s+of\s+Dispatch.*?:\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})", re.I),
+)
+# Only consulted after _extract_hn_dispatch_date found nothing; its searches already
+# cover "Date of Dispatch[/Email]" and "hearing notice dated", leaving the bare label.
+_HN_DISPATCH_FALLBACK_RES = (
+    re.compile(r"\bDate\s*[-:]\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})\b", re.I),
+)
+_HEARING_LOCATION_RE = re.compile(r"Hearing\s+Location\s*:\s*(.+)", re.I)
+_HEARING_DATE_TIME_RE = re.compile(
+    r"Hearing\s+Date\s*&\s*Time\s*:\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})\s*/\s*([^\n]+)",
+    re.I,
+)
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2}:\d{2})")
+_HEARING_DURATION_RE = re.compile(r"Hearing\s+Duration\s*[:\-]\s*([^\n]+)", re.I)
+_DURATION_LABEL_RE = re.compile(
+    r"\bDuration\s*[:\-]\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?)(?:\s*[0-9]{1,2}\s*(?:minutes?|mins?))?)", re.I
+)
+_FER_DATED_RES = (re.compile(r"FER\s+dated\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})", re.I),)
+_FER_REPLY_DATED_RES = (
+    re.compile(r"reply\s+of\s+the\s+applicant\s+dated\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})", re.I),
+)
+# One literal every pattern of a field must contain, so fields whose label is
+# absent skip their full-text searches; the per-field patterns keep their
+# priority order. re scans a bare literal far faster than one zero-width
+# alternation probed at every offset, so each label gets its own search.
+_META_KEYWORDS = (
+    ("application", ("application",)),
+    ("applicant", ("applicant",)),
+    ("filing", ("filing", "filed")),
+    ("controller", ("controller",)),
+    ("narasani", ("narasani",)),
+    ("dispatch", ("dispatch",)),
+    ("hearing", ("hearing",)),
+    ("duration", ("duration",)),
+    ("fer", ("fer",)),
+    ("reply", ("reply",)),
+)
+_META_KEYWORD_RES = tuple((key, re.compile("|".join(words), re.I)) for key, words in _META_KEYWORDS)
+
+
+def _meta_keywords(text: str) -> Set[str]:
+    if text.isascii():
+        # On ASCII text re.I matching of these words is plain lower-case containment.
+        low = text.lower()
+        return {key for key, words in _META_KEYWORDS if any(w in low for w in words)}
+    return {key for key, rx in _META_KEYWORD_RES if rx.search(text)}
+
+
+# Most notice fields sit in the first few KB. In cleaned PDF text (stripped,
+# non-empty lines) every meta pattern spans only a handful of lines, so a hit
+# this many lines above the window's end is exactly what a full-text search
+# would return, and a miss there never needs rescanning.
+HEADER_SIZE = 4096
+_HEADER_MARGIN_LINES = 16
+
+
+def _header_safe_end(text: str) -> int:
+    """Offset below which a search bounded to HEADER_SIZE agrees with a full-text search."""
+    if len(text) <= HEADER_SIZE:
+        return len(text)
+    end = text.rfind("\n", 0, HEADER_SIZE)
+    for _ in range(_HEADER_MARGIN_LINES):
+        if end <= 0:
+            return 0
+        end = text.rfind("\n", 0, end)
+    return max(end, 0)
+
+
+def _search_header_first(rx: re.Pattern, text: str, header_end: int) -> Optional[re.Match]:
+    if header_end >= len(text):
+        return rx.search(text)
+    m = rx.search(text, 0, HEADER_SIZE)
+    if m and m.start() < header_end:
+        return m
+    # Nothing can start before header_end; resume from there.
+    return rx.search(text, header_end)
+
+
+def parse_case_meta_from_fer_or_hn(pdf_path: str) -> CaseMeta:
+    lines = read_pdf_text_lines(pdf_path)  # also resets the per-line caches
+    text = "\n".join(lines)
+    meta = CaseMeta(prior_arts=[])
+    header_end = _header_safe_end(text)
+    present = _meta_keywords(text)
+
+    def search(rx: re.Pattern) -> Optional[re.Match]:
+        return _search_header_first(rx, text, header_end)
+
+    def find_date(key: str, patterns: Tuple[re.Pattern, ...]) -> str:
+        return _find_date(patterns, text, header_end) if key in present else ""
+
+    # Application number
+    for rx in _APP_NO_RES if "application" in present else ():
+        m = search(rx)
         if m:
             meta.app_no = _clean(m.group(1))
             break
 
     # Filed on / Date of Filing
-    meta.filed_on = _find_date(
-        [
-            r"Date\s+of\s+Filing\s*[:\-]?\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})",
-            r"Filed\s*on\s*[:\-]?\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})",
-        ],
-        text,
-    )
+    meta.filed_on = find_date("filing", _FILED_ON_RES)
 
     # Applicant
-    m = re.search(r"Name\s+of\s+the\s+Applicant\s*[:\-]?\s*(.+)", text, re.I)
-    if not m:
-        m = re.search(r"\bApplicant\s*[:\-]?\s*(.+)", text, re.I)
+    m = None
+    if "applicant" in present:
+        m = search(_APPLICANT_NAME_RE) or search(_APPLICANT_RE)
     if m:
         first = _clean(m.group(1))
         cont = ""
-        after = text[m.end():]
-        m2 = re.match(r"\s*\n\s*([^\n:]{4,})\n", after)
+        m2 = _APPLICANT_CONT_RE.match(text, m.end())
         if m2:
             cand = _clean(m2.group(1))
-            if cand and not re.search(r"\b(controller|address|date|application|hearing|ref)\b", cand, re.I):
+            if cand and not _APPLICANT_CONT_STOP_RE.search(cand):
                 cont = cand
         meta.applicant = _clean(" ".join([x for x in [first, cont] if x]))
 
     # Controller (expanded to cover IPO variants like:
     # "Saroj Kumar\nDeputy Controller of Patents & Designs"
-    m = re.search(
-        r"\n\s*([A-Za-z][A-Za-z .]{2,})\s*\n\s*"
-        r"((?:Assistant|Deputy|Joint|Senior\s+Joint|Controller)\s+Controller\s+of\s+"
-        r"(?:Patents?(?:\s*&\s*Designs)?|Patents?\s+and\s+Designs))\b",
-        text,
-        re.I,
-    )
+    m = search(_CONTROLLER_BLOCK_RE) if "controller" in present else None
     if m:
         controller_name = _clean(m.group(1)).title()
         designation = _clean(m.group(2))
         meta.controller = f"{controller_name} ({designation})"
     else:
-        m = re.search(r"Controller\s+Name\s*[:\-]?\s*(.+)", text, re.I)
+        m = search(_CONTROLLER_NAME_RE) if "controller" in present else None
         if m:
             meta.controller = _clean(m.group(1))
         else:
             meta.controller = ""
 
-    # Agent
-    m = re.search(r"To\s*\n\s*([A-Z][A-Z ]+NARASANI)", text, re.I)
-    if m:
-        meta.agents = _clean(m.group(1).title())
-    m = re.search(r"Registerd\s+Address\s+For\s+Service\s*:?\s*([A-Z][^,\n]+NARASANI)", text, re.I)
-    if m:
-        meta.agents = _clean(m.group(1))
+    # Agent (the registered address for service wins over the "To" block)
+    if "narasani" in present:
+        m = search(_AGENT_ADDRESS_RE)
+        if m:
+            meta.agents = _clean(m.group(1))
+        else:
+            m = search(_AGENT_TO_RE)
+            if m:
+                meta.agents = _clean(m.group(1).title())
 
     # Dispatch dates
-    meta.fer_dispatch_date = _find_date(
-        [
-            r"Date\s+of\s+Dispatch.*?:\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})",
-            r"Date\s+of\s+Dispatch/Email.*?:\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})",
-        ],
-        text,
-    )
+    meta.fer_dispatch_date = find_date("dispatch", _FER_DISPATCH_RES)
 
-    meta.hn_dispatch_date = _extract_hn_dispatch_date(text) or _find_date(
-        [
-            r"Date\s+of\s+Dispatch\s*:?\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})",
-            r"Date\s+of\s+Dispatch/Email\s*:?\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})",
-            r"hearing\s+notice\s+dated\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})",
-            r"\bDate\s*[-:]\s*([0-9]{1,2}[.\-/][0-9]{1,2}[.\-/][0-9]{2,4})\b",
-        ],
-        text,
+    meta.hn_dispatch_date = _extract_hn_dispatch_date(text, lines) or _find_date(
+        _HN_DISPATCH_FALLBACK_RES, text, header_end
     )
 
     # Hearing date/time/mode
-    m = re.search(r"Hearing\s+Location\s*:\s*(.+)", text, re.I)
+    hearing = "hearing" in present
+    m = search(_HEARING_LOCATION_RE) if hearing else None
     if m:
         meta.hearing_mode = _clean(m.group(1))
-    m = re.search(
-        r"Hearing\s+Date\s*&\s*Time\s*:\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})\s*/\s*([^\n]+)",
-        text,
-        re.I,
-    )
+    m = search(_HEARING_DATE_TIME_RE) if hearing else None
     if m:
         meta.hearing_date = _clean(m.group(1))
         time_blob = _clean(m.group(2))
-        tm = re.search(r"(\d{1,2}:\d{2})", time_blob)
+        tm = _CLOCK_TIME_RE.search(time_blob)
         meta.hearing_time = tm.group(1) if tm else time_blob
         meta.hearing_duration = _duration_from_phrase(time_blob) or _duration_from_time_range(time_blob)
 
     if not meta.hearing_duration:
         meta.hearing_duration = _duration_from_phrase(text)
-    if not meta.hearing_duration:
-        m = re.search(r"Hearing\s+Duration\s*[:\-]\s*([^\n]+)", text, re.I)
+    if not meta.hearing_duration and hearing:
+        m = search(_HEARING_DURATION_RE)
         if m:
             meta.hearing_duration = _clean(m.group(1))
-    if not meta.hearing_duration:
-        m = re.search(r"\bDuration\s*[:\-]\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?)(?:\s*[0-9]{1,2}\s*(?:minutes?|mins?))?)", text, re.I)
+    if not meta.hearing_duration and "duration" in present:
+        m = search(_DURATION_LABEL_RE)
         if m:
             meta.hearing_duration = _clean(m.group(1))
     if not meta.hearing_duration:
         meta.hearing_duration = _duration_from_time_range(text)
 
     # FER date + reply date
-    meta.fer_date = _find_date(
-        [r"FER\s+dated\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})"],
-        text,
-    ) or meta.fer_dispatch_date
-
-    meta.fer_reply_date = _find_date(
-        [r"reply\s+of\s+the\s+applicant\s+dated\s*([0-9]{1,2}[\-/][0-9]{1,2}[\-/][0-9]{2,4})"],
-        text,
-    )
+    meta.fer_date = find_date("fer", _FER_DATED_RES) or meta.fer_dispatch_date
+
+    meta.fer_reply_date = find_date("reply", _FER_REPLY_DATED_RES)
 
     # Prior arts + disclosures
-    meta.prior_arts = _parse_prior_arts_from_text(text)
+    meta.prior_arts = _parse_prior_arts_from_text(text, lines)
 
     disclosures = _extract_disclosures(text, meta.prior_arts or [])
     for lab, disc in disclosures.items():
+        # Labels are "D<n>" (_DX_HEAD_RE), so the number is everything after the D.
         try:
-            num = int(re.sub(r"\D", "", lab))
-            setattr(meta, f"d{num}_disclosure", disc)
-        except Exception:
-            pass
+            num = int(lab[1:])
+        except ValueError:
+            continue
+        setattr(meta, _DISCLOSURE_SLOTS.get(num) or f"d{num}_disclosure", disc)
 
-    meta.d1_disclosure = getattr(meta, "d1_disclosure", "") or disclosures.get("D1", "")
-    meta.d2_disclosure = getattr(meta, "d2_disclosure", "") or disclosures.get("D2", "")
+    meta.d1_disclosure = meta.d1_disclosure or disclosures.get("D1", "")
+    meta.d2_disclosure = meta.d2_disclosure or disclosures.get("D2", "")
 
     return meta
 
 def build_prior_arts_list(meta: CaseMeta) -> str:
-    lines: List[str] = []
-    for pa in (meta.prior_arts or []):
-        if pa.date:
-            lines.append(f"{pa.label}: {pa.docno} ({pa.date})")
-        else:
-            lines.append(f"{pa.label}: {pa.docno}")
-    return "\n".join(lines) if lines else ""
+    return "\n".join(
+        f"{pa.label}: {pa.docno} ({pa.date})" if pa.date else f"{pa.label}: {pa.docno}"
+        for pa in (meta.prior_arts or [])
+    )
 
 
+_CLAIMS_START_RES = (
+    re.compile(r"(?im)^\s*WE\s+CLAIM\b"),
+    re.compile(r"(?im)^\s*CLAIMS?\s*:?\s*$"),
+    re.compile(r"(?im)^\s*WHAT\s+IS\s+CLAIMED\b"),
+)
+
+
 def parse_claims_from_specification(spec_text: str) -> Dict[int, str]:
-    text = spec_text or ""
+    # The cached dict is shared; hand each caller its own copy.
+    return dict(_parse_claims_from_specification(spec_text or ""))
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
+def _parse_claims_from_specification(text: str) -> Dict[int, str]:
     if not text.strip():
         return {}
 
     starts: List[int] = []
-    for pat in [
-        r"(?im)^\s*WE\s+CLAIM\b",
-        r"(?im)^\s*CLAIMS?\s*:?\s*$",
-        r"(?im)^\s*WHAT\s+IS\s+CLAIMED\b",
-    ]:
-        m = re.search(pat, text)
+    for rx in _CLAIMS_START_RES:
+        m = rx.search(text)
         if m:
             starts.append(m.start())
 
@@ -1271,6 +1560,28 @@ def parse_claims_from_specification(spec_text: str) -> Dict[int, str]:
     return {k: v for k, v in best.items() if 1 <= k <= 200}
 
 
+_REVIEW_COMMENT_RES = (
+    re.compile(r"\bCommented\s*\[[^\]]+\]\s*:.*$", re.I),
+    re.compile(r"\bComment\s*\[[^\]]+\]\s*:.*$", re.I),
+)
+_DATED_THIS_RE = re.compile(r"^\s*dated\s+this\b")
+_SIGNATURE_DATE_RE = re.compile(r"^\s*date\s*:\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}")
+_PATENT_AGENT_RE = re.compile(r"\bpatent\s+agent\b")
+_NUMBERED_ITEM_RE = re.compile(r"^\s*\d{1,3}\.\s+")
+_CLAIM_REFS_ONLY_RE = re.compile(r"\s*claim\s+\d+(?:\s*,\s*claim\s+\d+)*(?:\s*,\s*paragraph\s*\d+)?\s*", re.I)
+_MARGIN_NUMBER_BEFORE_ITEM_RE = re.compile(r"^\s*\d{1,3}\s+(?=\d{1,3}\.\s+)")
+_MARGIN_NUMBER_BEFORE_WORD_RE = re.compile(r"^\s*\d{1,3}\s+(?=[A-Za-z\-\(\[])")
+_MARGIN_NUMBER_BEFORE_DIGIT_RE = re.compile(r"^\s*(\d{1,3})\s+(?=\d)")
+_NUMBER_ONLY_RE = re.compile(r"\s*\d{1,3}\s*")
+_SPACE_RUN_RE = re.compile(r"[ \t]{2,}")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _drop_leading_margin_number(m: re.Match) -> str:
+    n = int(m.group(1))
+    return "" if (1 <= n <= 400 and n % 5 == 0) else m.group(0)
+
+
 def _clean_claim_source_text(text: str) -> str:
     """Remove margin line numbers and side comments from claim-source text."""
     if not text:
@@ -1288,50 +1599,37 @@ def _clean_claim_source_text(text: str) -> str:
             continue
 
         # Remove right-margin review notes.
-        ln = re.sub(r"\bCommented\s*\[[^\]]+\]\s*:.*$", "", ln, flags=re.I)
-        ln = re.sub(r"\bComment\s*\[[^\]]+\]\s*:.*$", "", ln, flags=re.I)
+        for rx in _REVIEW_COMMENT_RES:
+            ln = rx.sub("", ln)
 
         low = ln.lower().strip()
 
         # Skip trailing signature/footer text in amended claim PDFs.
-        if re.match(r"^\s*dated\s+this\b", low):
+        if _DATED_THIS_RE.match(low):
             break
         if "digitally signed by" in low:
             break
-        if re.match(r"^\s*date\s*:\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
+        if _SIGNATURE_DATE_RE.match(low):
             break
-        if re.search(r"\bpatent\s+agent\b", low) and not re.match(r"^\s*\d{1,3}\.\s+", ln):
+        if _PATENT_AGENT_RE.search(low) and not _NUMBERED_ITEM_RE.match(ln):
             continue
 
         # Drop comment continuation lines, e.g. "claim 5, claim 6".
-        if re.fullmatch(r"\s*claim\s+\d+(?:\s*,\s*claim\s+\d+)*(?:\s*,\s*paragraph\s*\d+)?\s*", ln, re.I):
+        if _CLAIM_REFS_ONLY_RE.fullmatch(ln):
             continue
 
         # Remove left margin line numbers.
-        ln = re.sub(r"^\s*\d{1,3}\s+(?=\d{1,3}\.\s+)", "", ln)
-        ln = re.sub(r"^\s*\d{1,3}\s+(?=[A-Za-z\-\(\[])", "", ln)
-        ln = re.sub(
-            r"^\s*(\d{1,3})\s+(?=\d)",
-            lambda m: "" if (1 <= int(m.group(1)) <= 400 and int(m.group(1)) % 5 == 0) else m.group(0),
-            ln,
-        )
+        ln = _MARGIN_NUMBER_BEFORE_ITEM_RE.sub("", ln)
+        ln = _MARGIN_NUMBER_BEFORE_WORD_RE.sub("", ln)
+        ln = _MARGIN_NUMBER_BEFORE_DIGIT_RE.sub(_drop_leading_margin_number, ln)
 
         # Drop isolated line-number lines.
-        if re.fullmatch(r"\s*\d{1,3}\s*", ln):
+        if _NUMBER_ONLY_RE.fullmatch(ln):
             continue
 
         # Remove inline line-number artifacts inserted between words.
-        def _inline_repl(m: re.Match) -> str:
-            try:
-                n = int(m.group(1))
-            except Exception:
-                return m.group(0)
-            if 1 <= n <= 400 and n % 5 == 0:
-                return " "
-            return m.group(0)
-
-        ln = re.sub(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])", _inline_repl, ln)
-        ln = re.sub(r"[ \t]{2,}", " ", ln).strip()
+        ln = _INLINE_LINE_NUMBER_RE.sub(_drop_margin_line_number, ln)
+        ln = _SPACE_RUN_RE.sub(" ", ln).strip()
         ln = _canonicalize_claim_marker_line(ln)
         if not ln:
             continue
@@ -1340,24 +1638,31 @@ def _clean_claim_source_text(text: str) -> str:
         prev_blank = False
 
     text_out = "\n".join(cleaned).strip()
-    text_out = re.sub(r"\n{3,}", "\n\n", text_out)
+    text_out = _EXTRA_BLANK_LINES_RE.sub("\n\n", text_out)
     return text_out
 
 
-def _canonicalize_claim_marker_line(line: str) -> str:
-    ln = (line or "").strip()
-    if not ln:
-        return ""
-
-    patterns = [
+_CLAIM_MARKER_RES = tuple(
+    re.compile(p, re.I)
+    for p in (
         r"^\s*\[?\s*AMENDED[_\s-]*CLAIM[_\s-]*(\d{1,3})\s*\]?\s*[:\-]?\s*(.*)$",
         r"^\s*CLAIM\s*(\d{1,3})\s*[:\-\)]?\s*(.*)$",
         r"^\s*\((\d{1,3})\)\s*(.*)$",
         r"^\s*(\d{1,3})\)\s*(.*)$",
-    ]
+    )
+)
+# Splitting on the claim heads yields [preamble, no, body, no, body, ...].
+_NUMBERED_CLAIM_SPLIT_RE = re.compile(r"(?m)^\s*(\d{1,3})\.\s*")
+_NUMBERED_CLAIM_LINE_RE = re.compile(r"^(\d{1,3})\.\s+(.*)$")
 
-    for pat in patterns:
-        m = re.match(pat, ln, re.I)
+
+def _canonicalize_claim_marker_line(line: str) -> str:
+    ln = (line or "").strip()
+    if not ln:
+        return ""
+
+    for rx in _CLAIM_MARKER_RES:
+        m = rx.match(ln)
         if not m:
             continue
         no = int(m.group(1))
@@ -1369,10 +1674,10 @@ def _canonicalize_claim_marker_line(line: str) -> str:
 
 def _parse_numbered_claims_regex(text: str) -> Dict[int, str]:
     claims: Dict[int, str] = {}
-    for m in re.finditer(r"(?ms)^\s*(\d{1,3})\.\s*(.*?)(?=^\s*\d{1,3}\.\s*|\Z)", text):
-        no = int(m.group(1))
+    parts = _NUMBERED_CLAIM_SPLIT_RE.split(text)
+    for no, body in zip(map(int, parts[1::2]), parts[2::2]):
         if 1 <= no <= 200:
-            claims[no] = _clean(m.group(2))
+            claims[no] = _clean(body)
     return claims
 
 
@@ -1390,7 +1695,7 @@ def _parse_numbered_claims_sequential(text: str) -> Dict[int, str]:
                 current_lines.append("")
             continue
 
-        m = re.match(r"^(\d{1,3})\.\s+(.*)$", ln)
+        m = _NUMBERED_CLAIM_LINE_RE.match(ln)
         if m:
             no = int(m.group(1))
             if no == expected_no and 1 <= no <= 200:
@@ -1431,6 +1736,16 @@ def _pick_best_claims_candidate(candidates: List[Dict[int, str]]) -> Dict[int, s
     )
 
 
+_CLAIM1_AMENDED_RES = tuple(
+    re.compile(p, re.I | re.S)
+    for p in (
+        r"Claim\s*1\s+has\s+been\s+amended\s+to\s+recite\s*:\s*(.*?)(?=\n\s*TECHNICAL\s+ADVANCEMENT\s*:|\Z)",
+        r"Claim\s*1\s+has\s+been\s+amended\s*[:\-]\s*(.*?)(?=\n\s*(?:Claim\s*2|2[\.\)]|Regarding\s+Claim\s*2)\b|\Z)",
+        r"Regarding\s+Claim\s*1\s*:\s*(.*?)(?=\n\s*Regarding\s+Claim\s*2\s*:|\Z)",
+    )
+)
+
+
 def parse_amended_claims(path: str) -> Dict[int, str]:
     ext = Path(path).suffix.lower()
     source_texts: List[str] = []
@@ -1464,12 +1779,8 @@ def parse_amended_claims(path: str) -> Dict[int, str]:
     claims = _pick_best_claims_candidate(candidates)
     if 1 not in claims:
         for txt in cleaned_sources:
-            for pat in [
-                r"Claim\s*1\s+has\s+been\s+amended\s+to\s+recite\s*:\s*(.*?)(?=\n\s*TECHNICAL\s+ADVANCEMENT\s*:|\Z)",
-                r"Claim\s*1\s+has\s+been\s+amended\s*[:\-]\s*(.*?)(?=\n\s*(?:Claim\s*2|2[\.\)]|Regarding\s+Claim\s*2)\b|\Z)",
-                r"Regarding\s+Claim\s*1\s*:\s*(.*?)(?=\n\s*Regarding\s+Claim\s*2\s*:|\Z)",
-            ]:
-                m = re.search(pat, txt, re.I | re.S)
+            for rx in _CLAIM1_AMENDED_RES:
+                m = rx.search(txt)
                 if m:
                     c1 = _clean(m.group(1))
                     if c1:
@@ -1481,118 +1792,210 @@ def parse_amended_claims(path: str) -> Dict[int, str]:
     return claims
 
 
+# Page fractions, page labels and (labelled) dates; one fullmatch covers all four.
+_SPEC_NOISE_LINE_RE = re.compile(
+    r"\d+\s*/\s*\d+"
+    r"|page\s*\d+(?:\s*of\s*\d+)?"
+    r"|date\s*[:\-]\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}"
+    r"|\d{1,2}[./-]\d{1,2}[./-]\d{2,4}",
+    re.I,
+)
+_PARA_TAG_RE = re.compile(r"\[\d{4}\]")
+# A whole whitespace run (never entered mid-way, never backtracked) before a tag.
+_PARA_TAG_GAP_RE = re.compile(r"(?<!\s)\s++(?=\[\d{4}\])")
+_PARA_NO_RE = re.compile(r"\[(\d{4})\]")
+_SPACE_TAB_RE = re.compile(r"[ \t]+")
+_LEADING_NUMBER_RE = re.compile(r"^\d{1,3}\s+(?=[A-Za-z\[\(])")
+_BLANK_LINE_SPLIT_RE = re.compile(r"\n\s*\n+")
+# Line breaks other than "\n" that str.splitlines() also cuts on.
+_OTHER_LINE_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+# Every start/end heading line contains one of these. re.I folds each character
+# that str.upper() maps onto their letters; U+FB05/U+FB06 upper-case to "ST".
+_DETAIL_HEAD_HINT_RE = re.compile(r"detailed[^\S\n]+description", re.I)
+_END_HEAD_HINT_RE = re.compile(r"claim|ab(?:st|[\ufb05\ufb06])ract", re.I)
+
+
+# The advancement and figure extractors run back to back on the same spec text.
+@lru_cache(maxsize=4)
+def _spec_lines(txt: str) -> Tuple[str, ...]:
+    return tuple(ln.rstrip() for ln in txt.splitlines())
+
+
+def _hinted_line_indexes(txt: str, hint: re.Pattern, first: int = 0) -> Iterator[int]:
+    # Ascending indexes (from `first`) of the txt.splitlines() lines holding a hint match.
+    if _OTHER_LINE_BREAK_RE.search(txt):
+        for i, ln in enumerate(_spec_lines(txt)):
+            if i >= first and hint.search(ln):
+                yield i
+        return
+    pos = line_no = 0
+    last = -1
+    for m in hint.finditer(txt):
+        line_no += txt.count("\n", pos, m.start())
+        pos = m.start()
+        if line_no >= first and line_no != last:
+            last = line_no
+            yield line_no
+
+
+_DETAIL_HEADS = frozenset(
+    {
+        "DETAILED DESCRIPTION OF THE INVENTION",
+        "DETAILED DESCRIPTION OF INVENTION",
+        "DETAILED DESCRIPTION",
+    }
+)
+_END_HEADS = frozenset(
+    {
+        "CLAIMS",
+        "ABSTRACT",
+        "WE CLAIM",
+        "WHAT IS CLAIMED IS",
+    }
+)
+
+
+def _iter_numbered_paras(txt: str) -> Iterator[str]:
+    """Yield "[0012] ..." paragraphs, each running up to the newline before the next tag.
+
+    Same cuts as finditer(r"(?s)(\[\d{4}\].*?)(?=\n\s*\[\d{4}\]|\Z)"), whose lazy body
+    re-scanned every whitespace run it crossed; here each run is scanned once.
+    """
+    n = len(txt)
+    pos = 0
+    while True:
+        m = _PARA_TAG_RE.search(txt, pos)
+        if not m:
+            return
+        end = n
+        h = m.end()
+        while True:
+            gap = _PARA_TAG_GAP_RE.search(txt, h)
+            if not gap:
+                break
+            nl = txt.find("\n", gap.start(), gap.end())
+            if nl >= 0:
+                end = nl
+                break
+            h = gap.end()
+        yield txt[m.start() : end]
+        pos = end
+
+
+def _norm_spec_heading(s: str) -> str:
+    return _clean(s).upper().rstrip(":")
+
+
+def _is_spec_noise_line(s: str) -> bool:
+    x = " ".join((s or "").split())
+    if not x:
+        return True
+    if "(" in x and "(cid:" in x.lower():
+        return True
+    return _SPEC_NOISE_LINE_RE.fullmatch(x) is not None
+
+
+def _strip_spec_line_numbers(s: str) -> str:
+    t = s or ""
+    if not t:
+        return ""
+    t = _strip_margin_line_numbers(t)
+    t = _SPACE_RUN_RE.sub(" ", t)
+    t = _EXTRA_BLANK_LINES_RE.sub("\n\n", t)
+    return t.strip()
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
 def extract_technical_advancement_from_spec(spec_text: str) -> str:
     txt = spec_text or ""
     if not txt.strip():
         return ""
 
-    def norm_heading(s: str) -> str:
-        return re.sub(r"\s+", " ", (s or "")).strip().upper().rstrip(":")
-
-    def is_noise_line(s: str) -> bool:
-        x = re.sub(r"\s+", " ", (s or "")).strip()
-        if not x:
-            return True
-        low = x.lower()
-        if re.fullmatch(r"\d+\s*/\s*\d+", low):
-            return True
-        if re.fullmatch(r"page\s*\d+(\s*of\s*\d+)?", low):
-            return True
-        if re.fullmatch(r"date\s*[:\-]\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-            return True
-        if re.fullmatch(r"\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-            return True
-        if "(cid:" in low:
-            return True
-        return False
-
-    def strip_line_numbers_from_text(s: str) -> str:
-        t = s or ""
-        if not t:
-            return ""
-        t = re.sub(r"(?m)^\s*\d{1,3}\s*$", "", t)
-        t = re.sub(r"(?m)^\s*\d{1,3}\s+(?=[A-Za-z\[\(])", "", t)
-
-        def repl(m: re.Match) -> str:
-            try:
-                n = int(m.group(1))
-            except Exception:
-                return m.group(0)
-            if 1 <= n <= 400 and n % 5 == 0:
-                return " "
-            return m.group(0)
-
-        t = re.sub(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])", repl, t)
-        t = re.sub(r"[ \t]{2,}", " ", t)
-        t = re.sub(r"\n{3,}", "\n\n", t)
-        return t.strip()
-
-    lines = [ln.rstrip() for ln in txt.splitlines()]
+    lines = _spec_lines(txt)
     start_idx = -1
-    detail_heads = [
-        "DETAILED DESCRIPTION OF THE INVENTION",
-        "DETAILED DESCRIPTION OF INVENTION",
-        "DETAILED DESCRIPTION",
-    ]
-    for i, ln in enumerate(lines):
-        h = norm_heading(ln)
-        if h in detail_heads:
+    for i in _hinted_line_indexes(txt, _DETAIL_HEAD_HINT_RE):
+        if _norm_spec_heading(lines[i]) in _DETAIL_HEADS:
             start_idx = i
             break
     if start_idx < 0:
-        numbered = re.findall(r"(?ms)(\[\d{4}\].*?)(?=\n\s*\[\d{4}\]|\Z)", txt)
-        if not numbered:
+        # Four paragraphs are used, preferring [0030] onwards; stop once that is settled.
+        first: List[str] = []
+        preferred: List[str] = []
+        for p in _iter_numbered_paras(txt):
+            is_preferred = int(_PARA_NO_RE.match(p).group(1)) >= 30
+            if len(first) < 4 or is_preferred:
+                cleaned_p = _strip_spec_line_numbers(_clean(p))
+                if len(first) < 4:
+                    first.append(cleaned_p)
+                if is_preferred:
+                    preferred.append(cleaned_p)
+                    if len(preferred) == 4:
+                        break
+        if not first:
             return ""
-        cleaned_num = [strip_line_numbers_from_text(re.sub(r"\s+", " ", p).strip()) for p in numbered if p and p.strip()]
-        preferred = []
-        for p in cleaned_num:
-            mnum = re.match(r"\[(\d{4})\]", p)
-            if mnum and int(mnum.group(1)) >= 30:
-                preferred.append(p)
-        pick = preferred or cleaned_num
-        return strip_line_numbers_from_text("\n\n".join(pick[:4]).strip())
-
-    end_heads = {
-        "CLAIMS",
-        "ABSTRACT",
-        "WE CLAIM",
-        "WHAT IS CLAIMED IS",
-    }
+        pick = preferred or first
+        return _strip_spec_line_numbers("\n\n".join(pick).strip())
+
     end_idx = len(lines)
-    for j in range(start_idx + 1, len(lines)):
-        h = norm_heading(lines[j])
-        if h in end_heads:
+    for j in _hinted_line_indexes(txt, _END_HEAD_HINT_RE, start_idx + 1):
+        if _norm_spec_heading(lines[j]) in _END_HEADS:
             end_idx = j
             break
 
     section_lines = []
     for ln in lines[start_idx + 1 : end_idx]:
-        if is_noise_line(ln):
+        if _is_spec_noise_line(ln):
             continue
-        norm_ln = re.sub(r"[ \t]+", " ", ln).strip()
-        norm_ln = re.sub(r"^\d{1,3}\s+(?=[A-Za-z\[\(])", "", norm_ln)
+        norm_ln = _SPACE_TAB_RE.sub(" ", ln).strip()
+        norm_ln = _LEADING_NUMBER_RE.sub("", norm_ln)
         if norm_ln:
             section_lines.append(norm_ln)
     section = "\n".join(section_lines).strip()
     if not section:
         return ""
 
-    numbered_paras = re.findall(r"(?ms)(\[\d{4}\].*?)(?=\n\s*\[\d{4}\]|\Z)", section)
+    numbered_paras = list(islice(_iter_numbered_paras(section), 4))
     if numbered_paras:
-        cleaned = [strip_line_numbers_from_text(re.sub(r"\s+", " ", p).strip()) for p in numbered_paras if p and p.strip()]
-        return strip_line_numbers_from_text("\n\n".join(cleaned[:4]).strip())
+        cleaned = [_strip_spec_line_numbers(_clean(p)) for p in numbered_paras]
+        return _strip_spec_line_numbers("\n\n".join(cleaned).strip())
 
-    para_blocks = [strip_line_numbers_from_text(re.sub(r"\s+", " ", p).strip()) for p in re.split(r"\n\s*\n+", section) if p and p.strip()]
-    return strip_line_numbers_from_text("\n\n".join(para_blocks[:4]).strip())
+    blocks = [p for p in _BLANK_LINE_SPLIT_RE.split(section) if p and p.strip()][:4]
+    para_blocks = [_strip_spec_line_numbers(_clean(p)) for p in blocks]
+    return _strip_spec_line_numbers("\n\n".join(para_blocks).strip())
+
+
+_FIG_LINE_RE = re.compile(r"\bFIG\.?\s*(\d+)(?:[A-Z])?\b\s*(?:is|illustrates|shows|depicts|represents)?\s*[:\-]?\s*(.*)$", re.I)
+_FIG_WORD_RE = re.compile(r"\bFIG", re.I)
+
+
+def _fig_candidate_lines(txt: str) -> Iterator[str]:
+    # Only lines mentioning FIG can match _FIG_LINE_RE; find them with one scan of
+    # the whole text instead of visiting every line.
+    if _OTHER_LINE_BREAK_RE.search(txt):
+        yield from (ln for ln in _spec_lines(txt) if _FIG_WORD_RE.search(ln))
+        return
+    line_end = -1
+    for m in _FIG_WORD_RE.finditer(txt):
+        pos = m.start()
+        if pos < line_end:
+            continue
+        line_start = txt.rfind("\n", 0, pos) + 1
+        line_end = txt.find("\n", pos)
+        if line_end < 0:
+            line_end = len(txt)
+        yield txt[line_start:line_end]
 
 
 def extract_figure_descriptions_from_spec(spec_text: str) -> Dict[int, str]:
-    txt = spec_text or ""
+    return dict(_extract_figure_descriptions_from_spec(spec_text or ""))
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
+def _extract_figure_descriptions_from_spec(txt: str) -> Dict[int, str]:
     out: Dict[int, str] = {}
-    lines = [re.sub(r"\s+", " ", ln).strip() for ln in txt.splitlines()]
-    fig_re = re.compile(r"\bFIG\.?\s*(\d+)(?:[A-Z])?\b\s*(?:is|illustrates|shows|depicts|represents)?\s*[:\-]?\s*(.*)$", re.I)
-    for ln in lines:
-        m = fig_re.search(ln)
+    for raw in _fig_candidate_lines(txt):
+        ln = _clean(raw)
+        m = _FIG_LINE_RE.search(ln)
         if not m:
             continue
         num = int(m.group(1))
@@ -3,8 +3,11 @@ from __future__ import annotations
 import os
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .extract import (
     extract_prior_art_abstract,
@@ -20,11 +23,37 @@ from .template import replace_placeholders
 
 TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "..", "templates", "ws_master_v1.docx")
 
+# Retries and previews re-run generation on the same HN text; these bound the per-text memo caches.
+_HN_CACHE_SIZE = 16
+
+_WS_RE = re.compile(r"\s+")
+_HSPACE_RE = re.compile(r"[ \t]+")
+_HSPACE_RUN_RE = re.compile(r"[ \t]{2,}")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_PARA_BREAK_RE = re.compile(r"\n{2,}")
+_DIGIT_RE = re.compile(r"\d")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:])")
+_SPACE_AFTER_OPEN_PAREN_RE = re.compile(r"\(\s+")
+_SPACE_BEFORE_CLOSE_PAREN_RE = re.compile(r"\s+\)")
+
+
+@dataclass(slots=True)
+class PriorArtEntry:
+    """One prior art (D1..Dn) as supplied by the API: a text abstract or a document to extract it from."""
+
+    label: str
+    abstract: str = ""
+    prior_art_pdf_path: str = ""
+    has_diagram: bool = False
+    diagram_image_path: str = ""
+
+
+_FILENAME_UNSAFE_TABLE = str.maketrans({ch: "_" for ch in ["\\", "/", ":", "*", "?", '"', "<", ">", "|", "\n", "\r", "\t"]})
+
 
 def _sanitize_filename(s: str) -> str:
-    for ch in ["\\", "/", ":", "*", "?", '"', "<", ">", "|", "\n", "\r", "\t"]:
-        s = s.replace(ch, "_")
-    s = re.sub(r"\s+", "_", s.strip())
+    s = s.translate(_FILENAME_UNSAFE_TABLE)
+    s = _WS_RE.sub("_", s.strip())
     return s or "UNKNOWN"
 
 
@@ -35,22 +64,33 @@ def _first_nonempty(*vals: str) -> str:
     return ""
 
 
+_DURATION_FOR_RE = re.compile(r"\bfor\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", re.I)
+_HEARING_DURATION_LABEL_RE = re.compile(r"Hearing\s+Duration\s*[:\-]\s*([^\n]+)", re.I)
+_DURATION_LABEL_RE = re.compile(
+    r"\bDuration\s*[:\-]\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?)(?:\s*[0-9]{1,2}\s*(?:minutes?|mins?))?)", re.I
+)
+_TIME_RANGE_RE = re.compile(r"(\d{1,2}:\d{2})\s*(?:HRS|IST|AM|PM)?\s*(?:to|\-|–|—)\s*(\d{1,2}:\d{2})", re.I)
+
+
+@lru_cache(maxsize=4)
+def _hn_lines(txt: str) -> Tuple[str, ...]:
+    """splitlines() of an HN text, shared by the fallbacks and the objection parser."""
+    return tuple(txt.splitlines())
+
+
+@lru_cache(maxsize=_HN_CACHE_SIZE)
 def _extract_hearing_duration_fallback(hn_text: str) -> str:
     txt = hn_text or ""
-    m = re.search(r"\bfor\s*\(?\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?))\s*\)?", txt, re.I)
+    m = _DURATION_FOR_RE.search(txt)
     if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
-    m = re.search(r"Hearing\s+Duration\s*[:\-]\s*([^\n]+)", txt, re.I)
+        return _normalize_ws_text(m.group(1))
+    m = _HEARING_DURATION_LABEL_RE.search(txt)
     if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
-    m = re.search(r"\bDuration\s*[:\-]\s*([0-9]{1,3}\s*(?:minutes?|mins?|hours?|hrs?)(?:\s*[0-9]{1,2}\s*(?:minutes?|mins?))?)", txt, re.I)
+        return _normalize_ws_text(m.group(1))
+    m = _DURATION_LABEL_RE.search(txt)
     if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
-    m = re.search(
-        r"(\d{1,2}:\d{2})\s*(?:HRS|IST|AM|PM)?\s*(?:to|\-|–|—)\s*(\d{1,2}:\d{2})",
-        txt,
-        re.I,
-    )
+        return _normalize_ws_text(m.group(1))
+    m = _TIME_RANGE_RE.search(txt)
     if m:
         try:
             sh, sm = [int(p) for p in m.group(1).split(":")]
@@ -67,94 +107,120 @@ def _extract_hearing_duration_fallback(hn_text: str) -> str:
     return ""
 
 
+_NUMERIC_DATE = r"[0-9]{1,2}[./-][0-9]{1,2}[./-][0-9]{2,4}"
+_NUMERIC_DATE_RE = re.compile(_NUMERIC_DATE)
+_DISPATCH_DATE_RES = (
+    re.compile(rf"date\s+of\s+dispatch(?:\s*/\s*email)?\s*[:\-]?\s*({_NUMERIC_DATE})", re.I),
+    re.compile(rf"dispatch\s+date\s*[:\-]?\s*({_NUMERIC_DATE})", re.I),
+    re.compile(rf"\bdispatch(?:ed)?\s+on\s*[:\-]?\s*({_NUMERIC_DATE})", re.I),
+)
+_DATE_LABEL_RE = re.compile(r"^date\s*[:\-]")
+_HN_DATED_RE = re.compile(rf"hearing\s+notice\s+(?:is\s+)?(?:dated|date)\s*[:\-]?\s*({_NUMERIC_DATE})", re.I)
+
+
+@lru_cache(maxsize=_HN_CACHE_SIZE)
 def _extract_hn_dispatch_fallback(hn_text: str) -> str:
     txt = hn_text or ""
-    date_re = r"[0-9]{1,2}[./-][0-9]{1,2}[./-][0-9]{2,4}"
-    lines = [ln.strip() for ln in txt.splitlines() if ln and ln.strip()]
-    patterns = [
-        rf"date\s+of\s+dispatch(?:\s*/\s*email)?\s*[:\-]?\s*({date_re})",
-        rf"dispatch\s+date\s*[:\-]?\s*({date_re})",
-        rf"\bdispatch(?:ed)?\s+on\s*[:\-]?\s*({date_re})",
-    ]
-    for pat in patterns:
-        m = re.search(pat, txt, re.I)
+    lines = [ln.strip() for ln in _hn_lines(txt) if ln and ln.strip()]
+    for rx in _DISPATCH_DATE_RES:
+        m = rx.search(txt)
         if m:
-            return re.sub(r"\s+", " ", m.group(1)).strip()
+            return _normalize_ws_text(m.group(1))
 
     for ln in lines[:40]:
         low = ln.lower()
         if "hearing date" in low or "date & time" in low or "time" in low:
             continue
-        if re.match(r"^date\s*[:\-]", low):
-            m = re.search(date_re, ln)
+        if _DATE_LABEL_RE.match(low):
+            m = _NUMERIC_DATE_RE.search(ln)
             if m:
-                return re.sub(r"\s+", " ", m.group(0)).strip()
-        if re.fullmatch(date_re, ln):
-            return re.sub(r"\s+", " ", ln).strip()
+                return _normalize_ws_text(m.group(0))
+        if _NUMERIC_DATE_RE.fullmatch(ln):
+            return _normalize_ws_text(ln)
 
-    m = re.search(rf"hearing\s+notice\s+(?:is\s+)?(?:dated|date)\s*[:\-]?\s*({date_re})", txt, re.I)
+    m = _HN_DATED_RE.search(txt)
     if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
+        return _normalize_ws_text(m.group(1))
 
     for ln in lines[:120]:
         low = ln.lower()
         if "dispatch" in low:
-            m = re.search(date_re, ln)
+            m = _NUMERIC_DATE_RE.search(ln)
             if m:
-                return re.sub(r"\s+", " ", m.group(0)).strip()
+                return _normalize_ws_text(m.group(0))
 
     return ""
 
 
+_LONE_NUMBER_LINE_RE = re.compile(r"(?m)^\s*\d{1,3}\s*$")
+_LEADING_LINE_NUMBER_RE = re.compile(r"(?m)^\s*\d{1,3}\s+(?=[A-Za-z\[\(])")
+_LEADING_PUA_LINE_NUMBER_RE = re.compile(r"(?m)^\s*\d{1,3}\s+(?=[\uF000-\uF8FF])")
+_INLINE_LINE_NUMBER_RE = re.compile(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])")
+_TRAILING_WORD_RE = re.compile(r"([a-z]+)\s*$")
+_LEADING_WORD_RE = re.compile(r"\s*([a-z]+)")
+_LEADING_PERCENT_RE = re.compile(r"\s*%")
+_QUANT_PREV_WORDS = frozenset({
+    "from", "to", "by", "than", "between", "over", "under", "around", "about",
+    "approximately", "approx", "minimum", "maximum", "least", "most",
+})
+_QUANT_NEXT_WORDS = frozenset({
+    "ms", "msec", "millisecond", "milliseconds", "s", "sec", "second", "seconds",
+    "min", "mins", "minute", "minutes", "hour", "hours", "hr", "hrs",
+    "hz", "khz", "mhz", "ghz", "kb", "mb", "gb", "tb", "byte", "bytes", "bit", "bits",
+    "w", "mw", "kw", "v", "mv", "a", "ma", "db", "dpi", "fps", "percent",
+    "times", "x",
+})
+
+
+def _inline_line_number_repl(m: re.Match) -> str:
+    try:
+        num = int(m.group(1))
+    except Exception:
+        return m.group(0)
+    if not (1 <= num <= 400 and num % 5 == 0):
+        return m.group(0)
+
+    # Preserve likely quantitative values (e.g., "120 ms", "15 %", "from 80 to 120").
+    s = m.string
+    left = s[max(0, m.start() - 24) : m.start()].lower()
+    right = s[m.end() : m.end() + 24].lower()
+
+    prev_word_m = _TRAILING_WORD_RE.search(left)
+    next_word_m = _LEADING_WORD_RE.match(right)
+    prev_word = prev_word_m.group(1) if prev_word_m else ""
+    next_word = next_word_m.group(1) if next_word_m else ""
+
+    if prev_word in _QUANT_PREV_WORDS or next_word in _QUANT_NEXT_WORDS:
+        return m.group(0)
+    if _LEADING_PERCENT_RE.match(right):
+        return m.group(0)
+
+    # Treat remaining inline 5-step markers as likely line-number artifacts.
+    return " "
+
+
+# Every line-number pattern above needs a 1-3 digit run with whitespace (or a text edge) on both sides.
+_LINE_NUMBER_PROBE_RE = re.compile(r"(?<!\S)\d{1,3}(?!\S)")
+
+
 def _strip_line_number_artifacts(text: str) -> str:
     t = text or ""
     if not t:
         return ""
-    t = re.sub(r"(?m)^\s*\d{1,3}\s*$", "", t)
-    t = re.sub(r"(?m)^\s*\d{1,3}\s+(?=[A-Za-z\[\(])", "", t)
-    t = re.sub(r"(?m)^\s*\d{1,3}\s+(?=[\uF000-\uF8FF])", "", t)
-
-    def repl(m: re.Match) -> str:
-        try:
-            num = int(m.group(1))
-        except Exception:
-            return m.group(0)
-        if not (1 <= num <= 400 and num % 5 == 0):
-            return m.group(0)
-
-        # Preserve likely quantitative values (e.g., "120 ms", "15 %", "from 80 to 120").
-        s = m.string
-        left = s[max(0, m.start() - 24) : m.start()].lower()
-        right = s[m.end() : m.end() + 24].lower()
-
-        prev_word_m = re.search(r"([a-z]+)\s*$", left)
-        next_word_m = re.match(r"\s*([a-z]+)", right)
-        prev_word = prev_word_m.group(1) if prev_word_m else ""
-        next_word = next_word_m.group(1) if next_word_m else ""
-
-        quant_prev_words = {
-            "from", "to", "by", "than", "between", "over", "under", "around", "about",
-            "approximately", "approx", "minimum", "maximum", "least", "most",
-        }
-        quant_next_words = {
-            "ms", "msec", "millisecond", "milliseconds", "s", "sec", "second", "seconds",
-            "min", "mins", "minute", "minutes", "hour", "hours", "hr", "hrs",
-            "hz", "khz", "mhz", "ghz", "kb", "mb", "gb", "tb", "byte", "bytes", "bit", "bits",
-            "w", "mw", "kw", "v", "mv", "a", "ma", "db", "dpi", "fps", "percent",
-            "times", "x",
-        }
-        if prev_word in quant_prev_words or next_word in quant_next_words:
-            return m.group(0)
-        if re.match(r"\s*%", right):
-            return m.group(0)
-
-        # Treat remaining inline 5-step markers as likely line-number artifacts.
-        return " "
-
-    t = re.sub(r"(?<=[A-Za-z\)])\s+(\d{1,3})\s+(?=[A-Za-z\(\[])", repl, t)
-    t = re.sub(r"[ \t]{2,}", " ", t)
-    t = re.sub(r"\n{3,}", "\n\n", t)
-    return t.strip()
+    if _LINE_NUMBER_PROBE_RE.search(t):
+        t = _LONE_NUMBER_LINE_RE.sub("", t)
+        t = _LEADING_LINE_NUMBER_RE.sub("", t)
+        t = _LEADING_PUA_LINE_NUMBER_RE.sub("", t)
+        t = _INLINE_LINE_NUMBER_RE.sub(_inline_line_number_repl, t)
+    t = _HSPACE_RUN_RE.sub(" ", t)
+    t = _EXTRA_BLANK_LINES_RE.sub("\n\n", t)
+    return t.strip()
+
+
+_PARA_MARK_LINE_RE = re.compile(r"(?m)^\s*\[\s*\d{3,6}\s*\]\s*")
+_PARA_MARK_INLINE_RE = re.compile(r"(?<=\s)\[\s*\d{3,6}\s*\]\s*")
+_PUA_PARA_MARK_LINE_RE = re.compile(r"(?m)^\s*\uf05b\s*[\uf030-\uf039]{3,6}\s*\uf05d\s*")
+_PUA_PARA_MARK_INLINE_RE = re.compile(r"(?<=\s)\uf05b\s*[\uf030-\uf039]{3,6}\s*\uf05d\s*")
 
 
 def _strip_spec_paragraph_markers(text: str) -> str:
@@ -163,12 +229,14 @@ def _strip_spec_paragraph_markers(text: str) -> str:
     if not t:
         return ""
     # Standard bracketed paragraph markers.
-    t = re.sub(r"(?m)^\s*\[\s*\d{3,6}\s*\]\s*", "", t)
-    t = re.sub(r"(?<=\s)\[\s*\d{3,6}\s*\]\s*", " ", t)
+    if "[" in t:
+        t = _PARA_MARK_LINE_RE.sub("", t)
+        t = _PARA_MARK_INLINE_RE.sub(" ", t)
     # Common private-use glyph rendering, e.g., \uf05b\uf030\uf030\uf030\uf033\uf05d
-    t = re.sub(r"(?m)^\s*\uf05b\s*[\uf030-\uf039]{3,6}\s*\uf05d\s*", "", t)
-    t = re.sub(r"(?<=\s)\uf05b\s*[\uf030-\uf039]{3,6}\s*\uf05d\s*", " ", t)
-    t = re.sub(r"[ \t]{2,}", " ", t)
+    if "\uf05b" in t:
+        t = _PUA_PARA_MARK_LINE_RE.sub("", t)
+        t = _PUA_PARA_MARK_INLINE_RE.sub(" ", t)
+    t = _HSPACE_RUN_RE.sub(" ", t)
     return t.strip()
 
 
@@ -176,75 +244,91 @@ _SPEC_PARA_MARK_RE = re.compile(
     r"(?:\[\s*\d{3,6}\s*\]|\uf05b\s*[\uf030-\uf039]{3,6}\s*\uf05d)",
     re.I,
 )
+# Page fractions, page numbers and (optionally labelled) dates; every form starts with a digit, "page" or "date".
+_NOISE_LINE_RE = re.compile(r"\d+\s*/\s*\d+|page\s*\d+(?:\s*of\s*\d+)?|(?:date\s*[:\-]\s*)?\d{1,2}[./-]\d{1,2}[./-]\d{2,4}")
+_NOISE_LINE_PREFIXES = ("page", "date")
+_HEADING_LINE_NUMBER_RE = re.compile(r"^\d{1,3}\s+(?=[A-Za-z\[\(\uF000-\uF8FF])")
+
+
+def _is_noise_line_form(low: str) -> bool:
+    if not (low[0].isdigit() or low.startswith(_NOISE_LINE_PREFIXES)):
+        return False
+    return _NOISE_LINE_RE.fullmatch(low) is not None
 
 
 def _is_spec_noise_line(line: str) -> bool:
-    ln = re.sub(r"\s+", " ", (line or "")).strip()
+    # Every whitespace run in the noise forms is matched by \s, so collapsing runs first is not needed.
+    ln = (line or "").strip()
     if not ln:
         return True
     low = ln.lower()
-    if re.fullmatch(r"\d+\s*/\s*\d+", low):
-        return True
-    if re.fullmatch(r"page\s*\d+(\s*of\s*\d+)?", low):
-        return True
-    if re.fullmatch(r"date\s*[:\-]\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-        return True
-    if re.fullmatch(r"\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-        return True
     if "(cid:" in low:
         return True
-    return False
+    return _is_noise_line_form(low)
 
 
-def _line_heading_remainder(line: str, heading_patterns: List[str]) -> Tuple[bool, str]:
-    ln = re.sub(r"\s+", " ", (line or "")).strip()
-    ln = re.sub(r"^\d{1,3}\s+(?=[A-Za-z\[\(\uF000-\uF8FF])", "", ln)
+@lru_cache(maxsize=64)
+def _compile_heading_alt(patterns: Tuple[str, ...]) -> re.Pattern[str]:
+    """One anchored regex for a heading list; alternatives keep the list's first-match order."""
+    alt = "|".join(f"(?:{p})" for p in patterns)
+    return re.compile(rf"^(?:{alt})\s*:?\s*(.*)$", re.I)
+
+
+@lru_cache(maxsize=64)
+def _compile_embedded_heading_alt(patterns: Tuple[str, ...]) -> re.Pattern[str]:
+    alt = "|".join(f"(?:{p})" for p in patterns)
+    return re.compile(rf"(?<=[\.;:])\s+(?=(?:{alt})(?:\s*[:\-]|\b))", re.I)
+
+
+def _line_heading_remainder(ln: str, heading_re: re.Pattern[str]) -> Tuple[bool, str]:
+    # ln is already whitespace-collapsed (see _spec_section_lines).
+    ln = _HEADING_LINE_NUMBER_RE.sub("", ln)
     if not ln:
         return False, ""
-    for pat in heading_patterns:
-        m = re.match(rf"^(?:{pat})\s*:?\s*(.*)$", ln, re.I)
-        if m:
-            return True, (m.group(1) or "").strip()
+    m = heading_re.match(ln)
+    if m:
+        return True, (m.group(m.lastindex) or "").strip()
     return False, ""
 
 
-def _line_matches_heading(line: str, heading_patterns: List[str]) -> bool:
-    ok, _ = _line_heading_remainder(line, heading_patterns)
+def _line_matches_heading(ln: str, heading_re: re.Pattern[str]) -> bool:
+    ok, _ = _line_heading_remainder(ln, heading_re)
     return ok
 
 
-def _line_prefix_before_embedded_heading(line: str, heading_patterns: List[str]) -> Optional[str]:
-    ln = re.sub(r"\s+", " ", (line or "")).strip()
+def _line_prefix_before_embedded_heading(ln: str, embedded_re: re.Pattern[str]) -> Optional[str]:
     if not ln:
         return None
 
-    cut_positions: List[int] = []
-    for pat in heading_patterns:
-        m = re.search(
-            rf"(?<=[\.;:])\s+(?=(?:{pat})(?:\s*[:\-]|\b))",
-            ln,
-            re.I,
-        )
-        if m:
-            cut_positions.append(m.start())
-    if not cut_positions:
+    # The leftmost match over the alternation is the earliest cut any single heading would give.
+    m = embedded_re.search(ln)
+    if not m:
         return None
 
-    cut = min(cut_positions)
-    prefix = ln[:cut].strip()
+    prefix = ln[: m.start()].strip()
     return prefix if prefix else None
 
 
-def _extract_spec_section_block(spec_text: str, start_headings: List[str], end_headings: List[str]) -> str:
+@lru_cache(maxsize=4)
+def _spec_section_lines(txt: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Right-stripped and whitespace-collapsed lines of a spec, split once for all section lookups."""
+    lines = tuple(ln.rstrip() for ln in txt.splitlines())
+    return lines, tuple(" ".join(ln.split()) for ln in lines)
+
+
+def _extract_spec_section_block(spec_text: str, start_headings: Tuple[str, ...], end_headings: Tuple[str, ...]) -> str:
     txt = spec_text or ""
     if not txt.strip():
         return ""
 
-    lines = [ln.rstrip() for ln in txt.splitlines()]
+    start_re = _compile_heading_alt(tuple(start_headings))
+    end_re = _compile_heading_alt(tuple(end_headings))
+    end_embedded_re = _compile_embedded_heading_alt(tuple(end_headings))
+    lines, collapsed = _spec_section_lines(txt)
     start_idx = -1
     start_tail = ""
-    for i, ln in enumerate(lines):
-        ok, tail = _line_heading_remainder(ln, start_headings)
+    for i, ln in enumerate(collapsed):
+        ok, tail = _line_heading_remainder(ln, start_re)
         if ok:
             start_idx = i
             start_tail = tail
@@ -255,10 +339,10 @@ def _extract_spec_section_block(spec_text: str, start_headings: List[str], end_h
     end_idx = len(lines)
     end_line_prefix = ""
     for j in range(start_idx + 1, len(lines)):
-        if _line_matches_heading(lines[j], end_headings):
+        if _line_matches_heading(collapsed[j], end_re):
             end_idx = j
             break
-        prefix = _line_prefix_before_embedded_heading(lines[j], end_headings)
+        prefix = _line_prefix_before_embedded_heading(collapsed[j], end_embedded_re)
         if prefix is not None:
             end_idx = j
             end_line_prefix = prefix
@@ -280,9 +364,9 @@ def _extract_spec_section_block(spec_text: str, start_headings: List[str], end_h
             continue
         if _is_spec_noise_line(ln):
             continue
-        norm = re.sub(r"[ \t]+", " ", ln).rstrip()
-        norm = re.sub(r"^\s*\d{1,3}\s+(?=[A-Za-z\[\(])", "", norm)
-        norm = re.sub(r"^\s*\d{1,3}\s+(?=[\uF000-\uF8FF])", "", norm)
+        norm = _HSPACE_RE.sub(" ", ln).rstrip()
+        norm = _LEADING_LINE_NUMBER_RE.sub("", norm)
+        norm = _LEADING_PUA_LINE_NUMBER_RE.sub("", norm)
         norm = norm.strip()
         if not norm:
             continue
@@ -299,28 +383,31 @@ def _format_spec_block_for_ws(block: str) -> str:
 
     lines = []
     for raw in txt.splitlines():
-        ln = re.sub(r"\s+", " ", raw).strip()
+        ln = _normalize_ws_text(raw)
         if not ln:
             lines.append("")
             continue
+        if "[" not in ln and "\uf05b" not in ln:
+            lines.append(ln)
+            continue
         # If marker appears inline, split so each marker starts a new logical line.
-        ln = re.sub(_SPEC_PARA_MARK_RE, lambda m: f"\n{m.group(0)} ", ln)
+        ln = _SPEC_PARA_MARK_RE.sub(lambda m: f"\n{m.group(0)} ", ln)
         for part in ln.splitlines():
             lines.append(part.strip())
 
     paras: List[str] = []
-    cur = ""
+    # Pieces of the paragraph being built; joined once on flush instead of re-concatenating per line.
+    cur: List[str] = []
 
     def flush() -> None:
-        nonlocal cur
         if cur:
-            p = cur.strip()
-            p = re.sub(r"\s+([,.;:])", r"\1", p)
-            p = re.sub(r"\(\s+", "(", p)
-            p = re.sub(r"\s+\)", ")", p)
+            p = "".join(cur).strip()
+            cur.clear()
+            p = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", p)
+            p = _SPACE_AFTER_OPEN_PAREN_RE.sub("(", p)
+            p = _SPACE_BEFORE_CLOSE_PAREN_RE.sub(")", p)
             if p:
                 paras.append(p)
-            cur = ""
 
     for ln in lines:
         if not ln:
@@ -338,12 +425,13 @@ def _format_spec_block_for_ws(block: str) -> str:
         if not ln:
             continue
         if cur:
-            if cur.endswith("-"):
-                cur = cur[:-1] + ln
+            if cur[-1].endswith("-"):
+                cur[-1] = cur[-1][:-1]
+                cur.append(ln)
             else:
-                cur += " " + ln
+                cur.append(" " + ln)
         else:
-            cur = ln
+            cur.append(ln)
     flush()
 
     return "\n\n".join(paras).strip()
@@ -353,12 +441,12 @@ def _extract_tech_problem(spec_text: str) -> str:
     """Copy BACKGROUND OF INVENTION section text (without generated wording)."""
     block = _extract_spec_section_block(
         spec_text,
-        start_headings=[
+        start_headings=(
             r"BACKGROUND\s+OF\s+THE\s+INVENTION",
             r"BACKGROUND\s+OF\s+INVENTION",
             r"BACKGROUND",
-        ],
-        end_headings=[
+        ),
+        end_headings=(
             r"SUMMARY\s+OF\s+THE\s+INVENTION",
             r"SUMMARY\s+OF\s+THE\s+DISCLOSURE",
             r"SUMMARY",
@@ -369,7 +457,7 @@ def _extract_tech_problem(spec_text: str) -> str:
             r"DETAILED\s+DESCRIPTION\b",
             r"BRIEF\s+DESCRIPTION(?:\s+OF\s+DRAWINGS?)?",
             r"CLAIMS?",
-        ],
+        ),
     )
     return _format_spec_block_for_ws(block)
 
@@ -378,13 +466,13 @@ def _extract_tech_solution(spec_text: str) -> str:
     """Copy SUMMARY section text (without generated wording)."""
     block = _extract_spec_section_block(
         spec_text,
-        start_headings=[
+        start_headings=(
             r"SUMMARY\s+OF\s+THE\s+INVENTION",
             r"SUMMARY\s+OF\s+THE\s+DISCLOSURE",
             r"SUMMARY",
             r"BRIEF\s+SUMMARY",
-        ],
-        end_headings=[
+        ),
+        end_headings=(
             r"BRIEF\s+DESCRIPTION(?:\s+OF\s+DRAWINGS?)?",
             r"DETAILED\s+DESCRIPTION\b",
             r"CLAIMS?",
@@ -394,13 +482,13 @@ def _extract_tech_solution(spec_text: str) -> str:
             r"DATED\s+THIS\b",
             r"SIGNATURE\b",
             r"PATENT\s+AGENT\b",
-        ],
+        ),
     )
     return _format_spec_block_for_ws(block)
 
 
 def _split_ws_paragraphs(text: str) -> List[str]:
-    return [p.strip() for p in re.split(r"\n{2,}", text or "") if p and p.strip()]
+    return [p.strip() for p in _PARA_BREAK_RE.split(text or "") if p and p.strip()]
 
 
 _TECH_EFFECT_KW_RE = re.compile(
@@ -447,20 +535,19 @@ _TECH_QUANT_RE = re.compile(
 )
 
 
-def _is_quantitative_effect_para(paragraph: str) -> bool:
-    p = paragraph or ""
-    return bool(_TECH_QUANT_RE.search(p) and _TECH_EFFECT_KW_RE.search(p))
-
-
 def _is_quantitative_para(paragraph: str) -> bool:
     return bool(_TECH_QUANT_RE.search(paragraph or ""))
 
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.;!?])\s+(?=[A-Z\[])")
+_FIGURE_CAPTION_RE = re.compile(r"^\s*(?:fig(?:ure)?\.?\s*\d+)\b", re.I)
+
+
 def _quantitative_sentences_from_para(paragraph: str) -> List[str]:
-    txt = re.sub(r"\s+", " ", (paragraph or "")).strip()
+    txt = _normalize_ws_text(paragraph)
     if not txt:
         return []
-    parts = re.split(r"(?<=[\.;!?])\s+(?=[A-Z\[])", txt)
+    parts = _SENTENCE_SPLIT_RE.split(txt)
     out = []
     for s in parts:
         seg = s.strip()
@@ -470,7 +557,7 @@ def _quantitative_sentences_from_para(paragraph: str) -> List[str]:
 
 
 def _is_tech_effect_boilerplate_para(paragraph: str) -> bool:
-    low = re.sub(r"\s+", " ", (paragraph or "")).strip().lower()
+    low = _normalize_ws_text(paragraph).lower()
     if not low:
         return True
     if "for purposes of illustration and description" in low:
@@ -485,29 +572,29 @@ def _is_tech_effect_boilerplate_para(paragraph: str) -> bool:
 
 
 def _is_figure_caption_like_para(paragraph: str) -> bool:
-    txt = re.sub(r"\s+", " ", (paragraph or "")).strip()
+    txt = _normalize_ws_text(paragraph)
     if not txt:
         return False
-    return bool(re.match(r"^\s*(?:fig(?:ure)?\.?\s*\d+)\b", txt, re.I))
+    return bool(_FIGURE_CAPTION_RE.match(txt))
 
 
 def _extract_tech_effect(spec_text: str) -> str:
     """Extract technical effect strictly from DETAILED DESCRIPTION OF INVENTION."""
     block = _extract_spec_section_block(
         spec_text,
-        start_headings=[
+        start_headings=(
             r"DETAILED\s+DESCRIPTION\s+OF\s+THE\s+INVENTION",
             r"DETAILED\s+DESCRIPTION\s+OF\s+INVENTION",
             r"DETAILED\s+DESCRIPTION",
             r"DESCRIPTION\s+OF\s+THE\s+INVENTION",
-        ],
-        end_headings=[
+        ),
+        end_headings=(
             r"CLAIMS?",
             r"ABSTRACT",
             r"WE\s+CLAIM",
             r"WHAT\s+IS\s+CLAIMED",
             r"STATEMENT\s+OF\s+CLAIMS?",
-        ],
+        ),
     )
     formatted = _format_spec_block_for_ws(block)
     if not formatted:
@@ -517,17 +604,19 @@ def _extract_tech_effect(spec_text: str) -> str:
     if not paras:
         return ""
 
-    quant_effect_idxs = [i for i, p in enumerate(paras) if _is_quantitative_effect_para(p)]
+    # Each paragraph is tested once; effect wording and caption shape only matter for quantitative ones.
     quant_idxs = [i for i, p in enumerate(paras) if _is_quantitative_para(p)]
     if not quant_idxs:
         return ""
+    effect_idxs = {i for i in quant_idxs if _TECH_EFFECT_KW_RE.search(paras[i])}
+    caption_idxs = {i for i in quant_idxs if _is_figure_caption_like_para(paras[i])}
 
     # Prefer quantitative+effect paragraphs, then add other quantitative paragraphs.
     seed_order = (
-        [i for i in quant_effect_idxs if not _is_figure_caption_like_para(paras[i])]
-        + [i for i in quant_idxs if i not in quant_effect_idxs and not _is_figure_caption_like_para(paras[i])]
-        + [i for i in quant_effect_idxs if _is_figure_caption_like_para(paras[i])]
-        + [i for i in quant_idxs if i not in quant_effect_idxs and _is_figure_caption_like_para(paras[i])]
+        [i for i in quant_idxs if i in effect_idxs and i not in caption_idxs]
+        + [i for i in quant_idxs if i not in effect_idxs and i not in caption_idxs]
+        + [i for i in quant_idxs if i in effect_idxs and i in caption_idxs]
+        + [i for i in quant_idxs if i not in effect_idxs and i in caption_idxs]
     )
     selected: List[int] = []
 
@@ -551,25 +640,38 @@ def _extract_tech_effect(spec_text: str) -> str:
 
     out_paras: List[str] = []
     for idx in sorted(selected)[:4]:
-        para = re.sub(r"\s+", " ", paras[idx]).strip()
+        para = _normalize_ws_text(paras[idx])
         if len(para) > 900:
             para = _sentence_safe_excerpt(para, max_chars=650, max_chars_hard=900)
         out_paras.append(para)
     return "\n\n".join(out_paras).strip()
 
 
+# Each 3(k) passage runs from its opening phrase up to the first stop phrase after it (or the end of
+# the text). Searching for the stop phrase separately is equivalent to a lazy `.*?(?=stop|\Z)` tail,
+# without re-testing the lookahead at every character of the passage.
+_REPLY_3K_METHOD_CLAIMS_RE = re.compile(r"Claims\s+1-10\s+are\s+method\s+claims", re.I)
+_REPLY_3K_METHOD_CLAIMS_STOP_RE = re.compile(r"Therefore,\s*the\s*claims\s*1-\s*10|Therefore,\s*the\s*claims\s*1-11", re.I)
+_REPLY_3K_CLAUSE_K_RE = re.compile(r"prima\s+facie\s+falls\s+within\s+scope\s+of\s+clause\s*\(k\)", re.I)
+_REPLY_3K_CLAUSE_K_STOP_RE = re.compile(r"Therefore,", re.I)
+
+
+def _passage_until(text: str, head_re: re.Pattern[str], stop_re: re.Pattern[str]) -> Optional[str]:
+    m = head_re.search(text)
+    if not m:
+        return None
+    stop = stop_re.search(text, m.end())
+    return text[m.start() : stop.start() if stop else len(text)]
+
+
 def _extract_reply_3k(hn_text: str) -> str:
     """Capture the examiner's 3(k) reasoning from the hearing notice text."""
-    m = re.search(
-        r"Claims\s+1-10\s+are\s+method\s+claims.*?(?=Therefore,\s*the\s*claims\s*1-\s*10|Therefore,\s*the\s*claims\s*1-11|\Z)",
-        hn_text,
-        re.I | re.S,
-    )
-    if m:
-        return re.sub(r"\s+", " ", m.group(0)).strip()[:1800]
-    m = re.search(r"prima\s+facie\s+falls\s+within\s+scope\s+of\s+clause\s*\(k\).*?(?=Therefore,|\Z)", hn_text, re.I | re.S)
-    if m:
-        return re.sub(r"\s+", " ", m.group(0)).strip()[:1800]
+    passage = _passage_until(hn_text, _REPLY_3K_METHOD_CLAIMS_RE, _REPLY_3K_METHOD_CLAIMS_STOP_RE)
+    if passage is not None:
+        return _normalize_ws_text(passage)[:1800]
+    passage = _passage_until(hn_text, _REPLY_3K_CLAUSE_K_RE, _REPLY_3K_CLAUSE_K_STOP_RE)
+    if passage is not None:
+        return _normalize_ws_text(passage)[:1800]
     return ""
 
 
@@ -591,16 +693,23 @@ def _detect_nonpat_and_3k_presence(source_text: str, nonpat_block: str) -> Tuple
     return has_nonpat, has_3k_reference
 
 
-def _agent_from_drawings(drawings_path: Optional[str]) -> str:
-    if not drawings_path:
+_DRAWINGS_AGENT_RE = re.compile(r"\n\s*([A-Z][A-Za-z ]+?)\s*\n\s*Patent\s+Agent")
+
+
+def _agent_from_drawings(drawings_path: Optional[str], drawings_text: Optional[str] = None) -> str:
+    """Agent name above the "Patent Agent" line; pass drawings_text when the caller already read the PDF."""
+    if drawings_text is not None:
+        txt = drawings_text
+    elif not drawings_path:
         return ""
-    try:
-        txt = read_pdf_text(drawings_path)
-    except Exception:
-        return ""
-    m = re.search(r"\n\s*([A-Z][A-Za-z ]+?)\s*\n\s*Patent\s+Agent", txt)
+    else:
+        try:
+            txt = read_pdf_text(drawings_path)
+        except Exception:
+            return ""
+    m = _DRAWINGS_AGENT_RE.search(txt)
     if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
+        return _normalize_ws_text(m.group(1))
     return ""
 
 
@@ -608,27 +717,83 @@ def _format_ws_date_today() -> str:
     return datetime.now().strftime("%d-%m-%Y")
 
 
+_COMPRISING_SPLIT_RE = re.compile(r"^(.*?\bcomprising\b\s*:?)\s*(.*)$", re.I)
+_WHEREIN_SPLIT_RE = re.compile(r"\s*(?=\bwherein\b)", re.I)
+_FEATURE_SPLIT_RE = re.compile(r"\s*,\s*|\s+\band\b\s+|\s+\bhaving\b\s+", re.I)
+_NON_WORD_RE = re.compile(r"\W+")
+_ASCII_NON_WORD_DELETE = {c: None for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+
+
+def _ascii_word_positions(low: str, word: str) -> Iterator[int]:
+    """Start offsets of `word` in lower-cased ASCII text where it is bounded by non-word characters."""
+    n = len(word)
+    i = low.find(word)
+    while i >= 0:
+        j = i + n
+        before = low[i - 1] if i else " "
+        after = low[j] if j < len(low) else " "
+        if not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_"):
+            yield i
+        i = low.find(word, i + 1)
+
+
+def _split_claim_preamble(txt: str) -> Optional[Tuple[str, str]]:
+    """(preamble through "comprising[:]", remainder) of a whitespace-collapsed claim, or None."""
+    if not txt.isascii():
+        m = _COMPRISING_SPLIT_RE.search(txt)
+        return (m.group(1), m.group(2)) if m else None
+    i = next(_ascii_word_positions(txt.lower(), "comprising"), -1)
+    if i < 0:
+        return None
+    j = i + len("comprising")
+    if txt.startswith(" ", j):
+        j += 1
+    if txt.startswith(":", j):
+        j += 1
+    k = j + 1 if txt.startswith(" ", j) else j
+    return txt[:j], txt[k:]
+
+
+def _split_wherein_clauses(rest: str) -> List[str]:
+    """Split a whitespace-collapsed claim body before each "wherein" (head first, then one part per clause)."""
+    if not rest.isascii():
+        return [p for i, p in enumerate(_WHEREIN_SPLIT_RE.split(rest)) if i == 0 or p.strip()]
+    cuts = list(_ascii_word_positions(rest.lower(), "wherein"))
+    if not cuts:
+        return [rest]
+    parts = [rest[: cuts[0]]]
+    parts.extend(rest[a:b] for a, b in zip(cuts, cuts[1:] + [len(rest)]))
+    return parts
+
+
+def _feature_key(feature: str) -> str:
+    low = feature.lower()
+    if low.isascii():
+        return low.translate(_ASCII_NON_WORD_DELETE)
+    return _NON_WORD_RE.sub("", low)
+
+
 def _build_claim1_features(claim1_text: str) -> str:
     """Build preamble + key features text for the left table column."""
     if not claim1_text:
         return ""
-    txt = re.sub(r"\s+", " ", claim1_text).strip().rstrip(".")
+    txt = " ".join(claim1_text.split()).rstrip(".")
 
-    m = re.search(r"^(.*?\bcomprising\b\s*:?)\s*(.*)$", txt, re.I)
-    if not m:
+    split = _split_claim_preamble(txt)
+    if split is None:
         return txt + "."
 
-    preamble = m.group(1).strip()
-    rest = m.group(2).strip()
+    preamble = split[0].strip()
+    rest = split[1].strip()
     if len(rest) < 120:
         return f"{preamble}\n{rest}."
 
-    wherein_parts = re.split(r"\s*(?=\bwherein\b)", rest, flags=re.I)
+    wherein_parts = _split_wherein_clauses(rest)
     head = wherein_parts[0].strip(" ;,")
     wherein_clauses = [p.strip(" ;,") for p in wherein_parts[1:] if p.strip()]
 
     features = []
-    head_parts = re.split(r"\s*,\s*|\s+\band\b\s+|\s+\bhaving\b\s+", head, flags=re.I)
+    head_parts = _FEATURE_SPLIT_RE.split(head)
     head_parts = [p.strip() for p in head_parts if p and len(p.strip()) > 8]
     for hp in head_parts[:4]:
         features.append(hp)
@@ -638,7 +803,7 @@ def _build_claim1_features(claim1_text: str) -> str:
     seen = set()
     cleaned = []
     for f in features:
-        key = re.sub(r"\W+", "", f.lower())
+        key = _feature_key(f)
         if key and key not in seen:
             seen.add(key)
             cleaned.append(f)
@@ -655,15 +820,21 @@ def _lowercase_first_alpha(text: str) -> str:
     return text
 
 
+_CLAIM_NUMBER_PREFIX_RE = re.compile(r"^\s*\d+\.\s*")
+_WHEREIN_CLAUSE_RE = re.compile(r"(?i)^the\s+.+?\bwherein\b\s+(.+)$")
+_COMPRISING_CLAUSE_RE = re.compile(r"(?i)^the\s+.+?\bcomprising\b\s+(.+)$")
+_SENTENCE_END_RE = re.compile(r"[.!?]$")
+
+
 def _claim_to_prose_sentence(claim_no: int, claim_text: str) -> str:
     txt = _normalize_ws_text(claim_text)
     if not txt:
         return ""
-    txt = re.sub(r"^\s*\d+\.\s*", "", txt).strip()
+    txt = _CLAIM_NUMBER_PREFIX_RE.sub("", txt).strip()
     txt = txt.rstrip(" ;:")
 
-    where_m = re.match(r"(?i)^the\s+.+?\bwherein\b\s+(.+)$", txt)
-    comp_m = re.match(r"(?i)^the\s+.+?\bcomprising\b\s+(.+)$", txt)
+    where_m = _WHEREIN_CLAUSE_RE.match(txt)
+    comp_m = _COMPRISING_CLAUSE_RE.match(txt)
 
     if where_m:
         sentence = f"Claim {claim_no} recites that {where_m.group(1).strip()}"
@@ -672,8 +843,8 @@ def _claim_to_prose_sentence(claim_no: int, claim_text: str) -> str:
     else:
         sentence = f"Claim {claim_no} recites that {txt}"
 
-    sentence = re.sub(r"\s+", " ", sentence).strip()
-    if not re.search(r"[.!?]$", sentence):
+    sentence = _normalize_ws_text(sentence)
+    if not _SENTENCE_END_RE.search(sentence):
         sentence += "."
     return sentence
 
@@ -695,10 +866,14 @@ def _build_amended_claims_n_block(claims: Dict[int, str]) -> str:
     return " ".join(prose_parts).strip()
 
 
+_DX_LABEL_LINE_RE = re.compile(r"\s*(D\d+)\s*:", re.I)
+_DX_LABEL_RE = re.compile(r"D(\d+)")
+
+
 def _dx_labels_from_prior_arts_text(prior_arts_text: str) -> List[str]:
     labs = []
     for ln in (prior_arts_text or "").splitlines():
-        m = re.match(r"\s*(D\d+)\s*:", ln.strip(), flags=re.I)
+        m = _DX_LABEL_LINE_RE.match(ln.strip())
         if m:
             d = m.group(1).upper()
             if d not in labs:
@@ -706,20 +881,26 @@ def _dx_labels_from_prior_arts_text(prior_arts_text: str) -> List[str]:
     return labs
 
 
+def _dx_number(label: str) -> Optional[int]:
+    """Number of a D-label from its decimal digits (D3 -> 3), or None when it has none."""
+    tail = label[1:]
+    digits = tail if label[:1] == "D" and tail.isdecimal() else "".join(ch for ch in label if ch.isdecimal())
+    return int(digits) if digits else None
+
+
+def _dx_numbers(labels: List[str]) -> List[int]:
+    return sorted({n for n in map(_dx_number, labels) if n is not None})
+
+
 def _dx_range_string(labels: List[str]) -> str:
     """Return D-range text, e.g. D1-D3 or D1, D3."""
     if not labels:
         return ""
-    nums = []
-    for d in labels:
-        try:
-            nums.append(int(re.sub(r"\D", "", d)))
-        except Exception:
-            pass
-    nums = sorted(set(nums))
+    nums = _dx_numbers(labels)
     if not nums:
         return ""
-    if nums == list(range(nums[0], nums[-1] + 1)) and len(nums) >= 2:
+    # nums is sorted and unique, so it is contiguous exactly when its span equals its length.
+    if len(nums) >= 2 and nums[-1] - nums[0] + 1 == len(nums):
         return f"D{nums[0]}-D{nums[-1]}"
     if len(nums) == 1:
         return f"D{nums[0]}"
@@ -730,13 +911,7 @@ def _dx_and_string(labels: List[str]) -> str:
     """Return D-join text, e.g. D1 and D2 / D1, D2 and D3."""
     if not labels:
         return ""
-    nums = []
-    for d in labels:
-        try:
-            nums.append(int(re.sub(r"\D", "", d)))
-        except Exception:
-            pass
-    nums = sorted(set(nums))
+    nums = _dx_numbers(labels)
     ds = [f"D{n}" for n in nums] if nums else labels
     if len(ds) == 1:
         return ds[0]
@@ -746,7 +921,11 @@ def _dx_and_string(labels: List[str]) -> str:
 
 
 def _normalize_ws_text(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return " ".join(s.split()) if s else ""
+
+
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.;!?](?:\s|$)")
+_TRAILING_PARTIAL_WORD_RE = re.compile(r"\s+\S*$")
 
 
 def _sentence_safe_excerpt(text: str, max_chars: int = 260, max_chars_hard: int = 420) -> str:
@@ -757,7 +936,7 @@ def _sentence_safe_excerpt(text: str, max_chars: int = 260, max_chars_hard: int
     if len(txt) <= max_chars:
         return txt
 
-    boundaries = [m.end() for m in re.finditer(r"[.;!?](?:\s|$)", txt)]
+    boundaries = [m.end() for m in _SENTENCE_BOUNDARY_RE.finditer(txt)]
     if boundaries:
         after = [b for b in boundaries if max_chars <= b <= max_chars_hard]
         if after:
@@ -768,34 +947,43 @@ def _sentence_safe_excerpt(text: str, max_chars: int = 260, max_chars_hard: int
 
     # Fallback: cut at nearest word boundary.
     cut = txt[:max_chars]
-    cut = re.sub(r"\s+\S*$", "", cut).strip()
+    cut = _TRAILING_PARTIAL_WORD_RE.sub("", cut).strip()
     return cut or txt[:max_chars].strip()
 
 
-def _normalize_prior_art_entries(prior_arts_entries: Optional[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
-    """Normalize incoming prior-art entries and assign stable D-labels."""
-    normalized: List[Dict[str, str]] = []
-    used_nums: set[int] = set()
-    next_num = 1
+def _normalize_prior_art_entries(
+    prior_arts_entries: Optional[List[Union[PriorArtEntry, Dict[str, Any]]]],
+) -> List[Dict[str, str]]:
+    """Normalize incoming prior-art entries and assign stable D-labels."""
+    normalized: List[Tuple[int, Dict[str, str]]] = []
+    used_nums: set[int] = set()
+    next_num = 1
 
     for raw in prior_arts_entries or []:
-        if not isinstance(raw, dict):
+        if isinstance(raw, dict):
+            # Legacy dict payloads are still accepted.
+            raw = PriorArtEntry(
+                label=str(raw.get("label", "")),
+                abstract=str(raw.get("abstract", "")),
+                prior_art_pdf_path=str(raw.get("prior_art_pdf_path", "")),
+                diagram_image_path=str(raw.get("diagram_image_path", "")),
+            )
+        elif not isinstance(raw, PriorArtEntry):
             continue
 
-        raw_label = str(raw.get("label", "")).strip().upper()
-        m = re.fullmatch(r"D(\d+)", raw_label)
+        raw_label = raw.label.strip().upper()
+        m = _DX_LABEL_RE.fullmatch(raw_label)
         num = int(m.group(1)) if m else 0
+        # next_num is always above every label handed out so far, so it is free.
         if num <= 0 or num in used_nums:
-            while next_num in used_nums:
-                next_num += 1
             num = next_num
 
         used_nums.add(num)
         next_num = max(next_num, num + 1)
 
-        abstract = _normalize_ws_text(str(raw.get("abstract", "")))
-        prior_art_pdf_path = _normalize_ws_text(str(raw.get("prior_art_pdf_path", "")))
-        diagram_image_path = _normalize_ws_text(str(raw.get("diagram_image_path", "")))
+        abstract = _normalize_ws_text(raw.abstract)
+        prior_art_pdf_path = _normalize_ws_text(raw.prior_art_pdf_path)
+        diagram_image_path = _normalize_ws_text(raw.diagram_image_path)
         if not abstract and prior_art_pdf_path:
             try:
                 abstract = _normalize_ws_text(extract_prior_art_abstract(prior_art_pdf_path))
@@ -807,16 +995,19 @@ def _normalize_prior_art_entries(prior_arts_entries: Optional[List[Dict[str, Any
             continue
 
         normalized.append(
-            {
-                "label": f"D{num}",
-                "abstract": abstract,
-                "diagram_image_path": diagram_image_path,
-                "prior_art_pdf_path": prior_art_pdf_path,
-            }
+            (
+                num,
+                {
+                    "label": f"D{num}",
+                    "abstract": abstract,
+                    "diagram_image_path": diagram_image_path,
+                    "prior_art_pdf_path": prior_art_pdf_path,
+                },
+            )
         )
 
-    normalized.sort(key=lambda e: int(re.sub(r"\D", "", e["label"]) or "0"))
-    return normalized
+    normalized.sort(key=lambda p: p[0])
+    return [e for _, e in normalized]
 
 
 def _build_prior_arts_list_from_entries(prior_arts: List[Dict[str, str]]) -> str:
@@ -839,24 +1030,35 @@ def _build_disclosure_from_entries(prior_arts: List[Dict[str, str]]) -> str:
     return "\n".join(lines)
 
 
+_FOLLOWING_OBJECTIONS_RE = re.compile(r"following\s+objections\s*:", re.I)
+_FOLLOWING_OBJECTIONS_END_RE = re.compile(r"following\s+objections\s*:\s*$", re.I)
+_DX_COLON_BREAK_RE = re.compile(r"\s+(D\d+\s*:)", re.I)
+_DOCUMENT_DX_BREAK_RE = re.compile(r"\s+((?:Similarly,\s*)?Document\s+D\d+\b)", re.I)
+_DX_COLON_START_RE = re.compile(r"^D\d+\s*:", re.I)
+_DOCUMENT_DX_START_RE = re.compile(r"^(?:Similarly,\s*)?Document\s+D\d+\b", re.I)
+_NUMBERED_ITEM_RE = re.compile(r"^\s*\d+\s*[\.\)]")
+
+
 def _compact_objection_chunk(chunk: str) -> str:
     def _join_wrapped(lines: List[str]) -> str:
         if not lines:
             return ""
-        acc = lines[0]
+        # Lines are non-empty, so the last piece always carries the text's current last character.
+        pieces = [lines[0]]
         for ln in lines[1:]:
-            if acc.endswith("-"):
-                acc = acc[:-1] + ln
-            elif acc.endswith("/") or acc.endswith("("):
-                acc += ln
-            else:
-                acc += " " + ln
-        acc = re.sub(r"\s+([,.;:])", r"\1", acc)
-        acc = re.sub(r"\(\s+", "(", acc)
-        acc = re.sub(r"\s+\)", ")", acc)
+            last = pieces[-1]
+            if last.endswith("-"):
+                pieces[-1] = last[:-1]
+            elif not last.endswith(("/", "(")):
+                pieces.append(" ")
+            pieces.append(ln)
+        acc = "".join(pieces)
+        acc = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", acc)
+        acc = _SPACE_AFTER_OPEN_PAREN_RE.sub("(", acc)
+        acc = _SPACE_BEFORE_CLOSE_PAREN_RE.sub(")", acc)
         return acc.strip()
 
-    raw = [re.sub(r"[ \t]+", " ", ln).strip() for ln in (chunk or "").splitlines()]
+    raw = [_HSPACE_RE.sub(" ", ln).strip() for ln in (chunk or "").splitlines()]
     raw = [ln for ln in raw if ln is not None]
     if not raw:
         return ""
@@ -880,26 +1082,29 @@ def _compact_objection_chunk(chunk: str) -> str:
                 out.append("")
             continue
         expanded = ln
-        if re.search(r"following\s+objections\s*:", expanded, re.I):
-            expanded = re.sub(r"\s+(D\d+\s*:)", r"\n\1", expanded, flags=re.I)
-        expanded = re.sub(r"\s+((?:Similarly,\s*)?Document\s+D\d+\b)", r"\n\1", expanded, flags=re.I)
+        # Literal gates: "follow" and "document" have no case-insensitive look-alikes outside str.lower().
+        low = ln.lower()
+        if "follow" in low and _FOLLOWING_OBJECTIONS_RE.search(expanded):
+            expanded = _DX_COLON_BREAK_RE.sub(r"\n\1", expanded)
+        if "document" in low:
+            expanded = _DOCUMENT_DX_BREAK_RE.sub(r"\n\1", expanded)
 
         for part in [p.strip() for p in expanded.splitlines() if p and p.strip()]:
-            if para_buf and re.search(r"following\s+objections\s*:\s*$", para_buf[-1], re.I):
+            if para_buf and _FOLLOWING_OBJECTIONS_END_RE.search(para_buf[-1]):
                 flush_para()
-            if re.match(r"^D\d+\s*:", part, re.I):
+            if _DX_COLON_START_RE.match(part):
                 flush_para()
                 out.append(part)
                 continue
-            if re.match(r"^(?:Similarly,\s*)?Document\s+D\d+\b", part, re.I):
+            if _DOCUMENT_DX_START_RE.match(part):
                 flush_para()
-            if re.match(r"^\d+\s*[\.\)]", part) and para_buf:
+            if _NUMBERED_ITEM_RE.match(part) and para_buf:
                 flush_para()
             para_buf.append(part)
 
     flush_para()
     text = "\n".join(out).strip()
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXTRA_BLANK_LINES_RE.sub("\n\n", text)
     return text
 
 
@@ -910,12 +1115,15 @@ def _strip_nonpat_heading(chunk: str) -> str:
     return "\n".join(lines).strip()
 
 
+_DRAFTER_REPLY_HEADING_RE = re.compile(r"^(Formal\s+Requirement(?:s)?|Clarity\s+and\s+Conciseness)\b", re.I)
+
+
 def _inject_reply_by_drafter_tag(chunk: str) -> str:
     lines = [ln.rstrip() for ln in (chunk or "").splitlines()]
     if not lines:
         return ""
-    heading = re.sub(r"\s+", " ", lines[0]).strip()
-    if not re.match(r"^(Formal\s+Requirement(?:s)?|Clarity\s+and\s+Conciseness)\b", heading, re.I):
+    heading = _normalize_ws_text(lines[0])
+    if not _DRAFTER_REPLY_HEADING_RE.match(heading):
         return chunk.strip()
     for ln in lines:
         if ln.strip().upper() == "[REPLY BY DRAFTER]":
@@ -925,29 +1133,35 @@ def _inject_reply_by_drafter_tag(chunk: str) -> str:
     return "\n".join(lines + ["[REPLY BY DRAFTER]"]).strip()
 
 
+_SENTENCE_PUNCT_RE = re.compile(r"[.;!?]")
+_PROSE_OPENER_RE = re.compile(r"^(?:The|This|That|Please|In|On|At|For|As)\b", re.I)
+_HEADING_WORD_RE = re.compile(r"[A-Za-z][A-Za-z/&()\-]*")
+_UPPER_ALPHA_RE = re.compile(r"[A-Z]")
+
+
 def _looks_generic_hn_side_heading(line: str) -> bool:
-    ln = re.sub(r"\s+", " ", (line or "").strip())
+    ln = _normalize_ws_text(line)
     if not ln:
         return False
     core = ln.rstrip(":").strip()
     if not core or len(core) > 90:
         return False
-    if re.search(r"\d", core):
+    if _DIGIT_RE.search(core):
         return False
-    if re.search(r"[.;!?]", core):
+    if _SENTENCE_PUNCT_RE.search(core):
         return False
-    if re.match(r"^(?:The|This|That|Please|In|On|At|For|As)\b", core, re.I):
+    if _PROSE_OPENER_RE.match(core):
         return False
-    words = re.findall(r"[A-Za-z][A-Za-z/&()\-]*", core)
+    words = _HEADING_WORD_RE.findall(core)
     if not words or len(words) > 8:
         return False
     title_like = sum(1 for w in words if w and w[0].isupper()) >= max(1, int(len(words) * 0.7))
-    upper_like = core == core.upper() and bool(re.search(r"[A-Z]", core))
+    upper_like = core == core.upper() and bool(_UPPER_ALPHA_RE.search(core))
     return bool(title_like or upper_like)
 
 
 def _is_numbered_objection_line(line: str) -> bool:
-    return bool(re.match(r"^\s*\d+\s*[\.\)]", (line or "").strip()))
+    return bool(_NUMBERED_ITEM_RE.match((line or "").strip()))
 
 
 def _is_generic_objection_heading_at(lines: List[str], idx: int, start_scan_idx: int) -> bool:
@@ -966,29 +1180,31 @@ def _is_generic_objection_heading_at(lines: List[str], idx: int, start_scan_idx:
     return False
 
 
+_HN_HEADING_PAT = (
+    r"(?:Non[-\s]?Patentability(?:\s*u/s\s*3(?:\s*\(k\))?)?|Section\s*3(?:\s*\(k\))?|"
+    r"Clarity\s+and\s+Conciseness|Definitiveness|Definiteness|Formal\s+Requirement(?:s)?|"
+    r"Scope|Invention\s+u/s\b|Other\s+Requirement(?:s)?|Prior\s+Art|Novelty|Inventive\s+Step)"
+)
+_HN_EMBEDDED_HEADING_SPLIT_RE = re.compile(
+    rf"(?<=[\.;:])\s+(?="
+    rf"(?:{_HN_HEADING_PAT})(?:\s*[:\-]|\b)|"
+    rf"[A-Z][A-Za-z/&()\-]*(?:\s+[A-Z][A-Za-z/&()\-]*){{0,6}}\s+\d+\s*[\.\)])",
+    re.I,
+)
+_HN_SIDE_HEADING_ITEM_RE = re.compile(
+    r"^([A-Za-z][A-Za-z/&()\-]*(?:\s+[A-Za-z][A-Za-z/&()\-]*){0,6})\s+(\d+\s*[\.\)].*)$"
+)
+
+
 def _split_hn_line_on_embedded_headings(line: str) -> List[str]:
-    ln = re.sub(r"[ \t]+", " ", (line or "")).strip()
+    ln = _HSPACE_RE.sub(" ", (line or "")).strip()
     if not ln:
         return []
 
-    heading_pat = (
-        r"(?:Non[-\s]?Patentability(?:\s*u/s\s*3(?:\s*\(k\))?)?|Section\s*3(?:\s*\(k\))?|"
-        r"Clarity\s+and\s+Conciseness|Definitiveness|Definiteness|Formal\s+Requirement(?:s)?|"
-        r"Scope|Invention\s+u/s\b|Other\s+Requirement(?:s)?|Prior\s+Art|Novelty|Inventive\s+Step)"
-    )
-    parts = re.split(
-        rf"(?<=[\.;:])\s+(?="
-        rf"(?:{heading_pat})(?:\s*[:\-]|\b)|"
-        rf"[A-Z][A-Za-z/&()\-]*(?:\s+[A-Z][A-Za-z/&()\-]*){{0,6}}\s+\d+\s*[\.\)])",
-        ln,
-        flags=re.I,
-    )
+    parts = _HN_EMBEDDED_HEADING_SPLIT_RE.split(ln)
     out: List[str] = []
     for raw in [p.strip() for p in parts if p and p.strip()]:
-        m = re.match(
-            r"^([A-Za-z][A-Za-z/&()\-]*(?:\s+[A-Za-z][A-Za-z/&()\-]*){0,6})\s+(\d+\s*[\.\)].*)$",
-            raw,
-        )
+        m = _HN_SIDE_HEADING_ITEM_RE.match(raw)
         if m and _looks_generic_hn_side_heading(m.group(1)):
             out.append(m.group(1).strip())
             out.append(m.group(2).strip())
@@ -997,13 +1213,37 @@ def _split_hn_line_on_embedded_headings(line: str) -> List[str]:
     return out
 
 
+# Every _heading_type form starts with one of these words once leading whitespace is skipped; lines
+# that do not are never headings, so only the candidates found here get the full check.
+_HEADING_CANDIDATE_RE = re.compile(
+    r"^[^\S\n]*(?:non|section|clarity|defini|formal|scope|invent|other|prior|novelty)",
+    re.I | re.M,
+)
+
+
+def _heading_kinds(lines: List[str]) -> Dict[int, str]:
+    """Map line index -> _heading_type for the heading lines, scanning the joined text once."""
+    joined = "\n".join(lines)
+    kinds: Dict[int, str] = {}
+    idx = 0
+    pos = 0
+    for m in _HEADING_CANDIDATE_RE.finditer(joined):
+        idx += joined.count("\n", pos, m.start())
+        pos = m.start()
+        kind = _heading_type(lines[idx])
+        if kind:
+            kinds[idx] = kind
+    return kinds
+
+
+@lru_cache(maxsize=_HN_CACHE_SIZE)
 def _extract_objection_blocks_from_hn(hn_text: str) -> Tuple[str, str]:
     """Return (objections_without_nonpat, nonpat_objection) from HN."""
     txt = (hn_text or "").strip()
     if not txt:
         return "", ""
 
-    raw_lines = [ln.rstrip() for ln in txt.splitlines()]
+    raw_lines = [ln.rstrip() for ln in _hn_lines(txt)]
     lines: List[str] = []
     for ln in raw_lines:
         split_parts = _split_hn_line_on_embedded_headings(ln)
@@ -1012,11 +1252,11 @@ def _extract_objection_blocks_from_hn(hn_text: str) -> Tuple[str, str]:
         else:
             lines.append(ln)
 
-    known_heading_indices = [i for i, ln in enumerate(lines) if _heading_type(ln)]
-    start_scan_idx = known_heading_indices[0] if known_heading_indices else 0
+    kinds = _heading_kinds(lines)
+    start_scan_idx = min(kinds) if kinds else 0
     heading_indices: List[int] = []
-    for i, ln in enumerate(lines):
-        if _heading_type(ln):
+    for i in range(len(lines)):
+        if i in kinds:
             heading_indices.append(i)
             continue
         if _is_generic_objection_heading_at(lines, i, start_scan_idx):
@@ -1028,7 +1268,7 @@ def _extract_objection_blocks_from_hn(hn_text: str) -> Tuple[str, str]:
     nonpat_chunks: List[str] = []
     for i, start in enumerate(heading_indices):
         end = heading_indices[i + 1] if i + 1 < len(heading_indices) else len(lines)
-        section_kind = _heading_type(lines[start]) or "section"
+        section_kind = kinds.get(start) or "section"
         chunk_lines = []
         for ln in lines[start:end]:
             if _is_hn_noise_line(ln):
@@ -1055,33 +1295,52 @@ def _extract_reply_to_objection_block_from_hn(hn_text: str) -> str:
     return main_block
 
 
+# Group 1 is a non-patentability heading, group 2 any other objection section heading.
+_HEADING_TYPE_RE = re.compile(
+    r"^(?:"
+    r"((?:Non[-\s]?Patentability(?:\s*u/s\s*3(?:\s*\(k\))?)?|Section\s*3(?:\s*\(k\))?)(?:\s*[:\-].*)?)|"
+    r"((?:"
+    r"Clarity\s+and\s+Conciseness|"
+    r"Definitiveness|"
+    r"Definiteness|"
+    r"Formal\s+Requirement(?:s)?|"
+    r"Scope|"
+    r"Invention\s+u/s\b.*|"
+    r"Other\s+Requirement(?:s)?|"
+    r"Prior\s+Art|"
+    r"Novelty|"
+    r"Inventive\s+Step"
+    r")\b.*)"
+    r")$",
+    re.I,
+)
+_OF_THE_RE = re.compile(r"\bof\s+the\b", re.I)
+
+
 def _heading_type(line: str) -> str:
-    ln = re.sub(r"\s+", " ", (line or "").strip())
+    ln = _normalize_ws_text(line)
     if not ln or len(ln) > 120:
         return ""
 
-    if re.match(r"^(?:Non[-\s]?Patentability(?:\s*u/s\s*3(?:\s*\(k\))?)?|Section\s*3(?:\s*\(k\))?)(?:\s*[:\-].*)?$", ln, re.I):
-        if re.search(r"\bof\s+the\b", ln, re.I) and ":" not in ln:
+    m = _HEADING_TYPE_RE.match(ln)
+    if not m:
+        return ""
+    if m.lastindex == 1:
+        if _OF_THE_RE.search(ln) and ":" not in ln:
             return ""
         return "nonpat"
-    if re.match(
-        r"^(?:"
-        r"Clarity\s+and\s+Conciseness|"
-        r"Definitiveness|"
-        r"Definiteness|"
-        r"Formal\s+Requirement(?:s)?|"
-        r"Scope|"
-        r"Invention\s+u/s\b.*|"
-        r"Other\s+Requirement(?:s)?|"
-        r"Prior\s+Art|"
-        r"Novelty|"
-        r"Inventive\s+Step"
-        r")\b.*$",
-        ln,
-        re.I,
-    ):
-        return "section"
-    return ""
+    return "section"
+
+
+_ASSISTANT_CONTROLLER_RE = re.compile(r"assistant\s+controller\s+of\s+patents")
+_OUTSTANDING_OBJECTIONS_RE = re.compile(r"\bthe\s+following\s+objection\(s\)\s+are\s+still\s+outstanding\b")
+
+
+def _has_many_nonascii(ln: str, thresh: int = 8) -> bool:
+    if ln.isascii():
+        return False
+    # Encoding with "ignore" drops exactly the non-ASCII characters, counted in C.
+    return len(ln) - len(ln.encode("ascii", "ignore")) > thresh
 
 
 def _is_hn_noise_line(line: str) -> bool:
@@ -1091,19 +1350,13 @@ def _is_hn_noise_line(line: str) -> bool:
     low = ln.lower()
     if "(cid:" in low:
         return True
-    if re.fullmatch(r"\d+\s*/\s*\d+", low):
+    if _is_noise_line_form(low):
         return True
-    if re.fullmatch(r"page\s*\d+(\s*of\s*\d+)?", low):
+    if "controller" in low and _ASSISTANT_CONTROLLER_RE.search(low):
         return True
-    if re.search(r"assistant\s+controller\s+of\s+patents", low):
+    if "outstanding" in low and _OUTSTANDING_OBJECTIONS_RE.search(low):
         return True
-    if re.search(r"\bthe\s+following\s+objection\(s\)\s+are\s+still\s+outstanding\b", low):
-        return True
-    if re.fullmatch(r"date\s*[-:]\s*\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-        return True
-    if re.fullmatch(r"\d{1,2}[./-]\d{1,2}[./-]\d{2,4}", low):
-        return True
-    if sum(1 for ch in ln if ord(ch) > 127) > 8:
+    if _has_many_nonascii(ln):
         return True
     return False
 
@@ -1150,38 +1403,53 @@ def _build_prior_art_analysis_sequence(prior_arts: List[Dict[str, str]], claim1_
     return sequence
 
 
+_CLOCK_TIME_RE = re.compile(r"\d{1,2}:\d{2}")
+
+
 def generate_written_submission(
     hn_path: str,
     specification_path: str,
-    prior_arts_entries: Optional[List[Dict[str, Any]]] = None,
+    prior_arts_entries: Optional[List[Union[PriorArtEntry, Dict[str, Any]]]] = None,
     drawings_path: Optional[str] = None,
     amended_claims_path: Optional[str] = None,
     tech_solution_images_paths: Optional[list] = None,
     city: str = "Chennai",
     filed_on_input: str = "",
+    out_dir: Optional[str] = None,
 ):
     """Generate WS using HN + specification + manually provided prior-arts."""
-    hn_meta = parse_case_meta_from_fer_or_hn(hn_path)
-    hn_text = read_pdf_text(hn_path)
-    formal_objections_reply, nonpat_objection_reply = _extract_objection_blocks_from_hn(hn_text)
-    formal_objections_reply = formal_objections_reply or ""
-
-    spec_text = read_text_any(specification_path)
-    fig_desc_map = extract_figure_descriptions_from_spec(spec_text)
-
-    prior_arts = _normalize_prior_art_entries(prior_arts_entries)
-    if not prior_arts:
-        raise ValueError("At least one prior-art entry (D1..Dn) is required.")
-
-    prior_arts_list = _build_prior_arts_list_from_entries(prior_arts)
-    dx_labels = [pa["label"] for pa in prior_arts]
-    dx_range = _dx_range_string(dx_labels)
-    dx_and = _dx_and_string(dx_labels)
-    d1d2_disclosure = _build_disclosure_from_entries(prior_arts)
-
-    claims: Dict[int, str] = {}
-    if amended_claims_path:
-        claims = parse_amended_claims(amended_claims_path)
+    # The spec and amended-claims reads don't depend on the HN, so they run while it is parsed.
+    # Results are collected where they were read before, so errors still surface in the same order.
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        spec_future = pool.submit(read_text_any, specification_path)
+        claims_future = pool.submit(parse_amended_claims, amended_claims_path) if amended_claims_path else None
+
+        hn_meta = parse_case_meta_from_fer_or_hn(hn_path)
+        hn_text = read_pdf_text(hn_path)
+        formal_objections_reply, nonpat_objection_reply = _extract_objection_blocks_from_hn(hn_text)
+        formal_objections_reply = formal_objections_reply or ""
+
+        spec_text = spec_future.result()
+        fig_desc_map = extract_figure_descriptions_from_spec(spec_text)
+
+        prior_arts = _normalize_prior_art_entries(prior_arts_entries)
+        if not prior_arts:
+            raise ValueError("At least one prior-art entry (D1..Dn) is required.")
+
+        prior_arts_list = _build_prior_arts_list_from_entries(prior_arts)
+        dx_labels = [pa["label"] for pa in prior_arts]
+        dx_range = _dx_range_string(dx_labels)
+        dx_and = _dx_and_string(dx_labels)
+        d1d2_disclosure = _build_disclosure_from_entries(prior_arts)
+
+        claims: Dict[int, str] = {}
+        if claims_future is not None:
+            claims = claims_future.result()
+    finally:
+        # Wait for a read already in progress so an early failure never leaves it running
+        # against a scratch dir the caller is about to delete.
+        pool.shutdown(wait=True, cancel_futures=True)
     if not claims:
         claims = parse_claims_from_specification(spec_text)
 
@@ -1208,7 +1476,7 @@ def generate_written_submission(
 
     hearing_date = _first_nonempty(hn_meta.hearing_date)
     hearing_time = _first_nonempty(hn_meta.hearing_time)
-    if hearing_time and re.fullmatch(r"\d{1,2}:\d{2}", hearing_time.strip()):
+    if hearing_time and _CLOCK_TIME_RE.fullmatch(hearing_time.strip()):
         hearing_time_fmt = f"{hearing_time} HRS (IST)"
     else:
         hearing_time_fmt = hearing_time or ""
@@ -1308,8 +1576,9 @@ def generate_written_submission(
     mapping["__PRIOR_ART_SEQUENCE__"] = prior_art_analysis_sequence
     mapping["__USE_DYNAMIC_NONPAT_3K_BLOCK__"] = use_dynamic_non_3k_block
 
-    out_dir = os.path.join(tempfile.gettempdir(), "ws_tool_outputs")
-    os.makedirs(out_dir, exist_ok=True)
+    if not out_dir:
+        out_dir = os.path.join(tempfile.gettempdir(), "ws_tool_outputs")
+        os.makedirs(out_dir, exist_ok=True)
 
     safe_app = _sanitize_filename(hn_meta.app_no or "APP")
     out_name = f"Written_Submission_{safe_app}.docx"
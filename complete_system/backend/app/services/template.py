@@ -1,20 +1,59 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
 
-def _replace_runs_in_paragraph(p: Paragraph, mapping: Dict[str, str]) -> None:
+_PLACEHOLDER_KEY_RE = re.compile(r"\{\{[^{}]+\}\}")
+
+_CENTERED_P_XML = '<w:p %s><w:pPr><w:jc w:val="center"/></w:pPr>{run}</w:p>' % nsdecls("w")
+_TEXT_RUN_XML = "<w:r>{rpr}<w:t>{text}</w:t></w:r>"
+_RED_RPR_XML = '<w:rPr><w:color w:val="FF0000"/></w:rPr>'
+_DIAGRAM_REPLY_TEXT = "[Enter Description of the diagram]"
+
+
+def _centered_paragraph_element(text: str = "", red: bool = False):
+    """A centred paragraph with at most one run, parsed in one go instead of set up through python-docx.
+
+    Only for short fixed captions: the text must not need w:br/w:tab or xml:space handling.
+    """
+    run = _TEXT_RUN_XML.format(rpr=_RED_RPR_XML if red else "", text=escape(text)) if text else ""
+    return parse_xml(_CENTERED_P_XML.format(run=run))
+
+
+def _placeholder_pattern(mapping: Dict[str, str]) -> Optional[re.Pattern[str]]:
+    """One alternation over every {{...}} key, so each run is scanned once rather than once per key."""
+    keys = [k for k in mapping if isinstance(k, str) and _PLACEHOLDER_KEY_RE.fullmatch(k)]
+    if not keys:
+        return None
+    return re.compile("|".join(map(re.escape, keys)))
+
+
+def _replace_runs_in_paragraph(p: Paragraph, pattern: re.Pattern[str], mapping: Dict[str, str]) -> None:
+    # p.text contains every run's text, so a paragraph without a match has no run to rewrite.
+    if not pattern.search(p.text or ""):
+        return
     for run in p.runs:
-        for k, v in mapping.items():
-            if k in run.text:
-                run.text = run.text.replace(k, v)
+        text = run.text
+        if not pattern.search(text):
+            continue
+        new_text = pattern.sub(lambda m: mapping[m.group(0)], text)
+        if "{{" in new_text:
+            # A value brought in another placeholder: replace key by key, in mapping order, as before.
+            new_text = text
+            for k, v in mapping.items():
+                if k in new_text:
+                    new_text = new_text.replace(k, v)
+        run.text = new_text
 
 
 def _iter_paragraphs_in_doc(doc: Document):
@@ -27,53 +66,88 @@ def _iter_paragraphs_in_doc(doc: Document):
                     yield p
 
 
-def _replace_block_placeholder_with_paragraphs(doc: Document, placeholder: str, value: str) -> None:
-    """Replace a placeholder paragraph with multiple paragraphs split by blank lines."""
-    blocks: List[str] = [b.strip() for b in re.split(r"\n{2,}", value or "") if b and b.strip()]
-    for p in list(_iter_paragraphs_in_doc(doc)):
+def _split_blocks(text: str) -> List[str]:
+    """Non-empty, stripped blocks separated by blank lines.
+
+    Matches a split on \\n{2,}: extra newlines only leave empty pieces or piece edges, which are stripped.
+    """
+    return [b.strip() for b in (text or "").split("\n\n") if b.strip()]
+
+
+def _first_paragraphs_with(doc: Document, placeholders: Tuple[str, ...]) -> Dict[str, Paragraph]:
+    """First paragraph (in _iter_paragraphs_in_doc order) containing each placeholder, from one walk."""
+    found: Dict[str, Paragraph] = {}
+    for p in _iter_paragraphs_in_doc(doc):
         full = p.text or ""
-        if placeholder not in full:
+        if "{{" not in full:
             continue
+        for placeholder in placeholders:
+            if placeholder not in found and placeholder in full:
+                found[placeholder] = p
+        if len(found) == len(placeholders):
+            break
+    return found
 
-        if not blocks:
-            p.text = full.replace(placeholder, "").strip()
-            return
 
-        from docx.oxml import OxmlElement
+def _replace_block_placeholder_with_paragraphs(
+    doc: Document,
+    placeholder: str,
+    value: str,
+    paragraph: Optional[Paragraph] = None,
+) -> bool:
+    """Replace a placeholder paragraph with multiple paragraphs split by blank lines.
 
-        style = p.style
-        align = p.alignment
-        before, after = full.split(placeholder, 1)
+    `paragraph` is the first paragraph containing the placeholder, when the caller already knows it.
+    Returns True if the rewrite may have moved or introduced other placeholders.
+    """
+    blocks = _split_blocks(value)
+    p = paragraph
+    if p is None:
+        p = next((q for q in _iter_paragraphs_in_doc(doc) if placeholder in (q.text or "")), None)
+        if p is None:
+            return False
 
-        first_text = (before or "").strip()
-        if first_text:
-            first_text = f"{first_text}\n{blocks[0]}"
-        else:
-            first_text = blocks[0]
-
-        p.text = first_text
-        p.style = style
-        p.alignment = align
-
-        anchor = p
-        for block in blocks[1:]:
-            el = OxmlElement("w:p")
-            anchor._p.addnext(el)
-            np = Paragraph(el, anchor._parent)
-            np.style = style
-            np.alignment = align
-            np.text = block
-            anchor = np
-
-        tail = (after or "").strip()
-        if tail:
-            el = OxmlElement("w:p")
-            anchor._p.addnext(el)
-            np = Paragraph(el, anchor._parent)
-            np.style = style
-            np.alignment = align
-            np.text = tail
-        return
+    full = p.text or ""
+    moved = "{{" in (value or "") or "{{" in full.replace(placeholder, "")
+    if not blocks:
+        p.text = full.replace(placeholder, "").strip()
+        return moved
+
+    from docx.oxml import OxmlElement
+
+    style = p.style
+    align = p.alignment
+    before, after = full.split(placeholder, 1)
+
+    first_text = (before or "").strip()
+    if first_text:
+        first_text = f"{first_text}\n{blocks[0]}"
+    else:
+        first_text = blocks[0]
+
+    p.text = first_text
+    p.style = style
+    p.alignment = align
+
+    anchor = p
+    for block in blocks[1:]:
+        el = OxmlElement("w:p")
+        anchor._p.addnext(el)
+        np = Paragraph(el, anchor._parent)
+        np.style = style
+        np.alignment = align
+        np.text = block
+        anchor = np
+
+    tail = (after or "").strip()
+    if tail:
+        el = OxmlElement("w:p")
+        anchor._p.addnext(el)
+        np = Paragraph(el, anchor._parent)
+        np.style = style
+        np.alignment = align
+        np.text = tail
+    return moved
 
 
 def _insert_table_after(paragraph: Paragraph, rows: int, cols: int) -> Table:
@@ -83,35 +157,44 @@ def _insert_table_after(paragraph: Paragraph, rows: int, cols: int) -> Table:
     return tbl
 
 
-def ensure_feature_table(doc: Document, claim1_text: str, d1d2_text: str) -> None:
+def _find_feature_table(doc: Document) -> Optional[Table]:
+    for t in doc.tables:
+        try:
+            if t.cell(0, 0).text.strip().lower() == "applicant claimed feature":
+                return t
+        except Exception:
+            continue
+    return None
+
+
+def ensure_feature_table(doc: Document, claim1_text: str, d1d2_text: str) -> Optional[Table]:
     """Ensure the 'Applicant claimed feature vs D1-D2 disclosed features' table exists.
 
     V3 requirement: table must never be missing.
     Strategy:
       1) If template includes {{FEATURE_TABLE}} marker -> replace it with a table.
       2) Else insert the table right after the paragraph containing {{AMENDED_CLAIM_1}}.
+    Returns the feature table (existing or new), or None if the document has none.
     """
     marker_p: Optional[Paragraph] = None
     claim1_p: Optional[Paragraph] = None
 
     for p in doc.paragraphs:
-        if "{{FEATURE_TABLE}}" in p.text:
+        text = p.text
+        if "{{FEATURE_TABLE}}" in text:
             marker_p = p
             break
-        if "{{AMENDED_CLAIM_1}}" in p.text:
+        if "{{AMENDED_CLAIM_1}}" in text:
             claim1_p = p
 
     anchor = marker_p or claim1_p
     if anchor is None:
-        return
+        return _find_feature_table(doc)
 
     # If the table already exists, do nothing.
-    for t in doc.tables:
-        try:
-            if t.cell(0, 0).text.strip().lower() == "applicant claimed feature":
-                return
-        except Exception:
-            continue
+    existing = _find_feature_table(doc)
+    if existing is not None:
+        return existing
 
     tbl = _insert_table_after(anchor, rows=2, cols=2)
     tbl.cell(0, 0).text = "Applicant claimed feature"
@@ -122,10 +205,15 @@ def ensure_feature_table(doc: Document, claim1_text: str, d1d2_text: str) -> Non
     # Remove marker paragraph if present
     if marker_p is not None:
         marker_p.text = ""
+    return tbl
+
+
+_COMBINED_DIFF_RE = re.compile(r"^\s*Combined\s+difference\s+over\b", re.I)
 
 
 def insert_prior_art_analysis_before_feature_table(
     doc: Document,
+    feature_table: Optional[Table],
     analysis_text: str,
     diagram_images: Optional[list] = None,
     analysis_sequence: Optional[list] = None,
@@ -137,15 +225,6 @@ def insert_prior_art_analysis_before_feature_table(
     if not txt and not images and not sequence:
         return
 
-    feature_table: Optional[Table] = None
-    for t in doc.tables:
-        try:
-            if t.cell(0, 0).text.strip().lower() == "applicant claimed feature":
-                feature_table = t
-                break
-        except Exception:
-            continue
-
     if feature_table is None:
         return
 
@@ -159,6 +238,11 @@ def insert_prior_art_analysis_before_feature_table(
             p.text = text
         return p
 
+    def _insert_image_paragraph_before_table() -> Paragraph:
+        p_el = _centered_paragraph_element()
+        feature_table._tbl.addprevious(p_el)  # type: ignore[attr-defined]
+        return Paragraph(p_el, feature_table._parent)
+
     def _insert_text_before_table(text: str, make_red: bool = False) -> None:
         p = _insert_paragraph_before_table()
         run = p.add_run(text)
@@ -174,8 +258,7 @@ def insert_prior_art_analysis_before_feature_table(
                 img_path = str(item.get("path", "")).strip()
                 if not img_path:
                     continue
-                img_p = _insert_paragraph_before_table()
-                img_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                img_p = _insert_image_paragraph_before_table()
                 try:
                     img_p.add_run().add_picture(img_path, width=Inches(5.8))
                 except Exception:
@@ -183,13 +266,13 @@ def insert_prior_art_analysis_before_feature_table(
             else:
                 text = str(item.get("text", "")).strip()
                 if text:
-                    is_combined_diff = bool(re.match(r"^\s*Combined\s+difference\s+over\b", text, re.I))
+                    is_combined_diff = bool(_COMBINED_DIFF_RE.match(text))
                     _insert_text_before_table(text=text, make_red=is_combined_diff)
         return
 
     if txt:
-        for block in [b.strip() for b in re.split(r"\n{2,}", txt) if b and b.strip()]:
-            is_combined_diff = bool(re.match(r"^\s*Combined\s+difference\s+over\b", block, re.I))
+        for block in _split_blocks(txt):
+            is_combined_diff = bool(_COMBINED_DIFF_RE.match(block))
             _insert_text_before_table(text=block, make_red=is_combined_diff)
 
     for item in images:
@@ -200,8 +283,7 @@ def insert_prior_art_analysis_before_feature_table(
         if not img_path:
             continue
 
-        img_p = _insert_paragraph_before_table()
-        img_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        img_p = _insert_image_paragraph_before_table()
         try:
             img_p.add_run().add_picture(img_path, width=Inches(5.8))
         except Exception:
@@ -209,6 +291,9 @@ def insert_prior_art_analysis_before_feature_table(
             continue
 
 
+_CLAIM_SECTION_RE = re.compile(r'^\s*Regarding\s+Claim\s+(\d+)\s*:\s*$', re.I)
+
+
 def remove_empty_claim_sections(doc: Document, max_claim_number: int) -> None:
     """Remove 'Regarding Claim N' sections for claims that don't exist.
     
@@ -218,43 +303,32 @@ def remove_empty_claim_sections(doc: Document, max_claim_number: int) -> None:
     if max_claim_number >= 10:
         return  # All template sections are valid
     
-    paragraphs_to_remove = []
+    # doc.paragraphs rebuilds its list on every access; nothing is removed until the scan is done.
+    paras = list(doc.paragraphs)
+    paragraphs_to_remove: List[Paragraph] = []
     i = 0
-    while i < len(doc.paragraphs):
-        p = doc.paragraphs[i]
+    while i < len(paras):
+        p = paras[i]
         # Check if this is a "Regarding Claim N:" heading
-        match = re.match(r'^\s*Regarding\s+Claim\s+(\d+)\s*:\s*$', p.text, re.I)
+        match = _CLAIM_SECTION_RE.match(p.text)
         if match:
             claim_num = int(match.group(1))
             # If this claim number doesn't exist, mark this paragraph and the next one for removal
             if claim_num > max_claim_number:
-                paragraphs_to_remove.append(i)
+                paragraphs_to_remove.append(p)
                 # The next paragraph contains the claim text, remove it too
-                if i + 1 < len(doc.paragraphs):
-                    paragraphs_to_remove.append(i + 1)
+                if i + 1 < len(paras):
+                    paragraphs_to_remove.append(paras[i + 1])
                     i += 1  # Skip the next paragraph since we're removing it
         i += 1
     
-    # Remove paragraphs in reverse order to maintain indices
-    for idx in reversed(paragraphs_to_remove):
-        p = doc.paragraphs[idx]
+    for p in reversed(paragraphs_to_remove):
         p._element.getparent().remove(p._element)
 
 
-def _style_reply_by_drafter_marker(doc: Document) -> None:
-    marker = "[REPLY BY DRAFTER]"
-    for p in _iter_paragraphs_in_doc(doc):
-        full = p.text or ""
-        if marker not in full:
-            continue
-        parts = full.split(marker)
-        p.text = ""
-        for i, seg in enumerate(parts):
-            if seg:
-                p.add_run(seg)
-            if i < len(parts) - 1:
-                r = p.add_run(marker)
-                r.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+_WS_RE = re.compile(r"\s+")
+_TECH_SOLUTION_HEADING_RE = re.compile(r"^TECHNICAL\s+SOLUTION\s+SOLVED\s+BY\s+THE\s+INVENITON\s*:?\s*$", re.I)
+_FURTHER_SUBMITS_RE = re.compile(r"^The\s+Applicant\s+further\s+submits\b", re.I)
 
 
 def _rewrite_nonpat_3k_section_to_dynamic_block(doc: Document) -> None:
@@ -267,15 +341,11 @@ def _rewrite_nonpat_3k_section_to_dynamic_block(doc: Document) -> None:
     end_idx = len(paras)
 
     for i, p in enumerate(paras):
-        txt = re.sub(r"\s+", " ", (p.text or "").strip())
-        if tech_solution_heading_idx < 0 and re.match(
-            r"^TECHNICAL\s+SOLUTION\s+SOLVED\s+BY\s+THE\s+INVENITON\s*:?\s*$",
-            txt,
-            re.I,
-        ):
+        txt = _WS_RE.sub(" ", (p.text or "").strip())
+        if tech_solution_heading_idx < 0 and _TECH_SOLUTION_HEADING_RE.match(txt):
             tech_solution_heading_idx = i
             continue
-        if tech_solution_heading_idx >= 0 and re.match(r"^The\s+Applicant\s+further\s+submits\b", txt, re.I):
+        if tech_solution_heading_idx >= 0 and _FURTHER_SUBMITS_RE.match(txt):
             end_idx = i
             break
 
@@ -311,36 +381,46 @@ def _rewrite_nonpat_3k_section_to_dynamic_block(doc: Document) -> None:
         anchor = np
 
 
+_HEADING_RE = re.compile(
+    r"^(?:"
+    r"Applicant Submission|REPLY TO OBJECTION|STATEMENT REGARDING SUBSTANCE OF HEARING|"
+    r"Formal Requirement(?:\(s\)|s)?|Clarity and Conciseness|Definitiveness|Definiteness|"
+    r"Invention\s+u/s\b.*|Other Requirement(?:\(s\)|s)?|Prior Art|Novelty|Inventive Step|"
+    r"NON-PATENTABILITY U/S 3|TECHNICAL ADVANCEMENT|TECHNICAL PROBLEM SOLVED BY THE INVENITON|"
+    r"TECHNICAL SOLUTION SOLVED BY THE INVENITON|Technical Effect|Regarding Claim \d+|"
+    r"Yours faithfully|Enclosure"
+    r")\s*:?\s*$",
+    re.I,
+)
+_UPPER_LETTER_RE = re.compile(r"[A-Z]")
+# Lower-cased leading words of every _HEADING_RE alternative.
+_HEADING_PREFIXES = (
+    "applicant", "reply", "statement", "formal", "clarity", "defini", "invention", "other",
+    "prior", "novelty", "inventive", "non-patent", "technical", "regarding", "yours", "enclosure",
+)
+
+
 def _is_heading_or_side_heading_line(line: str) -> bool:
-    t = re.sub(r"\s+", " ", (line or "")).strip()
+    t = _WS_RE.sub(" ", (line or "")).strip()
     if not t:
         return False
     if len(t) > 180:
         return False
 
-    # Standalone headings and sub-headings.
-    if re.match(
-        r"^(?:"
-        r"Applicant Submission|REPLY TO OBJECTION|STATEMENT REGARDING SUBSTANCE OF HEARING|"
-        r"Formal Requirement(?:\(s\)|s)?|Clarity and Conciseness|Definitiveness|Definiteness|"
-        r"Invention\s+u/s\b.*|Other Requirement(?:\(s\)|s)?|Prior Art|Novelty|Inventive Step|"
-        r"NON-PATENTABILITY U/S 3|TECHNICAL ADVANCEMENT|TECHNICAL PROBLEM SOLVED BY THE INVENITON|"
-        r"TECHNICAL SOLUTION SOLVED BY THE INVENITON|Technical Effect|Regarding Claim \d+|"
-        r"Yours faithfully|Enclosure"
-        r")\s*:?\s*$",
-        t,
-        re.I,
-    ):
+    # Standalone headings and sub-headings. re.I also folds a few non-ASCII letters
+    # (e.g. the long s), so only ASCII lines can be rejected on their prefix alone.
+    if (not t.isascii() or t.lower().startswith(_HEADING_PREFIXES)) and _HEADING_RE.match(t):
         return True
 
     # Pure uppercase heading lines.
-    if t == t.upper() and re.search(r"[A-Z]", t):
+    if t == t.upper() and _UPPER_LETTER_RE.search(t):
         return True
 
     return False
 
 
-def _style_headings_and_side_headings(doc: Document) -> None:
+def _style_headings_and_side_headings(paragraphs: List[Paragraph]) -> None:
+    """Bold/underline heading lines and colour the drafter marker red, in one pass."""
     marker = "[REPLY BY DRAFTER]"
 
     def _append_line(paragraph: Paragraph, line_text: str, is_heading: bool):
@@ -366,7 +446,7 @@ def _style_headings_and_side_headings(doc: Document) -> None:
                 last_run = mrun
         return last_run
 
-    for p in _iter_paragraphs_in_doc(doc):
+    for p in paragraphs:
         full = p.text or ""
         if not full.strip():
             continue
@@ -374,21 +454,41 @@ def _style_headings_and_side_headings(doc: Document) -> None:
         lines = full.split("\n")
         has_multiline = len(lines) > 1
         if has_multiline:
-            if not any(_is_heading_or_side_heading_line(ln) for ln in lines) and marker not in full:
+            headings = [_is_heading_or_side_heading_line(ln) for ln in lines]
+            if not any(headings) and marker not in full:
                 continue
             p.text = ""
-            for i, ln in enumerate(lines):
-                is_heading = _is_heading_or_side_heading_line(ln)
-                last = _append_line(p, ln, is_heading)
-                if i < len(lines) - 1:
+            n = len(lines)
+            i = 0
+            while i < n:
+                j = i + 1
+                if marker not in lines[i]:
+                    # Consecutive lines with the same styling share one run; add_run turns "\n" into w:br.
+                    while j < n and headings[j] == headings[i] and marker not in lines[j]:
+                        j += 1
+                last = _append_line(p, "\n".join(lines[i:j]), headings[i])
+                if j < n:
                     if last is None:
                         last = p.add_run("")
                     last.add_break()
+                i = j
             continue
 
+        if marker in full:
+            # Plain segments around red markers; heading styling below then covers the marker runs too.
+            parts = full.split(marker)
+            p.text = ""
+            for i, seg in enumerate(parts):
+                if seg:
+                    p.add_run(seg)
+                if i < len(parts) - 1:
+                    r = p.add_run(marker)
+                    r.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+
         if _is_heading_or_side_heading_line(full):
             for run in p.runs:
-                if run.text and run.text.strip():
+                text = run.text
+                if text and text.strip():
                     run.font.bold = True
                     run.font.underline = True
 
@@ -401,38 +501,40 @@ def replace_placeholders(doc_path: str, out_path: str, mapping: Dict[str, str])
 
     # Ensure feature table BEFORE replacement, so anchor placeholders exist.
     # Use compact 'preamble + features' for the table (preferred), falling back to full Claim 1.
-    ensure_feature_table(
+    feature_table = ensure_feature_table(
         doc,
         claim1_text=mapping.get("{{AMENDED_CLAIM_1}}", "") or mapping.get("{{CLAIM1_FEATURES}}", ""),
         d1d2_text=mapping.get("{{D1D2_DISCLOSURE}}", ""),
     )
     insert_prior_art_analysis_before_feature_table(
         doc,
+        feature_table,
         analysis_text=mapping.get("__PRIOR_ARTS_ABSTRACTS_AND_DIFF__", ""),
         diagram_images=mapping.get("__PRIOR_ART_DIAGRAM_IMAGES__", []),
         analysis_sequence=mapping.get("__PRIOR_ART_SEQUENCE__", []),
     )
-    _replace_block_placeholder_with_paragraphs(
-        doc,
-        placeholder="{{FORMAL_OBJECTIONS_REPLY}}",
-        value=mapping.get("{{FORMAL_OBJECTIONS_REPLY}}", ""),
-    )
-    _replace_block_placeholder_with_paragraphs(
-        doc,
-        placeholder="{{TECH_EFFECT}}",
-        value=mapping.get("{{TECH_EFFECT}}", ""),
-    )
-    _replace_block_placeholder_with_paragraphs(
-        doc,
-        placeholder="{{AMENDED_CLAIM_n}}",
-        value=mapping.get("{{AMENDED_CLAIM_n}}", ""),
-    )
+    # One walk locates all three block placeholders; walk again only if a rewrite may have moved one.
+    block_placeholders = ("{{FORMAL_OBJECTIONS_REPLY}}", "{{TECH_EFFECT}}", "{{AMENDED_CLAIM_n}}")
+    block_paragraphs: Optional[Dict[str, Paragraph]] = _first_paragraphs_with(doc, block_placeholders)
+    for placeholder in block_placeholders:
+        value = mapping.get(placeholder, "")
+        if block_paragraphs is None:
+            moved = _replace_block_placeholder_with_paragraphs(doc, placeholder, value)
+        elif placeholder in block_paragraphs:
+            moved = _replace_block_placeholder_with_paragraphs(doc, placeholder, value, block_paragraphs[placeholder])
+        else:
+            continue
+        if moved:
+            block_paragraphs = None
 
-    for p in _iter_paragraphs_in_doc(doc):
-        _replace_runs_in_paragraph(p, mapping)
+    # Run replacement and styling only rewrite runs, so one paragraph snapshot serves all three passes.
+    paragraphs = list(_iter_paragraphs_in_doc(doc))
+    placeholder_re = _placeholder_pattern(mapping)
+    if placeholder_re is not None:
+        for p in paragraphs:
+            _replace_runs_in_paragraph(p, placeholder_re, mapping)
 
-    _style_reply_by_drafter_marker(doc)
-    _style_headings_and_side_headings(doc)
+    _style_headings_and_side_headings(paragraphs)
 
     # Remove empty claim sections for claims that don't exist
     max_claim = mapping.get("__CLAIM_MAX__", 10)
@@ -464,31 +566,23 @@ def insert_tech_solution_images(doc: Document, image_paths: list, heading_text:
 
     pb = doc.add_paragraph()
     pb.add_run().add_break(WD_BREAK.PAGE)
-    new_paras.append(pb)
+    new_paras.append(pb._p)
 
     fig_no = start_fig_no
     for img in image_paths:
         img_p = doc.add_paragraph()
         img_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         img_p.add_run().add_picture(str(img), width=Inches(5.8))
-        new_paras.append(img_p)
-
-        cap_p = doc.add_paragraph()
-        cap_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        cap_p.add_run(f"FIG. {fig_no}")
-        new_paras.append(cap_p)
-
-        reply_p = doc.add_paragraph()
-        reply_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        reply_run = reply_p.add_run("[Enter Description of the diagram]")
-        reply_run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
-        new_paras.append(reply_p)
+        new_paras.append(img_p._p)
+
+        new_paras.append(_centered_paragraph_element(f"FIG. {fig_no}"))
+        new_paras.append(_centered_paragraph_element(_DIAGRAM_REPLY_TEXT, red=True))
         fig_no += 1
 
     anchor = heading_p._p
-    for np in new_paras:
-        anchor.addnext(np._p)
-        anchor = np._p
+    for el in new_paras:
+        anchor.addnext(el)
+        anchor = el
 
 
 def _insert_images_with_captions(doc: Document, placeholder: str, image_paths: list, start_fig_no: int = 1):
@@ -501,9 +595,6 @@ def _insert_images_with_captions(doc: Document, placeholder: str, image_paths: l
     if not image_paths:
         return
 
-    from docx.oxml import OxmlElement
-    from docx.text.paragraph import Paragraph
-
     for p in doc.paragraphs:
         if placeholder in p.text:
             # clear placeholder text
@@ -517,31 +608,24 @@ def _insert_images_with_captions(doc: Document, placeholder: str, image_paths: l
             anchor = p
             fig_no = start_fig_no
 
-            def insert_paragraph_after(anchor_paragraph):
-                new_p = OxmlElement("w:p")
-                anchor_paragraph._p.addnext(new_p)
-                return Paragraph(new_p, anchor_paragraph._parent)
-
             for img_path in image_paths:
                 # image paragraph
-                img_p = insert_paragraph_after(anchor)
-                img_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                img_el = _centered_paragraph_element()
+                anchor._p.addnext(img_el)
+                img_p = Paragraph(img_el, anchor._parent)
                 run = img_p.add_run()
                 run.add_picture(str(img_path), width=Inches(5.8))
 
                 # caption paragraph
-                cap_p = insert_paragraph_after(img_p)
-                cap_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                cap_p.add_run(f"FIG. {fig_no}")
+                cap_el = _centered_paragraph_element(f"FIG. {fig_no}")
+                img_el.addnext(cap_el)
                 fig_no += 1
                 
                 # drafter reply marker just after each diagram block
-                reply_p = insert_paragraph_after(cap_p)
-                reply_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                reply_run = reply_p.add_run("[Enter Description of the diagram]")
-                reply_run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+                reply_el = _centered_paragraph_element(_DIAGRAM_REPLY_TEXT, red=True)
+                cap_el.addnext(reply_el)
 
-                anchor = reply_p  # continue inserting after marker
+                anchor = Paragraph(reply_el, anchor._parent)  # continue inserting after marker
 
             return
 